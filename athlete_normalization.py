@@ -0,0 +1,267 @@
+import collections
+import json
+import pathlib
+
+import athlete_suggestions
+import bracket_util
+import club_util
+import name_normalization
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_TOT_SORT_INDEX = 1
+_BANTAM_SORT_INDEX = 2
+_INTERMEDIATE_SORT_INDEX = 3
+_NOVICE_SORT_INDEX = 4
+_SENIOR_SORT_INDEX = 5
+_DRAFT_FILE = _HERE / "_parsed-data" / "custom-normalized-athlete-names.draft.json"
+
+_AthleteLookup = dict[str, dict[str, club_util.Athlete]]
+
+
+def _prepare_athlete_lookup(
+    rosters: list[club_util.ClubInfo],
+) -> _AthleteLookup:
+    roster_map: _AthleteLookup = {}
+    for roster in rosters:
+        athlete_map: dict[str, club_util.Athlete] = {}
+        for athlete in roster.athletes:
+            normalized_name = name_normalization.normalize_athlete_name(athlete.name)
+            if normalized_name in athlete_map:
+                raise RuntimeError(
+                    "Unexpected duplicate",
+                    normalized_name,
+                    athlete,
+                    athlete_map[normalized_name],
+                )
+
+            athlete_map[normalized_name] = athlete
+
+        if roster.club_name in roster_map:
+            raise RuntimeError("Unexpected duplicate", roster.club_name)
+
+        roster_map[roster.club_name] = athlete_map
+
+    return roster_map
+
+
+_CustomAthleteNameMap = dict[str, dict[str, str | None]]
+# NOTE: Counts of `(team_normalized, name_normalized)` missing from both the
+#       rosters and the custom athlete name map.
+Unmatched = collections.Counter[tuple[str, str]]
+
+
+def _lookup_athlete(
+    name: str,
+    team_normalized: str,
+    athlete_lookup: _AthleteLookup,
+    custom_athlete_name_map: _CustomAthleteNameMap,
+    unmatched: Unmatched | None,
+) -> tuple[str, club_util.Athlete | None]:
+    athlete_map = athlete_lookup.get(team_normalized)
+    if athlete_map is None:
+        return team_normalized, None
+
+    name_normalized = name_normalization.normalize_athlete_name(name)
+    matched = athlete_map.get(name_normalized)
+    if matched is not None:
+        return team_normalized, matched
+
+    by_team = custom_athlete_name_map.get(team_normalized, {})
+    if name_normalized not in by_team and unmatched is not None:
+        unmatched[(team_normalized, name_normalized)] += 1
+        return team_normalized, None
+
+    if name_normalized not in by_team:
+        raise ValueError(
+            "All unmatched athletes should be present in custom athlete name map",
+            name,
+            name_normalized,
+            team_normalized,
+        )
+
+    new_name_normalized = by_team[name_normalized]
+    if new_name_normalized is None:
+        # TODO: Do not allow this branch at all (i.e. fill in all of the missing
+        #       mappings)
+        return team_normalized, None
+
+    if "::" in new_name_normalized:
+        transfer_team, transfer_name = new_name_normalized.split("::")
+        return transfer_team, athlete_lookup[transfer_team][transfer_name]
+
+    matched = athlete_map.get(new_name_normalized)
+    if matched is None:
+        raise RuntimeError(
+            "Unexpected failure to match custom name",
+            name,
+            name_normalized,
+            new_name_normalized,
+            team_normalized,
+        )
+
+    return team_normalized, matched
+
+
+def _athlete_to_tuple(
+    athlete: club_util.Athlete | None,
+) -> tuple[str, str, int] | tuple[None, None, None]:
+    if athlete is None:
+        return None, None, None
+
+    return athlete.name, athlete.usaw_number, athlete.ikwf_age
+
+
+def _map_age_for_sort(ikwf_age: int) -> int:
+    if ikwf_age <= 6:
+        return _TOT_SORT_INDEX
+
+    if ikwf_age <= 8:
+        return _BANTAM_SORT_INDEX
+
+    if ikwf_age <= 10:
+        return _INTERMEDIATE_SORT_INDEX
+
+    if ikwf_age <= 12:
+        return _NOVICE_SORT_INDEX
+
+    if ikwf_age <= 14:
+        return _SENIOR_SORT_INDEX
+
+    if ikwf_age == 15:
+        return _SENIOR_SORT_INDEX
+
+    raise RuntimeError("Unsupported IKWF age", ikwf_age)
+
+
+def _map_division_for_sort(division: bracket_util.Division) -> int:
+    if division in ("tot", "girls_tot"):
+        return _TOT_SORT_INDEX
+
+    if division in ("bantam", "girls_bantam"):
+        return _BANTAM_SORT_INDEX
+
+    if division in ("intermediate", "girls_intermediate"):
+        return _INTERMEDIATE_SORT_INDEX
+
+    if division in ("novice", "girls_novice"):
+        return _NOVICE_SORT_INDEX
+
+    if division in ("senior", "girls_senior"):
+        return _SENIOR_SORT_INDEX
+
+    raise RuntimeError("Unsuppored division", division)
+
+
+def _check_age(
+    division: bracket_util.Division | None,
+    usaw_number: str | None,
+    ikwf_age: int | None,
+) -> None:
+    if ikwf_age is None or division is None:
+        return
+
+    age_sort = _map_age_for_sort(ikwf_age)
+    division_sort = _map_division_for_sort(division)
+    if age_sort > division_sort:
+        # raise ValueError("Invalid division for age", usaw_number, division, ikwf_age)
+        print(ValueError("Invalid division for age", usaw_number, division, ikwf_age))
+
+
+def normalize_matches(
+    matches_v2: list[bracket_util.MatchV2], *, unmatched: Unmatched | None = None
+) -> list[bracket_util.MatchV3]:
+    """Add roster athletes to matches.
+
+    If `unmatched` is given, athletes missing from the custom athlete name
+    map are counted there (and left unmatched) instead of raising.
+    """
+    rosters = club_util.load_rosters()
+    athlete_lookup = _prepare_athlete_lookup(rosters)
+
+    custom_athlete_name_map = club_util.load_custom_athlete_name_map()
+
+    matches_v3: list[bracket_util.MatchV3] = []
+    for match_ in matches_v2:
+        winner_team_normalized, winner_athlete = _lookup_athlete(
+            match_.winner,
+            match_.winner_team_normalized,
+            athlete_lookup,
+            custom_athlete_name_map,
+            unmatched,
+        )
+        winner_normalized, winner_usaw_number, winner_ikwf_age = _athlete_to_tuple(
+            winner_athlete
+        )
+        loser_team_normalized, loser_athlete = _lookup_athlete(
+            match_.loser,
+            match_.loser_team_normalized,
+            athlete_lookup,
+            custom_athlete_name_map,
+            unmatched,
+        )
+        loser_normalized, loser_usaw_number, loser_ikwf_age = _athlete_to_tuple(
+            loser_athlete
+        )
+
+        _check_age(match_.division, winner_usaw_number, winner_ikwf_age)
+        _check_age(match_.division, loser_usaw_number, loser_ikwf_age)
+
+        matches_v3.append(
+            bracket_util.MatchV3.from_v2(
+                match_,
+                winner_team_normalized,
+                winner_normalized,
+                winner_usaw_number,
+                winner_ikwf_age,
+                loser_team_normalized,
+                loser_normalized,
+                loser_usaw_number,
+                loser_ikwf_age,
+            )
+        )
+
+    return matches_v3
+
+
+def write_suggestions(unmatched: Unmatched) -> None:
+    rosters = club_util.load_rosters()
+    athlete_lookup = _prepare_athlete_lookup(rosters)
+    index = athlete_suggestions.SuggestionIndex(athlete_lookup)
+
+    # NOTE: `null` in the custom map means "leave unmatched", so athletes with
+    #       no close candidate are left out of the draft rather than merged in
+    #       as `null` by accident.
+    draft: dict[str, dict[str, str]] = {}
+    unresolved: list[tuple[str, str]] = []
+    for team_normalized, name_normalized in sorted(unmatched):
+        count = unmatched[(team_normalized, name_normalized)]
+        print(f"{team_normalized}: {name_normalized!r} ({count} matches)")
+        candidates = index.suggest(team_normalized, name_normalized)
+        for candidate in candidates:
+            value = candidate.mapped_value(team_normalized)
+            print(f"  {candidate.score:.3f}  {value}")
+
+        if candidates and candidates[0].score >= athlete_suggestions.DRAFT_THRESHOLD:
+            suggested = candidates[0].mapped_value(team_normalized)
+            draft.setdefault(team_normalized, {})[name_normalized] = suggested
+        else:
+            unresolved.append((team_normalized, name_normalized))
+
+    with open(_DRAFT_FILE, "w") as file_obj:
+        json.dump(draft, file_obj, indent=4, sort_keys=True)
+        file_obj.write("\n")
+
+    print(
+        f"Wrote {len(unmatched) - len(unresolved)} unmatched athletes to "
+        f"{_DRAFT_FILE.name}, review and merge into "
+        "custom-normalized-athlete-names.json"
+    )
+    if unresolved:
+        print(f"{len(unresolved)} athletes have no close candidate (not in the draft):")
+        for team_normalized, name_normalized in unresolved:
+            print(f"  {team_normalized}: {name_normalized!r}")
+
+
+# TODO: There are some athletes like `Ellie Treuthardt` that are from the
+#       WI branch of a given club, need special way to map the normalized team
+#       name for these.
@@ -0,0 +1,130 @@
+import collections
+from collections.abc import Mapping
+
+import pydantic
+
+import club_util
+
+_TOP_N = 5
+_TRIGRAM_WEIGHT = 0.7
+_PHONETIC_WEIGHT = 0.3
+# NOTE: Most misses are typos within a club, so a candidate on another club
+#       (a transfer) has to be a somewhat better match to rank first.
+_TRANSFER_PENALTY = 0.1
+DRAFT_THRESHOLD = 0.6
+_SOUNDEX_DIGITS: dict[str, str] = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class Candidate(_ForbidExtra):
+    team: str
+    name: str
+    score: float
+
+    def mapped_value(self, team_normalized: str) -> str:
+        """The value for the custom athlete name map, for an athlete on
+        `team_normalized` (a transfer uses the `team::name` format).
+        """
+        if self.team == team_normalized:
+            return self.name
+
+        return f"{self.team}::{self.name}"
+
+
+def _trigrams(name: str) -> frozenset[str]:
+    padded = f"  {name} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _phonetic_key(token: str) -> str:
+    """A Soundex variant that also codes the first letter, so that e.g.
+    `kayden` and `caden` share a key.
+    """
+    result: list[str] = []
+    previous = ""
+    for letter in token:
+        digit = _SOUNDEX_DIGITS.get(letter, "")
+        if not result:
+            result.append(digit or letter)
+        elif digit != "" and digit != previous:
+            result.append(digit)
+        if letter not in "hw":
+            previous = digit
+
+    return "".join(result[:4])
+
+
+def _phonetic_keys(name: str) -> tuple[str, str]:
+    """The keys of the first and last tokens of `name`."""
+    tokens = name.split()
+    if not tokens:
+        return "", ""
+
+    return _phonetic_key(tokens[0]), _phonetic_key(tokens[-1])
+
+
+class SuggestionIndex:
+    """Character trigram and phonetic index over every roster athlete."""
+
+    def __init__(
+        self, athlete_lookup: Mapping[str, Mapping[str, club_util.Athlete]]
+    ) -> None:
+        self._entries: list[tuple[str, str]] = []
+        self._trigrams: list[frozenset[str]] = []
+        self._phonetic: list[tuple[str, str]] = []
+        self._by_trigram: dict[str, list[int]] = collections.defaultdict(list)
+        self._by_last_key: dict[str, list[int]] = collections.defaultdict(list)
+
+        for team, athlete_map in athlete_lookup.items():
+            for name_normalized in athlete_map:
+                i = len(self._entries)
+                trigrams = _trigrams(name_normalized)
+                phonetic = _phonetic_keys(name_normalized)
+                self._entries.append((team, name_normalized))
+                self._trigrams.append(trigrams)
+                self._phonetic.append(phonetic)
+                for trigram in trigrams:
+                    self._by_trigram[trigram].append(i)
+                self._by_last_key[phonetic[1]].append(i)
+
+    def suggest(self, team_normalized: str, name_normalized: str) -> list[Candidate]:
+        """Rank roster athletes as candidates for an unmatched athlete."""
+        trigrams = _trigrams(name_normalized)
+        first_key, last_key = _phonetic_keys(name_normalized)
+
+        shared: collections.Counter[int] = collections.Counter()
+        for trigram in trigrams:
+            shared.update(self._by_trigram.get(trigram, ()))
+        # NOTE: Include same-sounding last names with no trigrams in common.
+        for i in self._by_last_key.get(last_key, ()):
+            shared[i] += 0
+
+        scored: list[tuple[float, str, str]] = []
+        for i, shared_count in shared.items():
+            dice = 2 * shared_count / (len(trigrams) + len(self._trigrams[i]))
+            entry_first_key, entry_last_key = self._phonetic[i]
+            phonetic = (
+                (entry_first_key == first_key) + (entry_last_key == last_key)
+            ) / 2
+            score = _TRIGRAM_WEIGHT * dice + _PHONETIC_WEIGHT * phonetic
+
+            team, name = self._entries[i]
+            if team != team_normalized:
+                score -= _TRANSFER_PENALTY
+            scored.append((-score, team, name))
+
+        scored.sort()
+        return [
+            Candidate(team=team, name=name, score=-negative_score)
+            for negative_score, team, name in scored[:_TOP_N]
+        ]
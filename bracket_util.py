@@ -1,4 +1,5 @@
 import datetime
+import functools
 import re
 from typing import Literal
 
@@ -163,6 +164,73 @@ class MatchesV1(pydantic.RootModel[list[MatchV1]]):
     pass
 
 
+_TRUSTED_SLOTS = (
+    "__dict__",
+    "__pydantic_fields_set__",
+    "__pydantic_extra__",
+    "__pydantic_private__",
+)
+
+
+def construct_trusted[T: pydantic.BaseModel](
+    cls: type[T], data: dict[str, object]
+) -> T:
+    """Build a model from already validated field values, without validation.
+
+    This is what `model_construct()` does when every field is given (i.e. no
+    defaults or aliases to resolve), e.g. in `from_v*()`. It is ~5x
+    faster than validating, while `model_construct()` itself is slower than
+    validating because it resolves each field in Python.
+
+    The `from_v*()` constructors can skip validation: `inherit` was already
+    validated (when parsed or loaded from CSV) and the added fields come from
+    validated models (rosters, weights). Validation happens when matches are
+    read back from the `all-matches-*.csv` files.
+
+    This sets pydantic's internal slots directly, so `pydantic` is pinned to a
+    minor version in `pyproject.toml`; `check_construct_trusted()` compares it
+    with `model_construct()` before the pin is bumped.
+    """
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", data)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def check_construct_trusted() -> None:
+    """Fail loudly if a pydantic upgrade changed the internals that
+    `construct_trusted()` relies on.
+    """
+    slots = pydantic.BaseModel.__slots__
+    if tuple(sorted(slots)) != tuple(sorted(_TRUSTED_SLOTS)):
+        raise RuntimeError("Unexpected pydantic.BaseModel slots", slots)
+
+    data: dict[str, object] = {
+        "event_name": "Event",
+        "event_date": datetime.date(2026, 1, 1),
+        "bracket": "Bracket",
+        "round_": "Round",
+        "division": None,
+        "winner": "Winner",
+        "winner_team": "Winner Team",
+        "loser": "Loser",
+        "loser_team": "Loser Team",
+        "result": "Result",
+        "result_type": "decision",
+        "source": "trackwrestling",
+    }
+    expected = MatchV1.model_construct(**data)
+    actual = construct_trusted(MatchV1, data.copy())
+    for slot in _TRUSTED_SLOTS:
+        if getattr(actual, slot) != getattr(expected, slot):
+            raise RuntimeError("construct_trusted() does not match pydantic", slot)
+
+    if actual != expected or actual.model_dump() != expected.model_dump():
+        raise RuntimeError("construct_trusted() does not match pydantic")
+
+
 class MatchV2(MatchV1):
     winner_team_normalized: str = pydantic.Field(alias="Winner Team (normalized)")
     loser_team_normalized: str = pydantic.Field(alias="Loser Team (normalized)")
@@ -171,10 +239,10 @@ class MatchV2(MatchV1):
     def from_v1(
         cls, inherit: MatchV1, winner_team_normalized: str, loser_team_normalized: str
     ) -> MatchV2:
-        data = inherit.model_dump(mode="json")
+        data = inherit.__dict__.copy()
         data["winner_team_normalized"] = winner_team_normalized
         data["loser_team_normalized"] = loser_team_normalized
-        return cls(**data)
+        return construct_trusted(cls, data)
 
 
 class MatchesV2(pydantic.RootModel[list[MatchV2]]):
@@ -202,7 +270,7 @@ class MatchV3(MatchV2):
         loser_usaw_number: str | None,
         loser_ikwf_age: int | None,
     ) -> MatchV3:
-        data = inherit.model_dump(mode="json")
+        data = inherit.__dict__.copy()
 
         data["winner_team_normalized"] = winner_team_normalized
         data["winner_normalized"] = winner_normalized
@@ -214,7 +282,7 @@ class MatchV3(MatchV2):
         data["loser_usaw_number"] = loser_usaw_number
         data["loser_ikwf_age"] = loser_ikwf_age
 
-        return cls(**data)
+        return construct_trusted(cls, data)
 
 
 class MatchesV3(pydantic.RootModel[list[MatchV3]]):
@@ -229,231 +297,177 @@ class MatchV4(MatchV3):
     def from_v3(
         cls, inherit: MatchV3, winner_weight: float | None, loser_weight: float | None
     ) -> MatchV4:
-        data = inherit.model_dump(mode="json")
+        data = inherit.__dict__.copy()
         data["winner_weight"] = winner_weight
         data["loser_weight"] = loser_weight
-        return cls(**data)
+        return construct_trusted(cls, data)
 
 
 class MatchesV4(pydantic.RootModel[list[MatchV4]]):
     pass
 
 
-def classify_bracket(name: str, event_name: str) -> Division | None:
+# NOTE: Prefixes of the lowercased bracket name, in priority order: the first
+#       prefix that matches wins (e.g. `"elite 10u "` must come before
+#       `"elite "`).
+_BRACKET_PREFIXES: tuple[tuple[str, Division], ...] = (
+    ("girls tot ", "girls_tot"),
+    ("girls tots ", "girls_tot"),
+    ("girls - tot ", "girls_tot"),
+    ("girls bantam ", "girls_bantam"),
+    ("girls 8u ", "girls_bantam"),
+    ("girls - bantam ", "girls_bantam"),
+    ("girls - bantams ", "girls_bantam"),
+    ("rookie girls bantam ", "girls_bantam"),
+    ("girls(6 -8) ", "girls_bantam"),
+    ("girls (6 - 8) ", "girls_bantam"),
+    ("girls` bantam ", "girls_bantam"),
+    ("girls intermediate ", "girls_intermediate"),
+    ("girls - intermediate ", "girls_intermediate"),
+    ("girls - intermediates ", "girls_intermediate"),
+    ("rookie girls intermediate ", "girls_intermediate"),
+    ("girls 10u ", "girls_intermediate"),
+    ("girls` intermediate ", "girls_intermediate"),
+    ("girls novice ", "girls_novice"),
+    ("girls - novice ", "girls_novice"),
+    ("rookie girls novice ", "girls_novice"),
+    ("girls 12u ", "girls_novice"),
+    ("girls` novice ", "girls_novice"),
+    ("girls senior ", "girls_senior"),
+    ("girls seniors ", "girls_senior"),
+    ("girls - seniors ", "girls_senior"),
+    ("girls - senior ", "girls_senior"),
+    ("girls (12 - 14) ", "girls_senior"),
+    ("elite girls ", "girls_senior"),
+    ("girls 14u ", "girls_senior"),
+    ("girls` senior ", "girls_senior"),
+    ("tot ", "tot"),
+    ("tot:", "tot"),
+    ("open (tot) ", "tot"),
+    ("tots ", "tot"),
+    ("boys - tots ", "tot"),
+    ("tots(", "tot"),
+    ("6u ", "tot"),
+    ("5&6 ", "tot"),
+    ("6&u ", "tot"),
+    ("beginner bantam ", "bantam"),
+    ("bantam ", "bantam"),
+    ("bantams ", "bantam"),
+    ("bantam-", "bantam"),
+    ("bantam: ", "bantam"),
+    ("boys bantam ", "bantam"),
+    ("boys - bantam ", "bantam"),
+    ("boys - bantams ", "bantam"),
+    ("rookie bantam ", "bantam"),
+    ("rookie boys bantam ", "bantam"),
+    ("open (bantam) ", "bantam"),
+    ("bantam(6,7,8) ", "bantam"),
+    ("8u ", "bantam"),
+    ("7&8 ", "bantam"),
+    ("bantam(", "bantam"),
+    ("beginner intermediate ", "intermediate"),
+    ("intermediate ", "intermediate"),
+    ("intermediate-", "intermediate"),
+    ("intermediate(", "intermediate"),
+    ("intermediate:", "intermediate"),
+    ("boys intermediate ", "intermediate"),
+    ("boys - intermediate ", "intermediate"),
+    ("boys - intermediates ", "intermediate"),
+    ("rookie intermediate ", "intermediate"),
+    ("rookie boys intermediate ", "intermediate"),
+    ("rookie boys intermeidate ", "intermediate"),
+    ("open (intermediate) ", "intermediate"),
+    ("10u ", "intermediate"),
+    ("elite 10u ", "intermediate"),
+    ("9&10 ", "intermediate"),
+    ("intermediates ", "intermediate"),
+    ("novice ", "novice"),
+    ("novice(", "novice"),
+    ("novice-", "novice"),
+    ("novice:", "novice"),
+    ("boys novice ", "novice"),
+    ("boys - novice ", "novice"),
+    ("rookie boys novice ", "novice"),
+    ("open (novice) ", "novice"),
+    ("12u ", "novice"),
+    ("11&12 ", "novice"),
+    ("senior ", "senior"),
+    ("senior-", "senior"),
+    ("senior(", "senior"),
+    ("senior:", "senior"),
+    ("seniors ", "senior"),
+    ("boys senior ", "senior"),
+    ("boys - senior ", "senior"),
+    ("rookie boys senior ", "senior"),
+    ("open (senior) ", "senior"),
+    ("boys - nov & sen ", "senior"),
+    ("boys - seniors ", "senior"),
+    ("14u ", "senior"),
+    ("13&14 ", "senior"),
+    ("elite ", "senior"),
+)
+# NOTE: All brackets at these events belong to one division.
+_EVENT_DIVISIONS: dict[str, Division] = {"Tots Bash": "tot"}
+# NOTE: Event-specific prefixes, checked before `_BRACKET_PREFIXES`.
+_EVENT_BRACKET_PREFIXES: dict[str, tuple[tuple[str, Division], ...]] = {
+    "Joe Tholl Sr. ELITE/OPEN 2025": (("open ", "senior"),),
+}
+NO_BRACKET_RULE = "(no match)"
+
+
+def _compile_prefixes(prefixes: tuple[tuple[str, Division], ...]) -> re.Pattern[str]:
+    """Compile prefixes into one anchored alternation, one group per prefix.
+
+    Alternatives are tried in order, so `match.lastindex` is the (1-based) index
+    of the first matching prefix, the same as checking them one at a time.
+    """
+    return re.compile("|".join(f"({re.escape(prefix)})" for prefix, _ in prefixes))
+
+
+_BRACKET_PREFIXES_RE = _compile_prefixes(_BRACKET_PREFIXES)
+_EVENT_BRACKET_PREFIXES_RE = {
+    event_name: _compile_prefixes(prefixes)
+    for event_name, prefixes in _EVENT_BRACKET_PREFIXES.items()
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_bracket_rule(name: str, event_name: str) -> tuple[str, Division | None]:
+    """Classify a bracket and describe the rule that decided the division."""
+    if event_name in _EVENT_DIVISIONS:
+        return f"event {event_name!r}", _EVENT_DIVISIONS[event_name]
+
     name_normalized = name.lower()
 
-    if event_name == "Tots Bash":
-        return "tot"
-
-    if (
-        name_normalized.startswith("open ")
-        and event_name == "Joe Tholl Sr. ELITE/OPEN 2025"
-    ):
-        return "senior"
-
-    if name_normalized.startswith("girls tot "):
-        return "girls_tot"
-    if name_normalized.startswith("girls tots "):
-        return "girls_tot"
-    if name_normalized.startswith("girls - tot "):
-        return "girls_tot"
-
-    if name_normalized.startswith("girls bantam "):
-        return "girls_bantam"
-    if name_normalized.startswith("girls 8u "):
-        return "girls_bantam"
-    if name_normalized.startswith("girls - bantam "):
-        return "girls_bantam"
-    if name_normalized.startswith("girls - bantams "):
-        return "girls_bantam"
-    if name_normalized.startswith("rookie girls bantam "):
-        return "girls_bantam"
-    if name_normalized.startswith("girls(6 -8) "):
-        return "girls_bantam"
-    if name_normalized.startswith("girls (6 - 8) "):
-        return "girls_bantam"
-    if name_normalized.startswith("girls` bantam "):
-        return "girls_bantam"
-
-    if name_normalized.startswith("girls intermediate "):
-        return "girls_intermediate"
-    if name_normalized.startswith("girls - intermediate "):
-        return "girls_intermediate"
-    if name_normalized.startswith("girls - intermediates "):
-        return "girls_intermediate"
-    if name_normalized.startswith("rookie girls intermediate "):
-        return "girls_intermediate"
-    if name_normalized.startswith("girls 10u "):
-        return "girls_intermediate"
-    if name_normalized.startswith("girls` intermediate "):
-        return "girls_intermediate"
-
-    if name_normalized.startswith("girls novice "):
-        return "girls_novice"
-    if name_normalized.startswith("girls - novice "):
-        return "girls_novice"
-    if name_normalized.startswith("rookie girls novice "):
-        return "girls_novice"
-    if name_normalized.startswith("girls 12u "):
-        return "girls_novice"
-    if name_normalized.startswith("girls` novice "):
-        return "girls_novice"
-
-    if name_normalized.startswith("girls senior "):
-        return "girls_senior"
-    if name_normalized.startswith("girls seniors "):
-        return "girls_senior"
-    if name_normalized.startswith("girls - seniors "):
-        return "girls_senior"
-    if name_normalized.startswith("girls - senior "):
-        return "girls_senior"
-    if name_normalized.startswith("girls (12 - 14) "):
-        return "girls_senior"
-    if name_normalized.startswith("elite girls "):
-        return "girls_senior"
-    if name_normalized.startswith("girls 14u "):
-        return "girls_senior"
-    if name_normalized.startswith("girls` senior "):
-        return "girls_senior"
-
-    ############################################################################
-
-    if name_normalized.startswith("tot "):
-        return "tot"
-    if name_normalized.startswith("tot "):
-        return "tot"
-    if name_normalized.startswith("tot:"):
-        return "tot"
-    if name_normalized.startswith("open (tot) "):
-        return "tot"
-    if name_normalized.startswith("tots "):
-        return "tot"
-    if name_normalized.startswith("boys - tots "):
-        return "tot"
-    if name_normalized.startswith("tots("):
-        return "tot"
-    if name_normalized.startswith("6u "):
-        return "tot"
-    if name_normalized.startswith("5&6 "):
-        return "tot"
-    if name_normalized.startswith("6&u "):
-        return "tot"
-
-    if name_normalized.startswith("beginner bantam "):
-        return "bantam"
-    if name_normalized.startswith("bantam "):
-        return "bantam"
-    if name_normalized.startswith("bantams "):
-        return "bantam"
-    if name_normalized.startswith("bantam-"):
-        return "bantam"
-    if name_normalized.startswith("bantam: "):
-        return "bantam"
-    if name_normalized.startswith("boys bantam "):
-        return "bantam"
-    if name_normalized.startswith("boys - bantam "):
-        return "bantam"
-    if name_normalized.startswith("boys - bantams "):
-        return "bantam"
-    if name_normalized.startswith("rookie bantam "):
-        return "bantam"
-    if name_normalized.startswith("rookie boys bantam "):
-        return "bantam"
-    if name_normalized.startswith("open (bantam) "):
-        return "bantam"
-    if name_normalized.startswith("bantam(6,7,8) "):
-        return "bantam"
-    if name_normalized.startswith("8u "):
-        return "bantam"
-    if name_normalized.startswith("7&8 "):
-        return "bantam"
-    if name_normalized.startswith("bantam("):
-        return "bantam"
-
-    if name_normalized.startswith("beginner intermediate "):
-        return "intermediate"
-    if name_normalized.startswith("intermediate "):
-        return "intermediate"
-    if name_normalized.startswith("intermediate-"):
-        return "intermediate"
-    if name_normalized.startswith("intermediate("):
-        return "intermediate"
-    if name_normalized.startswith("intermediate:"):
-        return "intermediate"
-    if name_normalized.startswith("boys intermediate "):
-        return "intermediate"
-    if name_normalized.startswith("boys - intermediate "):
-        return "intermediate"
-    if name_normalized.startswith("boys - intermediates "):
-        return "intermediate"
-    if name_normalized.startswith("rookie intermediate "):
-        return "intermediate"
-    if name_normalized.startswith("rookie boys intermediate "):
-        return "intermediate"
-    if name_normalized.startswith("rookie boys intermeidate "):
-        return "intermediate"
-    if name_normalized.startswith("open (intermediate) "):
-        return "intermediate"
-    if name_normalized.startswith("10u "):
-        return "intermediate"
-    if name_normalized.startswith("elite 10u "):
-        return "intermediate"
-    if name_normalized.startswith("9&10 "):
-        return "intermediate"
-    if name_normalized.startswith("intermediates "):
-        return "intermediate"
-
-    if name_normalized.startswith("novice "):
-        return "novice"
-    if name_normalized.startswith("novice("):
-        return "novice"
-    if name_normalized.startswith("novice-"):
-        return "novice"
-    if name_normalized.startswith("novice:"):
-        return "novice"
-    if name_normalized.startswith("boys novice "):
-        return "novice"
-    if name_normalized.startswith("boys - novice "):
-        return "novice"
-    if name_normalized.startswith("rookie boys novice "):
-        return "novice"
-    if name_normalized.startswith("open (novice) "):
-        return "novice"
-    if name_normalized.startswith("12u "):
-        return "novice"
-    if name_normalized.startswith("11&12 "):
-        return "novice"
-
-    if name_normalized.startswith("senior "):
-        return "senior"
-    if name_normalized.startswith("senior-"):
-        return "senior"
-    if name_normalized.startswith("senior("):
-        return "senior"
-    if name_normalized.startswith("senior:"):
-        return "senior"
-    if name_normalized.startswith("seniors "):
-        return "senior"
-    if name_normalized.startswith("boys senior "):
-        return "senior"
-    if name_normalized.startswith("boys - senior "):
-        return "senior"
-    if name_normalized.startswith("rookie boys senior "):
-        return "senior"
-    if name_normalized.startswith("open (senior) "):
-        return "senior"
-    if name_normalized.startswith("boys - nov & sen "):
-        return "senior"
-    if name_normalized.startswith("boys - seniors "):
-        return "senior"
-    if name_normalized.startswith("14u "):
-        return "senior"
-    if name_normalized.startswith("13&14 "):
-        return "senior"
-    if name_normalized.startswith("elite "):
-        return "senior"
-
-    return None
+    event_prefixes = _EVENT_BRACKET_PREFIXES.get(event_name)
+    if event_prefixes is not None:
+        match = _EVENT_BRACKET_PREFIXES_RE[event_name].match(name_normalized)
+        if match is not None and match.lastindex is not None:
+            prefix, division = event_prefixes[match.lastindex - 1]
+            return f"event {event_name!r} prefix {prefix!r}", division
+
+    match = _BRACKET_PREFIXES_RE.match(name_normalized)
+    if match is None or match.lastindex is None:
+        return NO_BRACKET_RULE, None
+
+    prefix, division = _BRACKET_PREFIXES[match.lastindex - 1]
+    return f"prefix {prefix!r}", division
+
+
+def classify_bracket(name: str, event_name: str) -> Division | None:
+    _, division = classify_bracket_rule(name, event_name)
+    return division
+
+
+def bracket_rules() -> list[str]:
+    """All rules `classify_bracket_rule()` can report (other than no match)."""
+    rules = [f"event {event_name!r}" for event_name in _EVENT_DIVISIONS]
+    for event_name, prefixes in _EVENT_BRACKET_PREFIXES.items():
+        rules.extend(
+            f"event {event_name!r} prefix {prefix!r}" for prefix, _ in prefixes
+        )
+    rules.extend(f"prefix {prefix!r}" for prefix, _ in _BRACKET_PREFIXES)
+    return rules
 
 
 AthleteWeightKey = tuple[str, str, str]
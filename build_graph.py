@@ -0,0 +1,414 @@
+import ast
+import concurrent.futures
+import hashlib
+import pathlib
+import subprocess
+import sys
+import time
+
+import pydantic
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_STATE_PATH = _HERE / ".build-state.json"
+_RAW_EVENTS = "_raw-data/[0-9]*/*.json"
+_ROSTERS = "_parsed-data/rosters.json"
+_STATE_QUALIFIERS_2025 = "_parsed-data/2026-rostered-state-qualifiers.json"
+_MATCHES_V4 = "_parsed-data/all-matches-04.csv"
+_MATCHES_DB = "_parsed-data/matches.sqlite"
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class Stage(_ForbidExtra):
+    """An entrypoint, the files it reads and the files it writes.
+
+    Inputs are paths or glob patterns relative to the repository root. A stage
+    with no outputs (e.g. a report printed to stdout) runs every time it is
+    built.
+    """
+
+    name: str
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+
+
+# NOTE: Stages are listed so that every stage comes after the stages producing
+#       its inputs. The `fetch_*` entrypoints, `state_bracket_parsing` (which
+#       drives a browser unless `state-brackets.json` was captured already) and
+#       `regional_seeding` (which takes files as arguments) are run by hand.
+STAGES: tuple[Stage, ...] = (
+    Stage(
+        name="parse_rosters",
+        inputs=("_raw-data/ikwf-rosters/*.html",),
+        outputs=(_ROSTERS,),
+    ),
+    Stage(
+        name="parse_matches",
+        inputs=(_RAW_EVENTS,),
+        outputs=("_parsed-data/all-matches-01.csv",),
+    ),
+    Stage(
+        name="normalize_teams",
+        inputs=(
+            "_parsed-data/all-matches-01.csv",
+            _ROSTERS,
+            "_parsed-data/custom-normalized-team-names.json",
+        ),
+        outputs=(
+            "_parsed-data/all-matches-02.csv",
+            "_parsed-data/team-resolutions.json",
+        ),
+    ),
+    Stage(
+        name="normalize_athletes",
+        inputs=(
+            "_parsed-data/all-matches-02.csv",
+            _ROSTERS,
+            "_parsed-data/custom-normalized-athlete-names.json",
+        ),
+        outputs=("_parsed-data/all-matches-03.csv",),
+    ),
+    Stage(
+        name="normalize_weights",
+        inputs=("_parsed-data/all-matches-03.csv", _RAW_EVENTS),
+        outputs=(_MATCHES_V4,),
+    ),
+    Stage(
+        name="match_store",
+        inputs=(_MATCHES_V4,),
+        outputs=(_MATCHES_DB,),
+    ),
+    Stage(
+        name="sectional_brackets",
+        inputs=(_MATCHES_V4, _MATCHES_DB, _ROSTERS, _STATE_QUALIFIERS_2025),
+        outputs=(
+            "_parsed-data/central-chicago.xlsx",
+            "_parsed-data/central.xlsx",
+            "_parsed-data/north-chicago.xlsx",
+            "_parsed-data/north.xlsx",
+            "_parsed-data/south-chicago.xlsx",
+            "_parsed-data/south.xlsx",
+            "_parsed-data/west-chicago.xlsx",
+            "_parsed-data/west.xlsx",
+        ),
+    ),
+    Stage(
+        name="regional_weights",
+        inputs=(_MATCHES_V4, _MATCHES_DB, _ROSTERS, "_parsed-data/regionals.json"),
+        outputs=("_parsed-data/regional-weight-classes.xlsx",),
+    ),
+    Stage(
+        name="sectional_qualifiers",
+        inputs=("_raw-data/regional-final-placements/*.html", _ROSTERS),
+        outputs=("_parsed-data/sectional-qualifiers.csv",),
+    ),
+    Stage(
+        name="state_qualifiers",
+        inputs=("_raw-data/sectional-final-placements/*.html", _ROSTERS),
+        outputs=("_parsed-data/state-qualifiers.csv",),
+    ),
+    Stage(
+        name="state_preview_json",
+        inputs=(
+            _MATCHES_V4,
+            _MATCHES_DB,
+            _ROSTERS,
+            _STATE_QUALIFIERS_2025,
+            "_raw-data/bracket-parsing/state-entries.json",
+            "_parsed-data/state-qualifiers.csv",
+        ),
+        outputs=("_parsed-data/2026-state-preview.json",),
+    ),
+    Stage(
+        name="finalize_season",
+        inputs=(
+            "_parsed-data/state-qualifiers.csv",
+            "_raw-data/state-final-placements/state.html",
+        ),
+        outputs=("_parsed-data/2026-finalized.json",),
+    ),
+    Stage(
+        name="tournament_rankings",
+        inputs=(_MATCHES_V4, "_parsed-data/2026-finalized.json"),
+        outputs=(),
+    ),
+)
+
+
+class _FileHash(_ForbidExtra):
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class _BuildState(_ForbidExtra):
+    # NOTE: Hashes are reused while a file's size and mtime are unchanged.
+    files: dict[str, _FileHash] = pydantic.Field(default_factory=dict)
+    stages: dict[str, str] = pydantic.Field(default_factory=dict)
+
+
+def _load_state() -> _BuildState:
+    if not _STATE_PATH.exists():
+        return _BuildState()
+
+    with open(_STATE_PATH, "rb") as file_obj:
+        as_json = file_obj.read()
+
+    try:
+        return _BuildState.model_validate_json(as_json)
+    except pydantic.ValidationError:
+        return _BuildState()
+
+
+def _save_state(state: _BuildState) -> None:
+    with open(_STATE_PATH, "w") as file_obj:
+        file_obj.write(state.model_dump_json(indent=2))
+        file_obj.write("\n")
+
+
+def _producers() -> dict[str, Stage]:
+    producers: dict[str, Stage] = {}
+    for stage in STAGES:
+        for input_ in stage.inputs:
+            if input_ in producers:
+                continue
+            if any(input_ in later.outputs for later in STAGES):
+                raise RuntimeError("Stage listed before its input", stage.name, input_)
+
+        for output in stage.outputs:
+            if output in producers:
+                raise RuntimeError("Output produced twice", output)
+            producers[output] = stage
+
+    return producers
+
+
+def _upstream(stage: Stage, producers: dict[str, Stage]) -> list[Stage]:
+    return [producers[input_] for input_ in stage.inputs if input_ in producers]
+
+
+def resolve_targets(targets: list[str]) -> list[Stage]:
+    """The stages needed to build `targets`, in build order.
+
+    A target is a stage name or an output path (e.g. `_parsed-data/north.xlsx`).
+    With no targets, every stage is built.
+    """
+    by_name = {stage.name: stage for stage in STAGES}
+    producers = _producers()
+    if not targets:
+        return list(STAGES)
+
+    needed: set[str] = set()
+    to_visit: list[Stage] = []
+    for target in targets:
+        stage = by_name.get(target) or producers.get(target.removeprefix("./"))
+        if stage is None:
+            raise ValueError("Unknown target", target)
+        to_visit.append(stage)
+
+    while to_visit:
+        stage = to_visit.pop()
+        if stage.name in needed:
+            continue
+        needed.add(stage.name)
+        to_visit.extend(_upstream(stage, producers))
+
+    return [stage for stage in STAGES if stage.name in needed]
+
+
+def _code_files(stage: Stage) -> list[pathlib.Path]:
+    """The stage's entrypoint and every repository module it imports."""
+    entrypoint = _HERE / "entrypoints" / stage.name / "__main__.py"
+    seen: set[pathlib.Path] = set()
+    to_visit = [entrypoint]
+    while to_visit:
+        path = to_visit.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                modules = [node.module or ""]
+            else:
+                continue
+
+            for module in modules:
+                candidate = _HERE / f"{module.split('.')[0]}.py"
+                if candidate.is_file():
+                    to_visit.append(candidate)
+
+    return sorted(seen)
+
+
+def _expand_input(stage: Stage, input_: str) -> list[pathlib.Path]:
+    paths = sorted(path for path in _HERE.glob(input_) if path.is_file())
+    if not paths:
+        raise RuntimeError("Missing input", stage.name, input_)
+    return paths
+
+
+def _file_sha256(path: pathlib.Path, state: _BuildState) -> str:
+    key = path.relative_to(_HERE).as_posix()
+    stat = path.stat()
+    cached = state.files.get(key)
+    if (
+        cached is not None
+        and cached.size == stat.st_size
+        and cached.mtime_ns == stat.st_mtime_ns
+    ):
+        return cached.sha256
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_obj:
+        while chunk := file_obj.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+    sha256 = digest.hexdigest()
+    state.files[key] = _FileHash(
+        size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=sha256
+    )
+    return sha256
+
+
+def _stage_digest(stage: Stage, state: _BuildState) -> str:
+    """Hash the stage's code and the contents of all of its inputs."""
+    digest = hashlib.sha256()
+    digest.update(stage.name.encode())
+    paths = _code_files(stage)
+    for input_ in stage.inputs:
+        paths.extend(_expand_input(stage, input_))
+
+    for path in paths:
+        digest.update(b"\0")
+        digest.update(path.relative_to(_HERE).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(_file_sha256(path, state).encode())
+
+    return digest.hexdigest()
+
+
+def _is_stale(stage: Stage, digest: str, state: _BuildState) -> bool:
+    if not stage.outputs:
+        return True
+    if any(not (_HERE / output).exists() for output in stage.outputs):
+        return True
+    return state.stages.get(stage.name) != digest
+
+
+def _run_stage(stage: Stage) -> tuple[int, str]:
+    completed = subprocess.run(
+        [sys.executable, "-m", f"entrypoints.{stage.name}"],
+        cwd=_HERE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        check=False,
+    )
+    return completed.returncode, completed.stdout
+
+
+def _print_status(status: str, stage: Stage, detail: str = "") -> None:
+    print(f"{status:<8} {stage.name:<22} {detail}".rstrip(), flush=True)
+
+
+def build(stages: list[Stage], *, jobs: int, force: bool, dry_run: bool) -> bool:
+    """Run the stale stages, up to `jobs` at once, and return if all succeeded.
+
+    A stage is stale if an output is missing or its code / inputs changed since
+    it last succeeded. Stages are only checked once the stages producing their
+    inputs are done, so a re-run that writes identical output stops there.
+    """
+    state = _load_state()
+    producers = _producers()
+    pending = list(stages)
+    needed = {stage.name for stage in stages}
+    finished: set[str] = set()
+    failed: set[str] = set()
+    running: dict[concurrent.futures.Future[tuple[int, str]], tuple[Stage, str]] = {}
+    starts: dict[str, float] = {}
+    would_run: set[str] = set()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            for stage in list(pending):
+                upstream = [
+                    other.name
+                    for other in _upstream(stage, producers)
+                    if other.name in needed
+                ]
+                if any(name in failed for name in upstream):
+                    pending.remove(stage)
+                    failed.add(stage.name)
+                    _print_status("skipped", stage, "(an input failed to build)")
+                    continue
+                if not all(name in finished for name in upstream):
+                    continue
+                if len(running) >= jobs:
+                    break
+
+                pending.remove(stage)
+                if dry_run and any(name in would_run for name in upstream):
+                    would_run.add(stage.name)
+                    finished.add(stage.name)
+                    _print_status("stale", stage)
+                    continue
+
+                try:
+                    digest = _stage_digest(stage, state)
+                except RuntimeError as exc:
+                    failed.add(stage.name)
+                    _print_status("FAILED", stage, repr(exc))
+                    continue
+
+                if not (force or _is_stale(stage, digest, state)):
+                    finished.add(stage.name)
+                    _print_status("fresh", stage)
+                    continue
+
+                if dry_run:
+                    would_run.add(stage.name)
+                    finished.add(stage.name)
+                    _print_status("stale", stage)
+                    continue
+
+                _print_status("run", stage)
+                starts[stage.name] = time.perf_counter()
+                running[executor.submit(_run_stage, stage)] = stage, digest
+
+            if not running:
+                continue
+
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                stage, digest = running.pop(future)
+                returncode, log = future.result()
+                duration = time.perf_counter() - starts[stage.name]
+                if log:
+                    print(log, end="" if log.endswith("\n") else "\n")
+
+                missing = [
+                    output for output in stage.outputs if not (_HERE / output).exists()
+                ]
+                if returncode != 0 or missing:
+                    failed.add(stage.name)
+                    state.stages.pop(stage.name, None)
+                    _print_status("FAILED", stage, f"exit code {returncode}")
+                else:
+                    finished.add(stage.name)
+                    state.stages[stage.name] = digest
+                    _print_status("done", stage, f"{duration:.1f}s")
+
+                _save_state(state)
+
+    if not dry_run:
+        _save_state(state)
+    return not failed
@@ -0,0 +1,198 @@
+import argparse
+import functools
+import pathlib
+import statistics
+import threading
+import time
+from collections.abc import Callable
+
+import bracket_util
+import raw_store
+import replay_server
+import trackwrestling
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_ROOT = _HERE.parent.parent
+# NOTE: These are looked up as module globals at call time, so replacing them
+#       on the module is enough to time every call.
+_TIMED_STEPS = (
+    "_new_driver",
+    "_main_page_click_events_classic",
+    "_events_page_search_events",
+    "_event_search_fill_inputs",
+    "_event_search_click_search",
+    "_search_results_click_first",
+    "_event_box_change_user_type",
+    "_event_box_click_enter_event",
+    "_click_results_sidebar_option",
+    "_click_round_results_option",
+    "_all_round_option_values",
+    "_capture_round",
+    "_fetch_round_http",
+    "_click_wrestlers_menu_option",
+    "_get_weights_table",
+    "_weights_click_next_page",
+)
+
+
+class _StepTimings:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.durations: dict[str, list[float]] = {}
+
+    def add(self, name: str, duration: float) -> None:
+        with self._lock:
+            self.durations.setdefault(name, []).append(duration)
+
+
+def _timed[**P, R](
+    name: str, func: Callable[P, R], timings: _StepTimings
+) -> Callable[P, R]:
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings.add(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _instrument(timings: _StepTimings) -> None:
+    for name in _TIMED_STEPS:
+        func = getattr(trackwrestling, name)
+        setattr(trackwrestling, name, _timed(name, func, timings))
+
+
+def _get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time TrackWrestling fetches against a local replay server"
+    )
+    parser.add_argument(
+        "--event",
+        dest="events",
+        action="append",
+        default=[],
+        help="Event name to fetch (may be repeated)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=3,
+        help="Number of events to fetch when no `--event` is given",
+    )
+    parser.add_argument("--http", action="store_true")
+    parser.add_argument(
+        "--athlete-weights", dest="athlete_weights", action="store_true"
+    )
+    parser.add_argument("--headed", action="store_true")
+    return parser.parse_args()
+
+
+def _select_events(
+    raw_data_dir: pathlib.Path, names: list[str], limit: int
+) -> list[tuple[str, str]]:
+    available: list[tuple[str, str]] = []
+    for date_str, name in trackwrestling.TOURNAMENT_EVENTS:
+        stem = bracket_util.to_kebab_case(name)
+        if raw_store.exists(raw_data_dir / date_str / f"{stem}.json"):
+            available.append((date_str, name))
+
+    if not names:
+        return available[:limit]
+
+    by_name = {name: (date_str, name) for date_str, name in available}
+    missing = [name for name in names if name not in by_name]
+    if missing:
+        raise ValueError("Events not available in `_raw-data`", missing)
+
+    return [by_name[name] for name in names]
+
+
+def _load_fetched_event(
+    raw_data_dir: pathlib.Path, date_str: str, name: str
+) -> bracket_util.FetchedEvent:
+    stem = bracket_util.to_kebab_case(name)
+    path = raw_data_dir / date_str / f"{stem}.json"
+    return raw_store.load_fetched_event(path)
+
+
+def _rounds_agree(
+    rounds_html: dict[str, str], stored_html: dict[str, str], name: str, date_str: str
+) -> bool:
+    """Compare parsed matches, since the browser may re-serialize the HTML."""
+    if rounds_html.keys() != stored_html.keys():
+        return False
+
+    for key, html in rounds_html.items():
+        fetched = trackwrestling.parse_tournament_round(html, name, date_str)
+        stored = trackwrestling.parse_tournament_round(stored_html[key], name, date_str)
+        if fetched != stored:
+            return False
+
+    return True
+
+
+def _print_report(timings: _StepTimings, wall_time: float) -> None:
+    print(f"{'Step':<36} {'Calls':>6} {'Total':>9} {'Mean':>9} {'P50':>9} {'Max':>9}")
+    for name in _TIMED_STEPS:
+        durations = timings.durations.get(name)
+        if not durations:
+            continue
+
+        total = sum(durations)
+        mean = total / len(durations)
+        median = statistics.median(durations)
+        maximum = max(durations)
+        print(
+            f"{name:<36} {len(durations):>6} {total:>8.3f}s {mean:>8.3f}s "
+            f"{median:>8.3f}s {maximum:>8.3f}s"
+        )
+
+    print(f"Wall time: {wall_time:.3f}s")
+
+
+def main() -> None:
+    args = _get_args()
+    raw_data_dir = _ROOT / "_raw-data"
+    events = _select_events(raw_data_dir, args.events, args.limit)
+
+    timings = _StepTimings()
+    _instrument(timings)
+
+    start = time.perf_counter()
+    with (
+        replay_server.ReplayServer() as server,
+        trackwrestling.BrowserSession(
+            headless=not args.headed, base_url=server.base_url
+        ) as session,
+    ):
+        for date_str, name in events:
+            event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
+            fetched_event = _load_fetched_event(raw_data_dir, date_str, name)
+
+            event_start = time.perf_counter()
+            rounds_html = session.fetch_tournament_rounds(event, http=args.http)
+            weights_html: dict[str, str] = {}
+            if args.athlete_weights:
+                weights_html = session.fetch_athlete_weights(event)
+            duration = time.perf_counter() - event_start
+
+            agrees = _rounds_agree(
+                rounds_html, fetched_event.match_html, name, date_str
+            )
+            if args.athlete_weights:
+                agrees = agrees and (
+                    weights_html.keys() == fetched_event.weights_html.keys()
+                )
+
+            status = "OK" if agrees else "MISMATCH"
+            print(f"{status:<8} {duration:>8.3f}s {name}")
+
+    wall_time = time.perf_counter() - start
+    _print_report(timings, wall_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import argparse
+import csv
+import pathlib
+import time
+from collections.abc import Callable
+
+import bracket_util
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_ROOT = _HERE.parent.parent
+
+
+def _get_args() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the MatchV1 -> MatchV4 upgrades with and without validation"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of times to run each step (the fastest run is reported)",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    return args.repeat
+
+
+def _load_matches() -> list[bracket_util.MatchV1]:
+    input_file = _ROOT / "_parsed-data" / "all-matches-01.csv"
+    with open(input_file) as file_obj:
+        rows = list(csv.DictReader(file_obj))
+
+    for row in rows:
+        if row["Division"] == "":
+            row["Division"] = None
+
+    matches_root = bracket_util.MatchesV1.model_validate(rows)
+    return matches_root.root
+
+
+def _validated_upgrade[T: bracket_util.MatchV1](
+    cls: type[T], inherit: bracket_util.MatchV1, **updates: object
+) -> T:
+    """The upgrade as it was before `from_v*()` skipped validation."""
+    data = inherit.model_dump(mode="json")
+    data.update(updates)
+    return cls(**data)
+
+
+def _v2_updates(match_: bracket_util.MatchV1) -> dict[str, str]:
+    return {
+        "winner_team_normalized": match_.winner_team,
+        "loser_team_normalized": match_.loser_team,
+    }
+
+
+def _v3_updates(match_: bracket_util.MatchV2) -> dict[str, str | int | None]:
+    return {
+        "winner_team_normalized": match_.winner_team_normalized,
+        "winner_normalized": match_.winner,
+        "winner_usaw_number": None,
+        "winner_ikwf_age": 10,
+        "loser_team_normalized": match_.loser_team_normalized,
+        "loser_normalized": None,
+        "loser_usaw_number": None,
+        "loser_ikwf_age": None,
+    }
+
+
+def _v4_updates(match_: bracket_util.MatchV3) -> dict[str, float | None]:
+    del match_
+    return {"winner_weight": 70.5, "loser_weight": None}
+
+
+def _time_step[T, R](
+    func: Callable[[T], R], inputs: list[T], repeat: int
+) -> tuple[list[R], float]:
+    best = float("inf")
+    results: list[R] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(value) for value in inputs]
+        best = min(best, time.perf_counter() - start)
+
+    return results, best
+
+
+def _benchmark_step[T, R: bracket_util.MatchV1](
+    step: str,
+    construct: Callable[[T], R],
+    validate: Callable[[T], R],
+    inputs: list[T],
+    repeat: int,
+) -> list[R]:
+    constructed, construct_duration = _time_step(construct, inputs, repeat)
+    validated, validate_duration = _time_step(validate, inputs, repeat)
+
+    agrees = all(
+        left.model_dump(mode="json") == right.model_dump(mode="json")
+        for left, right in zip(constructed, validated, strict=True)
+    )
+    status = "OK" if agrees else "MISMATCH"
+    speedup = validate_duration / construct_duration
+    print(
+        f"{step:<8} {validate_duration:>9.3f}s {construct_duration:>9.3f}s "
+        f"{speedup:>7.1f}x  {status}"
+    )
+    return constructed
+
+
+def main() -> None:
+    repeat = _get_args()
+    matches_v1 = _load_matches()
+
+    print(f"{len(matches_v1)} matches, best of {repeat}")
+    print(f"{'Step':<8} {'Validated':>10} {'Construct':>10} {'Speedup':>8}  Output")
+    matches_v2 = _benchmark_step(
+        "from_v1",
+        lambda match_: bracket_util.MatchV2.from_v1(match_, **_v2_updates(match_)),
+        lambda match_: _validated_upgrade(
+            bracket_util.MatchV2, match_, **_v2_updates(match_)
+        ),
+        matches_v1,
+        repeat,
+    )
+    matches_v3 = _benchmark_step(
+        "from_v2",
+        lambda match_: bracket_util.MatchV3.from_v2(match_, **_v3_updates(match_)),
+        lambda match_: _validated_upgrade(
+            bracket_util.MatchV3, match_, **_v3_updates(match_)
+        ),
+        matches_v2,
+        repeat,
+    )
+    _benchmark_step(
+        "from_v3",
+        lambda match_: bracket_util.MatchV4.from_v3(match_, **_v4_updates(match_)),
+        lambda match_: _validated_upgrade(
+            bracket_util.MatchV4, match_, **_v4_updates(match_)
+        ),
+        matches_v3,
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
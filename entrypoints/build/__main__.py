@@ -0,0 +1,71 @@
+import argparse
+import sys
+
+import build_graph
+
+
+def _get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Re-run the entrypoints whose code or inputs changed"
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="Stage names or output paths (default: everything)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of independent stages to run at once",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run every stage needed for the targets, even if up to date",
+    )
+    parser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        help="Only print which stages are stale",
+    )
+    parser.add_argument(
+        "--list",
+        dest="list_stages",
+        action="store_true",
+        help="Print every stage with its inputs and outputs",
+    )
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return args
+
+
+def _print_stages() -> None:
+    for stage in build_graph.STAGES:
+        print(stage.name)
+        for input_ in stage.inputs:
+            print(f"  < {input_}")
+        for output in stage.outputs:
+            print(f"  > {output}")
+
+
+def main() -> None:
+    args = _get_args()
+    if args.list_stages:
+        _print_stages()
+        return
+
+    stages = build_graph.resolve_targets(args.targets)
+    succeeded = build_graph.build(
+        stages, jobs=args.jobs, force=args.force, dry_run=args.dry_run
+    )
+    if not succeeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
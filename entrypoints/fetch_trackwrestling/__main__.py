@@ -1,23 +1,82 @@
+import argparse
+import concurrent.futures
 import pathlib
+import threading
 
 import bracket_util
+import fetch_journal
+import raw_store
 import trackwrestling
 
 _HERE = pathlib.Path(__file__).resolve().parent
 _ROOT = _HERE.parent.parent
 
 
-def _fetch_event_rounds(
-    path: pathlib.Path, event: bracket_util.Event
-) -> bracket_util.FetchedEvent:
-    if path.exists():
-        with open(path, "rb") as file_obj:
-            as_json = file_obj.read()
+def _get_args() -> tuple[int, bool]:
+    parser = argparse.ArgumentParser(description="Fetch TrackWrestling tournaments")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of events to fetch concurrently (each in a headless browser)",
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help="Fetch round results over HTTP, using the browser only to log in",
+    )
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    return args.workers, args.http
+
+
+class _SessionPool:
+    """One browser session per worker thread, reused across events."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: list[trackwrestling.BrowserSession] = []
+
+    def get(self) -> trackwrestling.BrowserSession:
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            return session
+
+        session = trackwrestling.BrowserSession(headless=True)
+        self._local.session = session
+        with self._lock:
+            self._sessions.append(session)
+
+        return session
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = self._sessions
+            self._sessions = []
+
+        for session in sessions:
+            session.close()
 
-        return bracket_util.FetchedEvent.model_validate_json(as_json)
+
+def _fetch_event_rounds(
+    path: pathlib.Path,
+    event: bracket_util.Event,
+    session: trackwrestling.BrowserSession,
+    http: bool,
+    journal: fetch_journal.Journal,
+) -> tuple[bracket_util.FetchedEvent, bool]:
+    """Load the event, or fetch its rounds; also return if they were fetched."""
+    if raw_store.exists(path):
+        return raw_store.load_fetched_event(path), False
 
     print(f"Fetching rounds for: {event.name} ...")
-    rounds_html = trackwrestling.fetch_tournament_rounds(event)
+    rounds_html = session.fetch_tournament_rounds(
+        event, http=http, checkpoint=journal.checkpoint("match_html")
+    )
 
     if not rounds_html:
         raise RuntimeError("Tournament has no rounds", event.name)
@@ -30,11 +89,14 @@ def _fetch_event_rounds(
         match_html=rounds_html,
         weights_html={},
     )
-    return fetched_event
+    return fetched_event, True
 
 
 def _fetch_event_athlete_weights(
-    fetched_event: bracket_util.FetchedEvent, event: bracket_util.Event
+    fetched_event: bracket_util.FetchedEvent,
+    event: bracket_util.Event,
+    session: trackwrestling.BrowserSession,
+    journal: fetch_journal.Journal,
 ) -> bracket_util.FetchedEvent | None:
     if fetched_event.weights_html:
         print(f"Skipping: {event.name} ...")
@@ -42,7 +104,9 @@ def _fetch_event_athlete_weights(
 
     print(f"Fetching athlete weights for: {event.name} ...")
 
-    weights_html = trackwrestling.fetch_athlete_weights(event)
+    weights_html = session.fetch_athlete_weights(
+        event, checkpoint=journal.checkpoint("weights_html")
+    )
 
     if not weights_html:
         raise RuntimeError("Tournament has no athlete weights", event.name)
@@ -51,33 +115,89 @@ def _fetch_event_athlete_weights(
     return fetched_event
 
 
-def main() -> None:
-    raw_data_dir = _ROOT / "_raw-data"
-    for date_str, name in trackwrestling.TOURNAMENT_EVENTS:
-        parent_dir = raw_data_dir / date_str
-        parent_dir.mkdir(parents=True, exist_ok=True)
-
-        stem = bracket_util.to_kebab_case(name)
-        filename = f"{stem}.json"
-        path = parent_dir / filename
-
-        event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
-        fetched_event = _fetch_event_rounds(path, event)
+def _fetch_event(
+    raw_data_dir: pathlib.Path,
+    date_str: str,
+    name: str,
+    session: trackwrestling.BrowserSession,
+    http: bool,
+) -> None:
+    parent_dir = raw_data_dir / date_str
+    parent_dir.mkdir(parents=True, exist_ok=True)
+
+    stem = bracket_util.to_kebab_case(name)
+    filename = f"{stem}.json"
+    path = parent_dir / filename
+
+    event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
+    journal = fetch_journal.open_journal(path)
+    fetched_event, fetched = _fetch_event_rounds(path, event, session, http, journal)
+    if fetched:
         # NOTE: Save part way through in case the second go around is buggy
-        as_json = fetched_event.model_dump_json(indent=2)
-        with open(path, "w") as file_obj:
-            file_obj.write(as_json)
-            file_obj.write("\n")
+        raw_store.save_event(path, fetched_event)
+
+    fetched_event = _fetch_event_athlete_weights(fetched_event, event, session, journal)
+
+    if fetched_event is not None:
+        raw_store.save_event(path, fetched_event)
+
+    journal.remove()
+
+
+def _fetch_event_pooled(
+    raw_data_dir: pathlib.Path,
+    date_str: str,
+    name: str,
+    pool: _SessionPool,
+    http: bool,
+) -> None:
+    _fetch_event(raw_data_dir, date_str, name, pool.get(), http)
+
+
+def _fetch_all_parallel(raw_data_dir: pathlib.Path, workers: int, http: bool) -> None:
+    """Fetch events concurrently, one headless browser per worker thread.
+
+    Each event writes its own `_raw-data/{DATE}/{STEM}.json`, so workers never
+    share any state beyond the (read-only) list of events. Each worker keeps
+    its browser open between events.
+    """
+    events = trackwrestling.TOURNAMENT_EVENTS
+    total = len(events)
+
+    pool = _SessionPool()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        future_to_name = {
+            executor.submit(
+                _fetch_event_pooled, raw_data_dir, date_str, name, pool, http
+            ): name
+            for date_str, name in events
+        }
+        completed_futures = concurrent.futures.as_completed(future_to_name)
+        for completed, future in enumerate(completed_futures, start=1):
+            name = future_to_name[future]
+            future.result()
+            print(f"[{completed}/{total}] Done: {name}")
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        pool.close()
+
+    executor.shutdown(wait=True)
 
-        fetched_event = _fetch_event_athlete_weights(fetched_event, event)
 
-        if fetched_event is None:
-            continue
+def main() -> None:
+    workers, http = _get_args()
+
+    raw_data_dir = _ROOT / "_raw-data"
+    if workers > 1:
+        _fetch_all_parallel(raw_data_dir, workers, http)
+        return
 
-        as_json = fetched_event.model_dump_json(indent=2)
-        with open(path, "w") as file_obj:
-            file_obj.write(as_json)
-            file_obj.write("\n")
+    with trackwrestling.BrowserSession() as session:
+        for date_str, name in trackwrestling.TOURNAMENT_EVENTS:
+            _fetch_event(raw_data_dir, date_str, name, session, http)
 
 
 if __name__ == "__main__":
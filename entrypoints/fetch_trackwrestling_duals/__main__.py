@@ -1,6 +1,8 @@
 import pathlib
 
 import bracket_util
+import fetch_journal
+import raw_store
 import trackwrestling
 
 _HERE = pathlib.Path(__file__).resolve().parent
@@ -8,16 +10,18 @@ _ROOT = _HERE.parent.parent
 
 
 def _fetch_event_weights(
-    path: pathlib.Path, event: bracket_util.Event
+    path: pathlib.Path,
+    event: bracket_util.Event,
+    session: trackwrestling.BrowserSession,
+    journal: fetch_journal.Journal,
 ) -> bracket_util.FetchedEvent:
-    if path.exists():
-        with open(path, "rb") as file_obj:
-            as_json = file_obj.read()
-
-        return bracket_util.FetchedEvent.model_validate_json(as_json)
+    if raw_store.exists(path):
+        return raw_store.load_fetched_event(path)
 
     print(f"Fetching weights for: {event.name} ...")
-    match_html = trackwrestling.fetch_dual_weights(event)
+    match_html = session.fetch_dual_weights(
+        event, checkpoint=journal.checkpoint("match_html")
+    )
 
     if not match_html:
         raise RuntimeError("Event has no weights", event.name)
@@ -34,7 +38,10 @@ def _fetch_event_weights(
 
 
 def _fetch_event_athlete_weights(
-    fetched_event: bracket_util.FetchedEvent, event: bracket_util.Event
+    fetched_event: bracket_util.FetchedEvent,
+    event: bracket_util.Event,
+    session: trackwrestling.BrowserSession,
+    journal: fetch_journal.Journal,
 ) -> bracket_util.FetchedEvent | None:
     if fetched_event.weights_html:
         print(f"Skipping: {event.name} ...")
@@ -42,7 +49,9 @@ def _fetch_event_athlete_weights(
 
     print(f"Fetching athlete weights for: {event.name} ...")
 
-    weights_html = trackwrestling.fetch_athlete_weights(event)
+    weights_html = session.fetch_athlete_weights(
+        event, checkpoint=journal.checkpoint("weights_html")
+    )
 
     if not weights_html:
         raise RuntimeError("Event has no athlete weights", event.name)
@@ -51,27 +60,35 @@ def _fetch_event_athlete_weights(
     return fetched_event
 
 
-def main() -> None:
-    raw_data_dir = _ROOT / "_raw-data"
-    for date_str, name in trackwrestling.DUAL_EVENTS:
-        parent_dir = raw_data_dir / date_str
-        parent_dir.mkdir(parents=True, exist_ok=True)
+def _fetch_event(
+    raw_data_dir: pathlib.Path,
+    date_str: str,
+    name: str,
+    session: trackwrestling.BrowserSession,
+) -> None:
+    parent_dir = raw_data_dir / date_str
+    parent_dir.mkdir(parents=True, exist_ok=True)
 
-        stem = bracket_util.to_kebab_case(name)
-        filename = f"{stem}.json"
-        path = parent_dir / filename
+    stem = bracket_util.to_kebab_case(name)
+    filename = f"{stem}.json"
+    path = parent_dir / filename
 
-        event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
-        fetched_event = _fetch_event_weights(path, event)
-        fetched_event = _fetch_event_athlete_weights(fetched_event, event)
+    event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
+    journal = fetch_journal.open_journal(path)
+    fetched_event = _fetch_event_weights(path, event, session, journal)
+    fetched_event = _fetch_event_athlete_weights(fetched_event, event, session, journal)
 
-        if fetched_event is None:
-            continue
+    if fetched_event is not None:
+        raw_store.save_event(path, fetched_event)
 
-        as_json = fetched_event.model_dump_json(indent=2)
-        with open(path, "w") as file_obj:
-            file_obj.write(as_json)
-            file_obj.write("\n")
+    journal.remove()
+
+
+def main() -> None:
+    raw_data_dir = _ROOT / "_raw-data"
+    with trackwrestling.BrowserSession() as session:
+        for date_str, name in trackwrestling.DUAL_EVENTS:
+            _fetch_event(raw_data_dir, date_str, name, session)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 import pathlib
 
 import bracket_util
+import fetch_journal
+import raw_store
 import usabracketing
 
 _HERE = pathlib.Path(__file__).resolve().parent
@@ -8,19 +10,21 @@ _ROOT = _HERE.parent.parent
 
 
 def _fetch_event_rounds(
-    path: pathlib.Path, event: bracket_util.Event, login_info: usabracketing.LoginInfo
+    path: pathlib.Path,
+    event: bracket_util.Event,
+    login_info: usabracketing.LoginInfo,
+    journal: fetch_journal.Journal,
 ) -> bracket_util.FetchedEvent:
     fetched_event: bracket_util.FetchedEvent | None = None
-    if path.exists():
-        with open(path, "rb") as file_obj:
-            as_json = file_obj.read()
-
-        fetched_event = bracket_util.FetchedEvent.model_validate_json(as_json)
+    if raw_store.exists(path):
+        fetched_event = raw_store.load_fetched_event(path)
         if fetched_event.match_html:
             return fetched_event
 
     print(f"Fetching rounds for: {event.name} ...")
-    rounds_html = usabracketing.fetch_tournament_rounds(event, login_info)
+    rounds_html = usabracketing.fetch_tournament_rounds(
+        event, login_info, checkpoint=journal.checkpoint("match_html")
+    )
 
     if not rounds_html:
         raise RuntimeError("Tournament has no rounds", event.name)
@@ -43,6 +47,7 @@ def _fetch_event_athlete_weights(
     fetched_event: bracket_util.FetchedEvent,
     event: bracket_util.Event,
     login_info: usabracketing.LoginInfo,
+    journal: fetch_journal.Journal,
 ) -> bracket_util.FetchedEvent | None:
     if fetched_event.weights_html:
         print(f"Skipping: {event.name} ...")
@@ -50,7 +55,9 @@ def _fetch_event_athlete_weights(
 
     print(f"Fetching athlete weights for: {event.name} ...")
 
-    weights_html = usabracketing.fetch_athlete_weights(event, login_info)
+    weights_html = usabracketing.fetch_athlete_weights(
+        event, login_info, checkpoint=journal.checkpoint("weights_html")
+    )
 
     if not weights_html:
         raise RuntimeError("Tournament has no athlete weights", event.name)
@@ -72,16 +79,16 @@ def main() -> None:
         path = parent_dir / filename
 
         event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
-        fetched_event = _fetch_event_rounds(path, event, login_info)
-        fetched_event = _fetch_event_athlete_weights(fetched_event, event, login_info)
+        journal = fetch_journal.open_journal(path)
+        fetched_event = _fetch_event_rounds(path, event, login_info, journal)
+        fetched_event = _fetch_event_athlete_weights(
+            fetched_event, event, login_info, journal
+        )
 
-        if fetched_event is None:
-            continue
+        if fetched_event is not None:
+            raw_store.save_event(path, fetched_event)
 
-        as_json = fetched_event.model_dump_json(indent=2)
-        with open(path, "w") as file_obj:
-            file_obj.write(as_json)
-            file_obj.write("\n")
+        journal.remove()
 
 
 if __name__ == "__main__":
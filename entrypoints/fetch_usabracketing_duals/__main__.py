@@ -1,23 +1,57 @@
+import argparse
 import pathlib
 
 import bracket_util
+import fetch_journal
+import raw_store
 import usabracketing
 
 _HERE = pathlib.Path(__file__).resolve().parent
 _ROOT = _HERE.parent.parent
 
 
+def _parse_chunk_size(value: str) -> int | None:
+    if value == "all":
+        return None
+
+    chunk_size = int(value)
+    if chunk_size < 1:
+        raise argparse.ArgumentTypeError("must be at least 1 (or `all`)")
+
+    return chunk_size
+
+
+def _get_chunk_size() -> int | None:
+    parser = argparse.ArgumentParser(description="Fetch USA Bracketing dual events")
+    parser.add_argument(
+        "--chunk-size",
+        dest="chunk_size",
+        type=_parse_chunk_size,
+        default=1,
+        help="Number of weights to submit per printout, or `all` for one printout",
+    )
+    args = parser.parse_args()
+
+    return args.chunk_size
+
+
 def _fetch_event_weights(
-    path: pathlib.Path, event: bracket_util.Event, login_info: usabracketing.LoginInfo
+    path: pathlib.Path,
+    event: bracket_util.Event,
+    login_info: usabracketing.LoginInfo,
+    journal: fetch_journal.Journal,
+    chunk_size: int | None,
 ) -> bracket_util.FetchedEvent:
-    if path.exists():
-        with open(path, "rb") as file_obj:
-            as_json = file_obj.read()
-
-        return bracket_util.FetchedEvent.model_validate_json(as_json)
+    if raw_store.exists(path):
+        return raw_store.load_fetched_event(path)
 
     print(f"Fetching rounds for: {event.name} ...")
-    match_html = usabracketing.fetch_dual_weights(event, login_info)
+    match_html = usabracketing.fetch_dual_weights(
+        event,
+        login_info,
+        checkpoint=journal.checkpoint("match_html"),
+        chunk_size=chunk_size,
+    )
 
     if not match_html:
         raise RuntimeError("Event has no weights", event.name)
@@ -37,6 +71,7 @@ def _fetch_event_athlete_weights(
     fetched_event: bracket_util.FetchedEvent,
     event: bracket_util.Event,
     login_info: usabracketing.LoginInfo,
+    journal: fetch_journal.Journal,
 ) -> bracket_util.FetchedEvent | None:
     if fetched_event.weights_html:
         print(f"Skipping: {event.name} ...")
@@ -44,7 +79,9 @@ def _fetch_event_athlete_weights(
 
     print(f"Fetching athlete weights for: {event.name} ...")
 
-    weights_html = usabracketing.fetch_athlete_weights(event, login_info)
+    weights_html = usabracketing.fetch_athlete_weights(
+        event, login_info, checkpoint=journal.checkpoint("weights_html")
+    )
 
     if not weights_html:
         raise RuntimeError("Event has no athlete weights", event.name)
@@ -54,6 +91,7 @@ def _fetch_event_athlete_weights(
 
 
 def main() -> None:
+    chunk_size = _get_chunk_size()
     login_info = usabracketing.get_login_info()
 
     raw_data_dir = _ROOT / "_raw-data"
@@ -66,16 +104,18 @@ def main() -> None:
         path = parent_dir / filename
 
         event = bracket_util.Event(name=name, start_date=None, end_date=date_str)
-        fetched_event = _fetch_event_weights(path, event, login_info)
-        fetched_event = _fetch_event_athlete_weights(fetched_event, event, login_info)
-
-        if fetched_event is None:
-            continue
-
-        as_json = fetched_event.model_dump_json(indent=2)
-        with open(path, "w") as file_obj:
-            file_obj.write(as_json)
-            file_obj.write("\n")
+        journal = fetch_journal.open_journal(path)
+        fetched_event = _fetch_event_weights(
+            path, event, login_info, journal, chunk_size
+        )
+        fetched_event = _fetch_event_athlete_weights(
+            fetched_event, event, login_info, journal
+        )
+
+        if fetched_event is not None:
+            raw_store.save_event(path, fetched_event)
+
+        journal.remove()
 
 
 if __name__ == "__main__":
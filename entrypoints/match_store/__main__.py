@@ -0,0 +1,9 @@
+import projection
+
+
+def main() -> None:
+    projection.build_match_store()
+
+
+if __name__ == "__main__":
+    main()
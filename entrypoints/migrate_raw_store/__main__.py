@@ -0,0 +1,43 @@
+import pathlib
+
+import bracket_util
+import raw_store
+import trackwrestling
+import usabracketing
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_ROOT = _HERE.parent.parent
+
+
+def _all_events() -> list[tuple[str, str]]:
+    return [
+        *trackwrestling.TOURNAMENT_EVENTS,
+        *trackwrestling.DUAL_EVENTS,
+        *usabracketing.TOURNAMENT_EVENTS,
+        *usabracketing.DUAL_EVENTS,
+    ]
+
+
+def _directory_size(directory: pathlib.Path) -> int:
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def main() -> None:
+    raw_data_dir = _ROOT / "_raw-data"
+    size_before = _directory_size(raw_data_dir)
+
+    migrated = 0
+    for date_str, name in _all_events():
+        stem = bracket_util.to_kebab_case(name)
+        path = raw_data_dir / date_str / f"{stem}.json"
+        if raw_store.migrate_event(path):
+            print(f"Migrated: {name}")
+            migrated += 1
+
+    size_after = _directory_size(raw_data_dir)
+    print(f"Migrated {migrated} events")
+    print(f"Size of `_raw-data`: {size_before:,} bytes -> {size_after:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+
+import parse_cache
+
+# NOTE: Importing the parsers registers their current fingerprints.
+import trackwrestling  # noqa: F401
+import usabracketing  # noqa: F401
+
+
+def _get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or clear the parse cache")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Show the cached results for each parser")
+    clear_parser = subparsers.add_parser("clear", help="Remove cached results")
+    clear_parser.add_argument(
+        "--stale",
+        action="store_true",
+        help="Only remove results from parser code that is no longer current",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _get_args()
+
+    if args.command == "stats":
+        print(
+            f"{'Parser':<40} {'Fingerprint':<12} {'Backend':<12} "
+            f"{'Entries':>8} {'Size':>12}"
+        )
+        for parser_stats in parse_cache.stats():
+            stale = "" if parser_stats.current else " (stale)"
+            print(
+                f"{parser_stats.parser:<40} {parser_stats.fingerprint[:12]:<12} "
+                f"{parser_stats.backend:<12} "
+                f"{parser_stats.entries:>8} {parser_stats.size:>12,}{stale}"
+            )
+
+    if args.command == "clear":
+        removed = parse_cache.clear(stale_only=args.stale)
+        print(f"Removed {removed} cached results")
+
+
+if __name__ == "__main__":
+    main()
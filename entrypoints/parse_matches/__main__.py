@@ -1,116 +1,77 @@
+import argparse
+import collections
 import csv
 import pathlib
 
 import bracket_util
+import parse_events
 import trackwrestling
-import usabracketing
 
 _HERE = pathlib.Path(__file__).resolve().parent
 _ROOT = _HERE.parent.parent
 
 
-def _parse_trackwrestling(raw_data_dir: pathlib.Path) -> list[bracket_util.MatchV1]:
-    all_matches: list[bracket_util.MatchV1] = []
-
-    for date_str, name in trackwrestling.TOURNAMENT_EVENTS:
-        parent_dir = raw_data_dir / date_str
-        stem = bracket_util.to_kebab_case(name)
-        filename = f"{stem}.json"
-        path = parent_dir / filename
-
-        with open(path) as file_obj:
-            as_json = file_obj.read()
-
-        fetched_event = bracket_util.FetchedEvent.model_validate_json(as_json)
-        rounds_raw = fetched_event.match_html
-
-        rounds = sorted(rounds_raw.keys())
-        for round_ in rounds:
-            html = rounds_raw[round_]
-            all_matches.extend(
-                trackwrestling.parse_tournament_round(html, name, date_str)
-            )
-
-    return all_matches
-
-
-def _parse_trackwrestling_duals(
-    raw_data_dir: pathlib.Path,
-) -> list[bracket_util.MatchV1]:
-    all_matches: list[bracket_util.MatchV1] = []
-
-    for date_str, name in trackwrestling.DUAL_EVENTS:
-        parent_dir = raw_data_dir / date_str
-        stem = bracket_util.to_kebab_case(name)
-        filename = f"{stem}.json"
-        path = parent_dir / filename
-
-        with open(path) as file_obj:
-            as_json = file_obj.read()
-
-        fetched_event = bracket_util.FetchedEvent.model_validate_json(as_json)
-        weights_raw = fetched_event.match_html
-
-        all_matches.extend(trackwrestling.parse_dual_event(weights_raw, name, date_str))
-
-    return all_matches
-
-
-def _parse_usabracketing(raw_data_dir: pathlib.Path) -> list[bracket_util.MatchV1]:
-    all_matches: list[bracket_util.MatchV1] = []
-
-    for date_str, name in usabracketing.TOURNAMENT_EVENTS:
-        parent_dir = raw_data_dir / date_str
-        stem = bracket_util.to_kebab_case(name)
-        filename = f"{stem}.json"
-        path = parent_dir / filename
-
-        with open(path) as file_obj:
-            as_json = file_obj.read()
-
-        fetched_event = bracket_util.FetchedEvent.model_validate_json(as_json)
-        rounds_raw = fetched_event.match_html
-
-        rounds = sorted(rounds_raw.keys())
-        for round_ in rounds:
-            html = rounds_raw[round_]
-            all_matches.extend(
-                usabracketing.parse_tournament_round(html, name, date_str)
-            )
-
-    return all_matches
-
-
-def _parse_usabracketing_duals(
-    raw_data_dir: pathlib.Path,
-) -> list[bracket_util.MatchV1]:
-    all_matches: list[bracket_util.MatchV1] = []
-
-    for date_str, name in usabracketing.DUAL_EVENTS:
-        parent_dir = raw_data_dir / date_str
-        stem = bracket_util.to_kebab_case(name)
-        filename = f"{stem}.json"
-        path = parent_dir / filename
-
-        with open(path) as file_obj:
-            as_json = file_obj.read()
-
-        fetched_event = bracket_util.FetchedEvent.model_validate_json(as_json)
-        weights_raw = fetched_event.match_html
-
-        all_matches.extend(usabracketing.parse_dual_event(weights_raw, name, date_str))
-
-    return all_matches
+def _get_args() -> tuple[int, bool, bool]:
+    parser = argparse.ArgumentParser(description="Parse all fetched events")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes to parse events in",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Re-parse every round instead of using `.parse-cache.sqlite3`",
+    )
+    parser.add_argument(
+        "--bracket-report",
+        dest="bracket_report",
+        action="store_true",
+        help="Print which `classify_bracket()` rule fired for each match",
+    )
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return args.jobs, not args.no_cache, args.bracket_report
+
+
+def _print_bracket_report(all_matches: list[bracket_util.MatchV1]) -> None:
+    """Count how often each `classify_bracket()` rule fired.
+
+    The rules are re-evaluated from the parsed matches (rather than counted
+    while parsing) so the report is the same with cached results or `--jobs`.
+    """
+    tournament_events = {name for _, name in trackwrestling.TOURNAMENT_EVENTS}
+    match_counts: collections.Counter[str] = collections.Counter()
+    brackets: dict[str, set[tuple[str, str]]] = collections.defaultdict(set)
+    for match_ in all_matches:
+        if match_.source != "trackwrestling":
+            continue
+        if match_.event_name not in tournament_events:
+            continue
+
+        rule, _ = bracket_util.classify_bracket_rule(match_.bracket, match_.event_name)
+        match_counts[rule] += 1
+        brackets[rule].add((match_.bracket, match_.event_name))
+
+    rules = bracket_util.bracket_rules() + [bracket_util.NO_BRACKET_RULE]
+    print(f"{'Matches':>8} {'Brackets':>8}  Rule")
+    for rule in rules:
+        print(f"{match_counts[rule]:8d} {len(brackets[rule]):8d}  {rule}")
+
+    unused = sum(1 for rule in rules[:-1] if match_counts[rule] == 0)
+    print(f"{unused} of {len(rules) - 1} rules never fired")
 
 
 def main() -> None:
+    jobs, use_cache, bracket_report = _get_args()
     raw_data_dir = _ROOT / "_raw-data"
 
-    all_matches: list[bracket_util.MatchV1] = []
-    all_matches.extend(_parse_trackwrestling(raw_data_dir))
-    all_matches.extend(_parse_trackwrestling_duals(raw_data_dir))
-    all_matches.extend(_parse_usabracketing(raw_data_dir))
-    all_matches.extend(_parse_usabracketing_duals(raw_data_dir))
+    all_matches = parse_events.parse_all(raw_data_dir, jobs, use_cache=use_cache)
 
     all_matches_file = _ROOT / "_parsed-data" / "all-matches-01.csv"
     with open(all_matches_file, "w") as file_obj:
@@ -119,6 +80,9 @@ def main() -> None:
         for match_ in all_matches:
             writer.writerow(match_.model_dump(mode="json", by_alias=True))
 
+    if bracket_report:
+        _print_bracket_report(all_matches)
+
 
 if __name__ == "__main__":
     main()
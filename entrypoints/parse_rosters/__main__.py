@@ -1,8 +1,7 @@
 import pathlib
 
-import bs4
-
 import club_util
+import html_util
 
 _HERE = pathlib.Path(__file__).resolve().parent
 _ROOT = _HERE.parent.parent
@@ -12,7 +11,7 @@ def _parse_file(path: pathlib.Path) -> club_util.ClubInfo:
     with open(path) as file_obj:
         html = file_obj.read()
 
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
 
     club_divs = soup.find_all("div", id="club")
     if len(club_divs) != 1:
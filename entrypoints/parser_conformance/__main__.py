@@ -0,0 +1,276 @@
+import argparse
+import pathlib
+import runpy
+import time
+import typing
+from collections.abc import Callable, Iterator
+
+import pydantic
+
+import bracket_util
+import html_util
+import parse_cache
+import raw_store
+import trackwrestling
+import usabracketing
+import weight_normalization
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_ROOT = _HERE.parent.parent
+_PRINTOUT_PREFIX = '<div style="font-size:12pt;">'
+_PRINTOUT_SUFFIX = "</div>"
+# NOTE: Entrypoints that parse HTML directly, with the file each produces.
+_ENTRYPOINT_OUTPUTS = (
+    ("entrypoints.parse_rosters", "rosters.json"),
+    ("entrypoints.sectional_qualifiers", "sectional-qualifiers.csv"),
+    ("entrypoints.state_qualifiers", "state-qualifiers.csv"),
+    ("entrypoints.finalize_season", "2026-finalized.json"),
+)
+
+type _BackendCheck = Callable[[pathlib.Path], object]
+
+
+def _get_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check that alternative parsers agree with the reference parser"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rounds_parser = subparsers.add_parser(
+        "rounds",
+        help="Compare the TrackWrestling round parser engines on all of `_raw-data`",
+    )
+    rounds_parser.add_argument(
+        "--event",
+        dest="events",
+        action="append",
+        default=[],
+        help="Only check this event (may be repeated)",
+    )
+    subparsers.add_parser(
+        "backends",
+        help="Compare the output of every `bs4` parser with each HTML backend",
+    )
+    subparsers.add_parser(
+        "construct",
+        help="Compare `bracket_util.construct_trusted()` with the installed `pydantic`",
+    )
+    return parser.parse_args()
+
+
+def _timed_parse(
+    engine: trackwrestling.RoundEngine,
+    html: str,
+    name: str,
+    date_str: str,
+    timings: dict[str, float],
+) -> list[bracket_util.MatchV1]:
+    start = time.perf_counter()
+    matches = trackwrestling.parse_tournament_round(html, name, date_str, engine=engine)
+    timings[engine] = timings.get(engine, 0.0) + time.perf_counter() - start
+    return matches
+
+
+def _check_rounds(raw_data_dir: pathlib.Path, names: list[str]) -> int:
+    # NOTE: The first engine (`"soup"`) is the reference implementation.
+    engines = typing.get_args(trackwrestling.RoundEngine)
+    timings: dict[str, float] = {}
+    round_count = 0
+    match_count = 0
+    mismatches: list[tuple[str, str]] = []
+
+    for date_str, name in trackwrestling.TOURNAMENT_EVENTS:
+        if names and name not in names:
+            continue
+
+        stem = bracket_util.to_kebab_case(name)
+        fetched_event = raw_store.load_event(raw_data_dir / date_str / f"{stem}.json")
+        rounds_raw = fetched_event.match_html
+        for round_ in sorted(rounds_raw.keys()):
+            html = rounds_raw[round_]
+            reference, *others = [
+                _timed_parse(engine, html, name, date_str, timings)
+                for engine in engines
+            ]
+            round_count += 1
+            match_count += len(reference)
+            if any(matches != reference for matches in others):
+                print(f"MISMATCH {name} :: {round_}")
+                mismatches.append((name, round_))
+
+    print(f"Checked {round_count} rounds ({match_count} matches)")
+    reference_seconds = timings.get(engines[0], 0.0)
+    for engine in engines:
+        seconds = timings.get(engine, 0.0)
+        speedup = reference_seconds / seconds if seconds else 0.0
+        print(f"{engine:<8} {seconds:>8.3f}s ({speedup:.2f}x)")
+
+    return len(mismatches)
+
+
+def _stored_events(
+    raw_data_dir: pathlib.Path, events: tuple[tuple[str, str], ...]
+) -> Iterator[tuple[str, str, raw_store.RawEvent]]:
+    for date_str, name in events:
+        stem = bracket_util.to_kebab_case(name)
+        fetched_event = raw_store.load_event(raw_data_dir / date_str / f"{stem}.json")
+        yield date_str, name, fetched_event
+
+
+def _trackwrestling_rounds(raw_data_dir: pathlib.Path) -> object:
+    return [
+        trackwrestling.parse_tournament_round(
+            fetched_event.match_html[round_], name, date_str, engine="soup"
+        )
+        for date_str, name, fetched_event in _stored_events(
+            raw_data_dir, trackwrestling.TOURNAMENT_EVENTS
+        )
+        for round_ in sorted(fetched_event.match_html.keys())
+    ]
+
+
+def _trackwrestling_duals(raw_data_dir: pathlib.Path) -> object:
+    return [
+        trackwrestling.parse_dual_event(fetched_event.match_html, name, date_str)
+        for date_str, name, fetched_event in _stored_events(
+            raw_data_dir, trackwrestling.DUAL_EVENTS
+        )
+    ]
+
+
+def _usabracketing_rounds(raw_data_dir: pathlib.Path) -> object:
+    return [
+        usabracketing.parse_tournament_round(
+            fetched_event.match_html[round_], name, date_str
+        )
+        for date_str, name, fetched_event in _stored_events(
+            raw_data_dir, usabracketing.TOURNAMENT_EVENTS
+        )
+        for round_ in sorted(fetched_event.match_html.keys())
+    ]
+
+
+def _usabracketing_duals(raw_data_dir: pathlib.Path) -> object:
+    return [
+        usabracketing.parse_dual_event(fetched_event.match_html, name, date_str)
+        for date_str, name, fetched_event in _stored_events(
+            raw_data_dir, usabracketing.DUAL_EVENTS
+        )
+    ]
+
+
+def _usabracketing_dual_printouts(raw_data_dir: pathlib.Path) -> object:
+    """Split a printout of all weights, rebuilt from the stored printouts."""
+    all_split: list[dict[str, str]] = []
+    for _, _, fetched_event in _stored_events(raw_data_dir, usabracketing.DUAL_EVENTS):
+        inner_parts: list[str] = []
+        for key, html in fetched_event.match_html.items():
+            if not html.startswith(_PRINTOUT_PREFIX):
+                raise ValueError("Unexpected printout", key)
+            end = html.rindex(_PRINTOUT_SUFFIX)
+            inner_parts.append(html[len(_PRINTOUT_PREFIX) : end])
+
+        combined = f"{_PRINTOUT_PREFIX}{''.join(inner_parts)}{_PRINTOUT_SUFFIX}"
+        labels = list(fetched_event.match_html.keys())
+        all_split.append(usabracketing._split_weights_printout(combined, labels))
+
+    return all_split
+
+
+def _athlete_weights(raw_data_dir: pathlib.Path) -> object:
+    # NOTE: Parse the weights exactly as `normalize_weights` does, since some
+    #       events need their ignored weigh-ins.
+    return weight_normalization.parse_all_weights()
+
+
+def _run_entrypoint(module_name: str, path: pathlib.Path) -> bytes | str:
+    """Run an entrypoint and return the file it writes (or the error it raised).
+
+    The file is restored afterwards, so each entrypoint reads the committed
+    outputs of the others. An entrypoint that fails (e.g. because `_raw-data`
+    has moved on from a committed roster) must fail the same way with every
+    backend.
+    """
+    original = path.read_bytes() if path.exists() else None
+    try:
+        runpy.run_module(module_name, run_name="__main__")
+        return path.read_bytes()
+    except Exception as exc:
+        return repr(exc)
+    finally:
+        if original is None:
+            path.unlink(missing_ok=True)
+        else:
+            path.write_bytes(original)
+
+
+def _entrypoint_outputs(raw_data_dir: pathlib.Path) -> object:
+    parsed_data_dir = raw_data_dir.parent / "_parsed-data"
+    return [
+        _run_entrypoint(module_name, parsed_data_dir / filename)
+        for module_name, filename in _ENTRYPOINT_OUTPUTS
+    ]
+
+
+_BACKEND_CHECKS: tuple[tuple[str, _BackendCheck], ...] = (
+    ("trackwrestling rounds (soup)", _trackwrestling_rounds),
+    ("trackwrestling duals", _trackwrestling_duals),
+    ("usabracketing rounds", _usabracketing_rounds),
+    ("usabracketing duals", _usabracketing_duals),
+    ("usabracketing dual printouts", _usabracketing_dual_printouts),
+    ("athlete weights", _athlete_weights),
+    ("entrypoint outputs", _entrypoint_outputs),
+)
+
+
+def _check_backends(raw_data_dir: pathlib.Path) -> int:
+    # NOTE: The fallback (`html.parser`) is last and is the reference.
+    backends = html_util.available_backends()
+    print(f"Backends: {', '.join(backends)} (default: {html_util.current_backend()})")
+
+    mismatch_count = 0
+    for label, check in _BACKEND_CHECKS:
+        results: dict[str, object] = {}
+        seconds: dict[str, float] = {}
+        for backend in backends:
+            with html_util.use_backend(backend):
+                start = time.perf_counter()
+                results[backend] = check(raw_data_dir)
+                seconds[backend] = time.perf_counter() - start
+
+        reference = results[backends[-1]]
+        agrees = all(result == reference for result in results.values())
+        if not agrees:
+            mismatch_count += 1
+
+        status = "OK" if agrees else "MISMATCH"
+        timings = " ".join(f"{backend}={seconds[backend]:.3f}s" for backend in backends)
+        print(f"{status:<8} {label:<30} {timings}")
+
+    return mismatch_count
+
+
+def main() -> None:
+    args = _get_args()
+    # NOTE: Every parser must actually run, rather than returning the result
+    #       cached by the previous engine / backend.
+    parse_cache.set_enabled(False)
+    raw_data_dir = _ROOT / "_raw-data"
+
+    if args.command == "rounds":
+        mismatch_count = _check_rounds(raw_data_dir, args.events)
+        if mismatch_count:
+            raise RuntimeError("Parser engines disagree", mismatch_count)
+
+    if args.command == "backends":
+        mismatch_count = _check_backends(raw_data_dir)
+        if mismatch_count:
+            raise RuntimeError("HTML backends disagree", mismatch_count)
+
+    if args.command == "construct":
+        bracket_util.check_construct_trusted()
+        print(f"OK       construct_trusted() with pydantic {pydantic.VERSION}")
+
+
+if __name__ == "__main__":
+    main()
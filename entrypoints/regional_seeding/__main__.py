@@ -263,7 +263,6 @@ def main() -> None:
     entries_filename, seeding_filename = _get_filenames()
 
     entries = _load_entries(entries_filename)
-    matches_v4 = projection.load_matches_v4()
     rosters = club_util.load_rosters()
     state_qualifiers = club_util.load_state_qualifiers()
 
@@ -271,14 +270,7 @@ def main() -> None:
 
     athlete_lookup = _make_roster_reverse(rosters, all_usaw_numbers)
 
-    relevant_matches = [
-        match_
-        for match_ in matches_v4
-        if (
-            match_.winner_usaw_number in all_usaw_numbers
-            or match_.loser_usaw_number in all_usaw_numbers
-        )
-    ]
+    relevant_matches = projection.matches_for_usaw(all_usaw_numbers)
     match_lookup = _map_by_usaw(relevant_matches, all_usaw_numbers)
 
     csv_weight_classes: dict[tuple[bracket_util.Division, int], _WeightClass] = {}
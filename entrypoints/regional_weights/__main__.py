@@ -23,20 +23,12 @@ def _entry_sort_key(entry: _Entry) -> tuple[int, int, str, str, str]:
 
 def _generate_regional_entries(
     teams: list[str],
-    matches_v4: list[bracket_util.MatchV4],
     rosters: list[club_util.ClubInfo],
 ) -> list[_Entry]:
     team_names = set(teams)
     teams_in_regional = [roster for roster in rosters if roster.club_name in team_names]
 
-    relevant_matches = [
-        match_
-        for match_ in matches_v4
-        if (
-            match_.winner_team_normalized in team_names
-            or match_.loser_team_normalized in team_names
-        )
-    ]
+    relevant_matches = projection.matches_for_teams(team_names)
     team_mapped = projection.map_by_team(relevant_matches, team_names)
 
     weight_by_usaw: dict[str, tuple[bracket_util.Division, int]] = {}
@@ -80,7 +72,6 @@ def _generate_regional_entries(
 
 
 def main() -> None:
-    matches_v4 = projection.load_matches_v4()
     rosters = club_util.load_rosters()
     regional_assignments = projection.get_regional_assignments()
 
@@ -89,7 +80,7 @@ def main() -> None:
         _, location = name.split(" :: ")
         if location == "No Regional":
             continue
-        entries = _generate_regional_entries(teams, matches_v4, rosters)
+        entries = _generate_regional_entries(teams, rosters)
         if name in by_regional:
             raise KeyError("Repeat regional", name)
         by_regional[name] = entries
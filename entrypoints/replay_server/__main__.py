@@ -0,0 +1,29 @@
+import argparse
+
+import replay_server
+
+
+def _get_port() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve a local TrackWrestling stand-in from `_raw-data`"
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    return args.port
+
+
+def main() -> None:
+    port = _get_port()
+    server = replay_server.ReplayServer(port=port)
+    print(f"Serving on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
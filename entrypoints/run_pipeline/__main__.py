@@ -0,0 +1,111 @@
+import argparse
+import csv
+import pathlib
+import time
+from collections.abc import Sequence
+
+import athlete_normalization
+import bracket_util
+import match_snapshot
+import parse_cache
+import parse_events
+import team_normalization
+import weight_normalization
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_ROOT = _HERE.parent.parent
+
+
+def _get_args() -> tuple[int, bool, bool]:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run parse_matches, normalize_teams, normalize_athletes and "
+            "normalize_weights in one process, keeping matches in memory"
+        )
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes to parse events in",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help=(
+            "Re-parse all HTML and re-resolve all teams instead of using "
+            "`.parse-cache.sqlite3` and `team-resolutions.json`"
+        ),
+    )
+    parser.add_argument(
+        "--intermediate",
+        action="store_true",
+        help="Also write `all-matches-01.csv` through `all-matches-03.csv`",
+    )
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return args.jobs, not args.no_cache, args.intermediate
+
+
+def _write_matches(
+    filename: str,
+    field_names: tuple[str, ...],
+    matches: Sequence[bracket_util.MatchV1],
+) -> None:
+    path = _ROOT / "_parsed-data" / filename
+    with open(path, "w") as file_obj:
+        writer = csv.DictWriter(file_obj, fieldnames=field_names)
+        writer.writeheader()
+        for match_ in matches:
+            writer.writerow(match_.model_dump(mode="json", by_alias=True))
+
+
+def _log_stage(stage: str, start: float, matches: Sequence[object]) -> None:
+    duration = time.perf_counter() - start
+    print(f"{stage:<20} {duration:>7.1f}s {len(matches):>8} matches")
+
+
+def main() -> None:
+    jobs, use_cache, intermediate = _get_args()
+    parse_cache.set_enabled(use_cache)
+    raw_data_dir = _ROOT / "_raw-data"
+
+    start = time.perf_counter()
+    matches_v1 = parse_events.parse_all(raw_data_dir, jobs, use_cache=use_cache)
+    _log_stage("parse_matches", start, matches_v1)
+    if intermediate:
+        _write_matches(
+            "all-matches-01.csv", bracket_util.CSV_FIELD_NAMES_V1, matches_v1
+        )
+
+    start = time.perf_counter()
+    matches_v2 = team_normalization.normalize_matches(matches_v1, use_cache=use_cache)
+    _log_stage("normalize_teams", start, matches_v2)
+    if intermediate:
+        _write_matches(
+            "all-matches-02.csv", bracket_util.CSV_FIELD_NAMES_V2, matches_v2
+        )
+
+    start = time.perf_counter()
+    matches_v3 = athlete_normalization.normalize_matches(matches_v2)
+    _log_stage("normalize_athletes", start, matches_v3)
+    if intermediate:
+        _write_matches(
+            "all-matches-03.csv", bracket_util.CSV_FIELD_NAMES_V3, matches_v3
+        )
+
+    start = time.perf_counter()
+    matches_v4 = weight_normalization.normalize_matches(matches_v3)
+    _log_stage("normalize_weights", start, matches_v4)
+    _write_matches("all-matches-04.csv", bracket_util.CSV_FIELD_NAMES_V4, matches_v4)
+    match_snapshot.write_snapshot(
+        _ROOT / "_parsed-data" / "all-matches-04.csv", matches_v4
+    )
+
+
+if __name__ == "__main__":
+    main()
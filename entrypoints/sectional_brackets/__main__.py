@@ -171,21 +171,13 @@ def _weight_class_sort_func(key: tuple[bracket_util.Division, int]) -> tuple[int
 
 def _generate_sectional_file(
     sectional: club_util.Sectional,
-    matches_v4: list[bracket_util.MatchV4],
     rosters: list[club_util.ClubInfo],
     state_qualifiers: dict[str, dict[str, club_util.StateQualifier]],
 ) -> None:
     teams_in_sectional = [roster for roster in rosters if roster.sectional == sectional]
     team_names = set([roster.club_name for roster in teams_in_sectional])
 
-    relevant_matches = [
-        match_
-        for match_ in matches_v4
-        if (
-            match_.winner_team_normalized in team_names
-            or match_.loser_team_normalized in team_names
-        )
-    ]
+    relevant_matches = projection.matches_for_teams(team_names)
     team_mapped = projection.map_by_team(relevant_matches, team_names)
 
     weight_classes: dict[tuple[bracket_util.Division, int], _WeightClass] = {}
@@ -252,7 +244,6 @@ def _generate_sectional_file(
 
 
 def main() -> None:
-    matches_v4 = projection.load_matches_v4()
     rosters = club_util.load_rosters()
     state_qualifiers = club_util.load_state_qualifiers()
 
@@ -267,7 +258,7 @@ def main() -> None:
         "West",
     )
     for sectional in sectionals:
-        _generate_sectional_file(sectional, matches_v4, rosters, state_qualifiers)
+        _generate_sectional_file(sectional, rosters, state_qualifiers)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from selenium.webdriver.support import expected_conditions as EC  # noqa: N812
 from selenium.webdriver.support.ui import WebDriverWait
 
 import bracket_util
+import html_util
 import usabracketing
 
 _WAIT_TIME = 3
@@ -193,7 +194,7 @@ def _extract_athlete(td: bs4.Tag) -> tuple[str, str] | None:
 
 
 def _extract_bracket(key: str, html: str) -> _WeightClass:
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
     bracket_spans = soup.find_all(
         "span", class_="font-gotham antialiased text-xl text-usa-red font-extrabold"
     )
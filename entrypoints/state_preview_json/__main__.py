@@ -601,7 +601,6 @@ def _resolve_all_usaw(
 
 
 def _generate_json_file(
-    matches_v4: list[bracket_util.MatchV4],
     athlete_matcher: _AthleteMatcher,
     state_qualifiers: dict[str, tuple[_StateQualifier, club_util.Athlete]],
     previous_state_qualifiers: dict[str, dict[str, club_util.StateQualifier]],
@@ -611,14 +610,7 @@ def _generate_json_file(
 ) -> None:
     team_names = set(athlete_matcher.keys())
 
-    relevant_matches = [
-        match_
-        for match_ in matches_v4
-        if (
-            match_.winner_team_normalized in team_names
-            or match_.loser_team_normalized in team_names
-        )
-    ]
+    relevant_matches = projection.matches_for_teams(team_names)
     team_mapped = projection.map_by_team(relevant_matches, team_names)
 
     entire_field: dict[str, tuple[bracket_util.Division, int]] = {}
@@ -763,7 +755,6 @@ def _load_csv_state_qualifiers() -> list[_CSVStateQualifier]:
 
 
 def main() -> None:
-    matches_v4 = projection.load_matches_v4()
     rosters = club_util.load_rosters()
     athlete_matcher = _make_athlete_matcher(rosters)
     previous_state_qualifiers = club_util.load_state_qualifiers()
@@ -780,7 +771,6 @@ def main() -> None:
         placement_by_usaw[usaw_number] = csv_state_qualifier.placement
 
     _generate_json_file(
-        matches_v4,
         athlete_matcher,
         state_qualifiers,
         previous_state_qualifiers,
@@ -7,6 +7,7 @@ import pydantic
 
 import bracket_util
 import club_util
+import html_util
 
 _HERE = pathlib.Path(__file__).resolve().parent
 _ROOT = _HERE.parent.parent
@@ -180,7 +181,7 @@ def _add_qualifiers(
     with open(path) as file_obj:
         html = file_obj.read()
 
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
     (parent_div,) = soup.find_all("div", style="font-size:12pt;")
     direct_divs = parent_div.find_all("div", recursive=False)
 
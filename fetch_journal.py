@@ -0,0 +1,122 @@
+import json
+import pathlib
+from collections.abc import Callable
+
+import pydantic
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class _JournalEntry(_ForbidExtra):
+    section: str
+    key: str
+    html: str | None
+
+
+class Checkpoint:
+    """Captured HTML for one section (e.g. `match_html`) of a fetched event.
+
+    A value of `None` means the key was visited but had nothing to capture
+    (e.g. a round with no results), so it should not be visited again.
+    """
+
+    def __init__(self, journal: Journal, section: str) -> None:
+        self._journal = journal
+        self._section = section
+        self._captured: dict[str, str | None] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._captured
+
+    def __len__(self) -> int:
+        return len(self._captured)
+
+    def get(self, key: str) -> str | None:
+        return self._captured[key]
+
+    def restore(self, key: str, html: str | None) -> None:
+        self._captured[key] = html
+
+    def record(self, key: str, html: str | None) -> None:
+        self._captured[key] = html
+        self._journal.append(self._section, key, html)
+
+
+class Journal:
+    """An append-only, on-disk log of HTML captured while fetching an event.
+
+    Each captured round or page is written as a single JSON line as soon as it
+    arrives so that a crashed fetch can resume where it left off.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self._path = path
+        self._checkpoints: dict[str, Checkpoint] = {}
+
+        if not path.exists():
+            return
+
+        with open(path) as file_obj:
+            lines = file_obj.readlines()
+
+        for i, line in enumerate(lines):
+            try:
+                entry = _JournalEntry.model_validate_json(line)
+            except pydantic.ValidationError:
+                # NOTE: A crash in the middle of a write can only damage the
+                #       final line, so drop it before appending anything new.
+                if i != len(lines) - 1:
+                    raise
+
+                with open(path, "w") as file_obj:
+                    file_obj.writelines(lines[:-1])
+                break
+
+            self.checkpoint(entry.section).restore(entry.key, entry.html)
+
+    def checkpoint(self, section: str) -> Checkpoint:
+        checkpoint = self._checkpoints.get(section)
+        if checkpoint is None:
+            checkpoint = Checkpoint(self, section)
+            self._checkpoints[section] = checkpoint
+
+        return checkpoint
+
+    def append(self, section: str, key: str, html: str | None) -> None:
+        entry = {"section": section, "key": key, "html": html}
+        with open(self._path, "a") as file_obj:
+            file_obj.write(json.dumps(entry))
+            file_obj.write("\n")
+
+    def remove(self) -> None:
+        self._path.unlink(missing_ok=True)
+
+
+def journal_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(f"{path.stem}.journal.jsonl")
+
+
+def open_journal(path: pathlib.Path) -> Journal:
+    """Open (or resume) the journal for the event stored at `path`.
+
+    The journal holds every round / page captured so far, so a failed fetch
+    can be restarted without starting over.
+    """
+    return Journal(journal_path(path))
+
+
+def capture(
+    checkpoint: Checkpoint | None, key: str, capture_func: Callable[[], str | None]
+) -> str | None:
+    """Capture the HTML for `key` unless it was captured by an earlier attempt."""
+    if checkpoint is None:
+        return capture_func()
+
+    if key in checkpoint:
+        return checkpoint.get(key)
+
+    html = capture_func()
+    checkpoint.record(key, html)
+    return html
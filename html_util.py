@@ -0,0 +1,66 @@
+import contextlib
+import importlib.util
+import os
+from collections.abc import Iterator
+
+import bs4
+
+_ENV_VAR = "HTML_PARSER"
+_FALLBACK_BACKEND = "html.parser"
+# NOTE: In order of preference, with the module each backend needs.
+_FAST_BACKENDS = (("lxml", "lxml"),)
+
+
+def available_backends() -> list[str]:
+    """The `bs4` backends that can be used, the fallback is always last."""
+    backends = [
+        backend
+        for backend, module_name in _FAST_BACKENDS
+        if importlib.util.find_spec(module_name) is not None
+    ]
+    backends.append(_FALLBACK_BACKEND)
+    return backends
+
+
+def _default_backend() -> str:
+    backends = available_backends()
+    override = os.environ.get(_ENV_VAR)
+    if not override:
+        return backends[0]
+
+    if override not in backends:
+        raise ValueError("Unavailable HTML parser", _ENV_VAR, override, backends)
+
+    return override
+
+
+_backend = _default_backend()
+
+
+def current_backend() -> str:
+    return _backend
+
+
+def make_soup(html: str) -> bs4.BeautifulSoup:
+    """Parse `html` with the fastest available backend.
+
+    Set `HTML_PARSER=html.parser` (or another backend) to override the choice;
+    `entrypoints.parser_conformance backends` checks that every parser
+    extracts the same data with each available backend.
+    """
+    return bs4.BeautifulSoup(html, features=_backend)
+
+
+@contextlib.contextmanager
+def use_backend(backend: str) -> Iterator[None]:
+    global _backend
+
+    if backend not in available_backends():
+        raise ValueError("Unavailable HTML parser", backend)
+
+    previous = _backend
+    _backend = backend
+    try:
+        yield
+    finally:
+        _backend = previous
@@ -0,0 +1,131 @@
+import json
+import mmap
+import pathlib
+import re
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+type _Span = tuple[int, int]
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+# NOTE: The quantifiers are possessive so `re` doesn't keep backtracking state
+#       for every escape in a (very long) HTML string.
+_STRING = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"')
+_SCALAR = re.compile(rb"[^,}\]\s]+")
+# NOTE: Strings are matched (and skipped) as a whole so that brackets inside
+#       them are ignored; group 1 / 2 are the opening / closing brackets.
+_NESTED_TOKEN = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"|([\[{])|([\]}])')
+_OPEN_GROUP = 1
+_CLOSE_GROUP = 2
+
+
+def _skip_whitespace(buffer: mmap.mmap, position: int) -> int:
+    match = _WHITESPACE.match(buffer, position)
+    if match is None:
+        return position
+
+    return match.end()
+
+
+def _value_end(buffer: mmap.mmap, position: int) -> int:
+    """Find the end of the JSON value at `position` without decoding it."""
+    first = buffer[position : position + 1]
+    if first == b'"':
+        match = _STRING.match(buffer, position)
+        if match is None:
+            raise ValueError("Unterminated JSON string", position)
+        return match.end()
+
+    if first in (b"{", b"["):
+        depth = 0
+        for match in _NESTED_TOKEN.finditer(buffer, position):
+            # NOTE: Check the group instead of `match.group()` to avoid copying
+            #       every skipped string out of the buffer.
+            if match.lastindex == _OPEN_GROUP:
+                depth += 1
+            elif match.lastindex == _CLOSE_GROUP:
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+
+        raise ValueError("Unterminated JSON container", position)
+
+    match = _SCALAR.match(buffer, position)
+    if match is None:
+        raise ValueError("Expected a JSON value", position)
+
+    return match.end()
+
+
+def _expect(buffer: mmap.mmap, position: int, char: bytes) -> int:
+    if buffer[position : position + 1] != char:
+        raise ValueError("Unexpected JSON token", position, char)
+
+    return position + 1
+
+
+def _object_spans(buffer: mmap.mmap, start: int) -> dict[str, _Span]:
+    """Index the `key -> value` byte spans of the JSON object at `start`."""
+    position = _skip_whitespace(buffer, start)
+    position = _skip_whitespace(buffer, _expect(buffer, position, b"{"))
+
+    spans: dict[str, _Span] = {}
+    if buffer[position : position + 1] == b"}":
+        return spans
+
+    while True:
+        if buffer[position : position + 1] != b'"':
+            raise ValueError("Expected a JSON object key", position)
+        key_end = _value_end(buffer, position)
+        key = json.loads(buffer[position:key_end])
+
+        position = _skip_whitespace(buffer, key_end)
+        value_start = _skip_whitespace(buffer, _expect(buffer, position, b":"))
+        value_end = _value_end(buffer, value_start)
+        spans[key] = (value_start, value_end)
+
+        position = _skip_whitespace(buffer, value_end)
+        if buffer[position : position + 1] == b"}":
+            return spans
+
+        position = _skip_whitespace(buffer, _expect(buffer, position, b","))
+
+
+class LazyObject(Mapping[str, Any]):
+    """A JSON object whose values are only decoded when they are accessed.
+
+    Keys are indexed up front by scanning (not decoding) the raw bytes, so a
+    large value that is never accessed is never copied out of the buffer.
+    """
+
+    def __init__(self, buffer: mmap.mmap, start: int = 0) -> None:
+        self._buffer = buffer
+        self._spans = _object_spans(buffer, start)
+
+    def __getitem__(self, key: str) -> Any:
+        start, end = self._spans[key]
+        return json.loads(self._buffer[start:end])
+
+    def __contains__(self, key: object) -> bool:
+        # NOTE: `Mapping.__contains__` would decode the value.
+        return key in self._spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def object(self, key: str) -> LazyObject:
+        """Index the nested object at `key` (again without decoding it)."""
+        start, _ = self._spans[key]
+        return LazyObject(self._buffer, start)
+
+
+def open_object(path: pathlib.Path) -> LazyObject:
+    with open(path, "rb") as file_obj:
+        # NOTE: The map stays valid after the file is closed and is released
+        #       once the last `LazyObject` using it is garbage collected.
+        buffer = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return LazyObject(buffer)
@@ -0,0 +1,197 @@
+import os
+import pathlib
+import shutil
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+import pydantic
+
+import bracket_util
+
+_VERSION = 1
+_META_FILENAME = "meta.json"
+_SNAPSHOT_SUFFIX = ".columns"
+_NULL_CODE = -1
+_NULL_INT = -1
+
+# NOTE: How each `MatchV4` field is stored:
+#       - "strings": `{field}.codes.npy` (int32 indices, `-1` for `None`) into
+#         `{field}.values.npy` (the distinct strings)
+#       - "date": `{field}.npy` as `datetime64[D]`
+#       - "int": `{field}.npy` as int32 (`-1` for `None`)
+#       - "float": `{field}.npy` as float64 (NaN for `None`)
+_Kind = Literal["strings", "date", "int", "float"]
+_COLUMNS: tuple[tuple[str, _Kind], ...] = (
+    ("event_name", "strings"),
+    ("event_date", "date"),
+    ("bracket", "strings"),
+    ("round_", "strings"),
+    ("division", "strings"),
+    ("winner", "strings"),
+    ("winner_team", "strings"),
+    ("loser", "strings"),
+    ("loser_team", "strings"),
+    ("result", "strings"),
+    ("result_type", "strings"),
+    ("source", "strings"),
+    ("winner_team_normalized", "strings"),
+    ("loser_team_normalized", "strings"),
+    ("winner_normalized", "strings"),
+    ("winner_usaw_number", "strings"),
+    ("winner_ikwf_age", "int"),
+    ("loser_normalized", "strings"),
+    ("loser_usaw_number", "strings"),
+    ("loser_ikwf_age", "int"),
+    ("winner_weight", "float"),
+    ("loser_weight", "float"),
+)
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class _Meta(_ForbidExtra):
+    version: int
+    rows: int
+    csv_size: int
+    csv_mtime_ns: int
+
+
+def _snapshot_dir(csv_path: pathlib.Path) -> pathlib.Path:
+    return csv_path.with_name(f"{csv_path.stem}{_SNAPSHOT_SUFFIX}")
+
+
+def _check_columns() -> None:
+    fields = tuple(bracket_util.MatchV4.model_fields)
+    if tuple(sorted(field for field, _ in _COLUMNS)) != tuple(sorted(fields)):
+        raise RuntimeError("Snapshot columns do not match MatchV4", fields)
+
+
+def _is_nullable(field: str) -> bool:
+    annotation = bracket_util.MatchV4.model_fields[field].annotation
+    return type(None) in getattr(annotation, "__args__", ())
+
+
+def _save_strings(
+    directory: pathlib.Path, field: str, values: list[str | None], nullable: bool
+) -> None:
+    index: dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        # NOTE: Match reading the CSV, where an empty nullable value is `None`.
+        if value is None or (nullable and value == ""):
+            codes[i] = _NULL_CODE
+            continue
+        codes[i] = index.setdefault(value, len(index))
+
+    np.save(directory / f"{field}.codes.npy", codes)
+    np.save(directory / f"{field}.values.npy", np.array(list(index), dtype=np.str_))
+
+
+def _save_column(
+    directory: pathlib.Path,
+    field: str,
+    kind: _Kind,
+    matches: Sequence[bracket_util.MatchV4],
+) -> None:
+    values = [getattr(match_, field) for match_ in matches]
+    if kind == "strings":
+        _save_strings(directory, field, values, _is_nullable(field))
+        return
+
+    if kind == "date":
+        array = np.array(values, dtype="datetime64[D]")
+    elif kind == "int":
+        array = np.array(
+            [_NULL_INT if value is None else value for value in values],
+            dtype=np.int32,
+        )
+    else:
+        array = np.array(
+            [np.nan if value is None else value for value in values],
+            dtype=np.float64,
+        )
+    np.save(directory / f"{field}.npy", array)
+
+
+def write_snapshot(
+    csv_path: pathlib.Path, matches: Sequence[bracket_util.MatchV4]
+) -> None:
+    """Write the columnar snapshot of `matches`, which were just written to CSV.
+
+    The snapshot records the size and mtime of `csv_path` and is only used
+    while they are unchanged.
+    """
+    _check_columns()
+    directory = _snapshot_dir(csv_path)
+    partial = directory.with_name(f"{directory.name}.{os.getpid()}.partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir()
+
+    for field, kind in _COLUMNS:
+        _save_column(partial, field, kind, matches)
+
+    stat = csv_path.stat()
+    meta = _Meta(
+        version=_VERSION,
+        rows=len(matches),
+        csv_size=stat.st_size,
+        csv_mtime_ns=stat.st_mtime_ns,
+    )
+    with open(partial / _META_FILENAME, "w") as file_obj:
+        file_obj.write(meta.model_dump_json(indent=2))
+        file_obj.write("\n")
+
+    shutil.rmtree(directory, ignore_errors=True)
+    partial.rename(directory)
+
+
+def _load_column(directory: pathlib.Path, field: str, kind: _Kind) -> list[object]:
+    if kind == "strings":
+        codes = np.load(directory / f"{field}.codes.npy", mmap_mode="r")
+        values: list[object] = np.load(directory / f"{field}.values.npy").tolist()
+        # NOTE: `_NULL_CODE` (-1) indexes this trailing `None`.
+        values.append(None)
+        return [values[code] for code in codes.tolist()]
+
+    array = np.load(directory / f"{field}.npy", mmap_mode="r")
+    as_list: list[object] = array.tolist()
+    if kind == "int":
+        return [None if value == _NULL_INT else value for value in as_list]
+    if kind == "float":
+        return [None if value != value else value for value in as_list]
+    return as_list
+
+
+def load_snapshot(csv_path: pathlib.Path) -> list[bracket_util.MatchV4] | None:
+    """Load matches from the snapshot of `csv_path`, if it is up to date."""
+    directory = _snapshot_dir(csv_path)
+    meta_path = directory / _META_FILENAME
+    if not meta_path.exists() or not csv_path.exists():
+        return None
+
+    with open(meta_path, "rb") as file_obj:
+        meta = _Meta.model_validate_json(file_obj.read())
+
+    stat = csv_path.stat()
+    if (
+        meta.version != _VERSION
+        or meta.csv_size != stat.st_size
+        or meta.csv_mtime_ns != stat.st_mtime_ns
+    ):
+        return None
+
+    fields = [field for field, _ in _COLUMNS]
+    columns = [_load_column(directory, field, kind) for field, kind in _COLUMNS]
+    if any(len(column) != meta.rows for column in columns):
+        raise RuntimeError("Snapshot is truncated", directory)
+
+    # NOTE: The values were validated before the snapshot was written.
+    return [
+        bracket_util.construct_trusted(
+            bracket_util.MatchV4, dict(zip(fields, row, strict=True))
+        )
+        for row in zip(*columns, strict=True)
+    ]
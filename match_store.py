@@ -0,0 +1,157 @@
+import datetime
+import json
+import os
+import pathlib
+import sqlite3
+from collections.abc import Iterable, Sequence
+
+import bracket_util
+
+_VERSION = 1
+_INDEXED_COLUMNS = (
+    "winner_usaw_number",
+    "loser_usaw_number",
+    "winner_team_normalized",
+    "loser_team_normalized",
+    "event_name",
+    "division",
+)
+_BATCH_SIZE = 10_000
+
+
+def _columns() -> tuple[str, ...]:
+    return tuple(bracket_util.MatchV4.model_fields)
+
+
+def write_store(
+    db_path: pathlib.Path,
+    csv_path: pathlib.Path,
+    matches: Sequence[bracket_util.MatchV4],
+) -> None:
+    """Write `matches` (as read from `csv_path`) to a SQLite database.
+
+    The `matches` table has one column per `MatchV4` field (with `event_date`
+    as an ISO date) plus `row_number`, the row in the CSV. The size and mtime
+    of `csv_path` are recorded so a stale database is not used.
+    """
+    columns = _columns()
+    partial = db_path.with_name(f"{db_path.name}.{os.getpid()}.partial")
+    partial.unlink(missing_ok=True)
+
+    connection = sqlite3.connect(partial)
+    with connection:
+        connection.execute(
+            f"CREATE TABLE matches (row_number INTEGER PRIMARY KEY, "
+            f"{', '.join(columns)})"
+        )
+        placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+        insert = f"INSERT INTO matches VALUES ({placeholders})"
+        for start in range(0, len(matches), _BATCH_SIZE):
+            batch = matches[start : start + _BATCH_SIZE]
+            connection.executemany(
+                insert,
+                (
+                    (start + i, *_to_row(match_, columns))
+                    for i, match_ in enumerate(batch)
+                ),
+            )
+
+        for column in _INDEXED_COLUMNS:
+            connection.execute(f"CREATE INDEX matches_{column} ON matches ({column})")
+
+        stat = csv_path.stat()
+        connection.execute(
+            "CREATE TABLE meta (version INTEGER, csv_size INTEGER, "
+            "csv_mtime_ns INTEGER)"
+        )
+        connection.execute(
+            "INSERT INTO meta VALUES (?, ?, ?)",
+            (_VERSION, stat.st_size, stat.st_mtime_ns),
+        )
+    connection.close()
+
+    partial.replace(db_path)
+
+
+def _to_row(match_: bracket_util.MatchV4, columns: tuple[str, ...]) -> list[object]:
+    row: list[object] = []
+    for column in columns:
+        value = getattr(match_, column)
+        if isinstance(value, datetime.date):
+            value = value.isoformat()
+        row.append(value)
+    return row
+
+
+def _connect(
+    db_path: pathlib.Path, csv_path: pathlib.Path
+) -> sqlite3.Connection | None:
+    if not db_path.exists() or not csv_path.exists():
+        return None
+
+    connection = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    stat = csv_path.stat()
+    try:
+        meta = connection.execute(
+            "SELECT version, csv_size, csv_mtime_ns FROM meta"
+        ).fetchone()
+    except sqlite3.DatabaseError:
+        # NOTE: An older (or foreign) database, e.g. without a `meta` table.
+        meta = None
+
+    if meta != (_VERSION, stat.st_size, stat.st_mtime_ns):
+        connection.close()
+        return None
+
+    return connection
+
+
+def _query(
+    db_path: pathlib.Path, csv_path: pathlib.Path, where: str, values: Iterable[str]
+) -> list[bracket_util.MatchV4] | None:
+    connection = _connect(db_path, csv_path)
+    if connection is None:
+        return None
+
+    columns = _columns()
+    # NOTE: `json_each()` avoids a limit on the number of `?` parameters.
+    values_json = json.dumps(sorted(set(values)))
+    rows = connection.execute(
+        f"SELECT {', '.join(columns)} FROM matches WHERE {where} ORDER BY row_number",
+        {"values": values_json},
+    ).fetchall()
+    connection.close()
+
+    matches: list[bracket_util.MatchV4] = []
+    for row in rows:
+        data = dict(zip(columns, row, strict=True))
+        data["event_date"] = datetime.date.fromisoformat(data["event_date"])
+        # NOTE: The values were validated before the database was written.
+        matches.append(bracket_util.construct_trusted(bracket_util.MatchV4, data))
+    return matches
+
+
+def matches_for_usaw(
+    db_path: pathlib.Path, csv_path: pathlib.Path, usaw_numbers: Iterable[str]
+) -> list[bracket_util.MatchV4] | None:
+    """Matches with either athlete in `usaw_numbers`, or `None` if stale."""
+    return _query(
+        db_path,
+        csv_path,
+        "winner_usaw_number IN (SELECT value FROM json_each(:values)) "
+        "OR loser_usaw_number IN (SELECT value FROM json_each(:values))",
+        usaw_numbers,
+    )
+
+
+def matches_for_teams(
+    db_path: pathlib.Path, csv_path: pathlib.Path, team_names: Iterable[str]
+) -> list[bracket_util.MatchV4] | None:
+    """Matches with either (normalized) team in `team_names`, or `None` if stale."""
+    return _query(
+        db_path,
+        csv_path,
+        "winner_team_normalized IN (SELECT value FROM json_each(:values)) "
+        "OR loser_team_normalized IN (SELECT value FROM json_each(:values))",
+        team_names,
+    )
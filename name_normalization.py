@@ -0,0 +1,109 @@
+import functools
+import re
+from collections.abc import Mapping
+
+_SIMPLE_NAME = re.compile(r"^[a-z0-9 ]+$")
+_CACHE_SIZE = 1 << 16
+
+
+class _Flavor:
+    """The normalization rules for one kind of name.
+
+    Single characters are replaced with one `str.translate()` table. The
+    multi-character special cases are then replaced one after another, in
+    the order they are declared, since one replacement can set up the next
+    (e.g. `ryland/paul/ryland`).
+    """
+
+    def __init__(
+        self,
+        characters: Mapping[str, str],
+        special_cases: Mapping[str, str],
+        exact: Mapping[str, str],
+    ) -> None:
+        self._table = str.maketrans(dict(characters))
+        self._special_cases = tuple(special_cases.items())
+        self._exact = dict(exact)
+
+    def normalize(self, name: str) -> str:
+        whitespace_normalized = " ".join(name.lower().split())
+
+        without_punctuation = whitespace_normalized.translate(self._table)
+        for special, replacement in self._special_cases:
+            without_punctuation = without_punctuation.replace(special, replacement)
+
+        # NOTE: These are kept as sequential replacements; a single regex
+        #       would differ when they overlap, e.g. for `x) / y`.
+        without_punctuation = without_punctuation.replace(" (", " ")
+        without_punctuation = without_punctuation.replace(") ", " ")
+        without_punctuation = without_punctuation.replace(" / ", " ")
+        if without_punctuation.startswith("("):
+            without_punctuation = without_punctuation[1:]
+        if without_punctuation.endswith(")"):
+            without_punctuation = without_punctuation[:-1]
+
+        exact = self._exact.get(without_punctuation)
+        if exact is not None:
+            return exact
+
+        if _SIMPLE_NAME.match(without_punctuation) is None:
+            raise RuntimeError(
+                "Unhandled name needs normalized", name, without_punctuation
+            )
+
+        return " ".join(without_punctuation.split())
+
+
+_PUNCTUATION: dict[str, str] = {
+    "'": "",
+    ".": "",
+    ",": "",
+    "&": "and",
+    "-": " ",
+    "`": "",
+}
+_TEAM = _Flavor(
+    characters=_PUNCTUATION,
+    # NOTE: `c/ ` is a special case based on a likely typo in real data
+    special_cases={"c/ ": "c "},
+    exact={"rick larsen wrestling club(ind": "rick larsen wrestling club ind"},
+)
+# NOTE: A non-breaking space (`\xa0`) needs no rule, `str.split()` already
+#       treats it as whitespace.
+_ATHLETE = _Flavor(
+    characters={
+        **_PUNCTUATION,
+        "\u2019": "",
+        '"': "",
+        "\xe9": "e",
+        "\xf1": "n",
+        "\xed": "i",
+        "\xe1": "a",
+    },
+    # Very special cases
+    special_cases={
+        "bassam/sammie": "bassam",
+        "paul/ryland": "paul",
+        "ryland/ paul": "paul",
+        "ryland/paul": "paul",
+        "[kar dee a]": "",
+        "richard/ benny": "richard",
+        "benny/rich": "rich",
+        "ta?leigha": "taleigha",
+        "o?connor": "oconnor",
+        "tre?lyn": "trelyn",
+        "benny/richard": "richard",
+        "a?mari": "amari",
+    },
+    exact={},
+)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def normalize_team_name(name: str) -> str:
+    return _TEAM.normalize(name)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def normalize_athlete_name(name: str) -> str:
+    return _ATHLETE.normalize(name)
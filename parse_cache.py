@@ -0,0 +1,278 @@
+import functools
+import hashlib
+import inspect
+import pathlib
+import sqlite3
+import struct
+from collections.abc import Callable, Mapping
+
+import pydantic
+
+import bracket_util
+import html_util
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_CACHE_PATH = _HERE / ".parse-cache.sqlite3"
+# NOTE: `parse_results` was keyed by a manually bumped parser version.
+_SCHEMA = """
+DROP TABLE IF EXISTS parse_results;
+CREATE TABLE IF NOT EXISTS parsed (
+    parser TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    args_sha256 TEXT NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (parser, fingerprint, backend, args_sha256)
+)
+"""
+# NOTE: Every parser builds `bracket_util` models (e.g. via `classify_bracket()`)
+#       and parses HTML via `html_util`.
+_SHARED_SOURCES = (
+    pathlib.Path(bracket_util.__file__).resolve(),
+    pathlib.Path(html_util.__file__).resolve(),
+)
+_BUSY_TIMEOUT = 30.0
+
+
+class Codec[T]:
+    """How a parser's result is stored as JSON in the cache."""
+
+    def __init__(
+        self,
+        adapter: pydantic.TypeAdapter[object],
+        to_stored: Callable[[T], object],
+        from_stored: Callable[[object], T],
+    ) -> None:
+        self._adapter = adapter
+        self._to_stored = to_stored
+        self._from_stored = from_stored
+
+    def dump(self, result: T) -> bytes:
+        return self._adapter.dump_json(self._to_stored(result), by_alias=True)
+
+    def load(self, stored: bytes) -> T:
+        return self._from_stored(self._adapter.validate_json(stored))
+
+
+def _identity[T](value: T) -> T:
+    return value
+
+
+def _weights_from_list(
+    weights: object,
+) -> dict[bracket_util.AthleteWeightKey, bracket_util.AthleteWeight]:
+    if not isinstance(weights, list):
+        raise TypeError("Expected a list of weights", type(weights))
+    return {weight.to_key(): weight for weight in weights}
+
+
+MATCHES_CODEC: Codec[list[bracket_util.MatchV1]] = Codec(
+    pydantic.TypeAdapter(list[bracket_util.MatchV1]), _identity, _identity
+)
+# NOTE: The keys of parsed weights are always `AthleteWeight.to_key()`, so only
+#       the values are stored.
+WEIGHTS_CODEC: Codec[
+    dict[bracket_util.AthleteWeightKey, bracket_util.AthleteWeight]
+] = Codec(
+    pydantic.TypeAdapter(list[bracket_util.AthleteWeight]),
+    lambda weights: list(weights.values()),
+    _weights_from_list,
+)
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class _State:
+    def __init__(self) -> None:
+        self.enabled = True
+        self.connection: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        # NOTE: The current fingerprint of each parser, registered by `cached()`.
+        self.fingerprints: dict[str, str] = {}
+
+
+_STATE = _State()
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn the cache on / off for this process (e.g. for `--no-cache`)."""
+    _STATE.enabled = enabled
+
+
+def _connect() -> sqlite3.Connection:
+    if _STATE.connection is None:
+        connection = sqlite3.connect(_CACHE_PATH, timeout=_BUSY_TIMEOUT)
+        # NOTE: WAL lets several `parse_matches --jobs` workers write at once.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        _STATE.connection = connection
+
+    return _STATE.connection
+
+
+def _update_digest(update: Callable[[bytes], None], value: object) -> None:
+    """Feed a value into a digest, tagged with its type so e.g. `1` != `"1"`."""
+    update(type(value).__name__.encode())
+    if isinstance(value, str):
+        as_bytes = value.encode()
+        update(struct.pack("<Q", len(as_bytes)))
+        update(as_bytes)
+    elif isinstance(value, Mapping):
+        update(struct.pack("<Q", len(value)))
+        for key in sorted(value.keys()):
+            _update_digest(update, key)
+            _update_digest(update, value[key])
+    elif isinstance(value, list | tuple):
+        update(struct.pack("<Q", len(value)))
+        for item in value:
+            _update_digest(update, item)
+    elif isinstance(value, pydantic.BaseModel):
+        _update_digest(update, value.model_dump_json())
+    elif value is None or isinstance(value, bool | int | float):
+        _update_digest(update, repr(value))
+    else:
+        raise TypeError("Unsupported parser argument", type(value))
+
+
+def _args_sha256(args: tuple[object, ...], kwargs: dict[str, object]) -> str:
+    digest = hashlib.sha256()
+    _update_digest(digest.update, args)
+    _update_digest(digest.update, kwargs)
+    return digest.hexdigest()
+
+
+def _sources_fingerprint(sources: tuple[pathlib.Path, ...]) -> str:
+    digest = hashlib.sha256()
+    for source in sources:
+        _update_digest(digest.update, source.name)
+        _update_digest(digest.update, source.read_text())
+    return digest.hexdigest()
+
+
+def cached[**P, R](
+    parser: str, codec: Codec[R]
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Cache the result of a parser, keyed by a hash of all of its arguments.
+
+    The arguments include the HTML, event name and date (and any options), so
+    unchanged rounds / pages are only parsed once. The key also includes a
+    fingerprint of the parser's module and the modules it shares with every
+    parser (`bracket_util`, `html_util`), and the current `html_util` backend,
+    so editing the parsing code or setting `HTML_PARSER` re-parses.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        sources = (pathlib.Path(inspect.getfile(func)).resolve(), *_SHARED_SOURCES)
+        fingerprint = _sources_fingerprint(sources)
+        if _STATE.fingerprints.setdefault(parser, fingerprint) != fingerprint:
+            raise ValueError("Parser registered twice", parser)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _STATE.enabled:
+                return func(*args, **kwargs)
+
+            connection = _connect()
+            key = (
+                parser,
+                fingerprint,
+                html_util.current_backend(),
+                _args_sha256(args, kwargs),
+            )
+            row = connection.execute(
+                "SELECT result FROM parsed WHERE parser = ? AND fingerprint = ? "
+                "AND backend = ? AND args_sha256 = ?",
+                key,
+            ).fetchone()
+            if row is not None:
+                try:
+                    result = codec.load(row[0])
+                except pydantic.ValidationError:
+                    # NOTE: E.g. a `pydantic` upgrade changed how a model loads.
+                    pass
+                else:
+                    _STATE.hits += 1
+                    return result
+
+            _STATE.misses += 1
+            result = func(*args, **kwargs)
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?, ?)",
+                    (*key, codec.dump(result)),
+                )
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def session_stats() -> tuple[int, int]:
+    """The number of cache hits and misses in this process."""
+    return _STATE.hits, _STATE.misses
+
+
+class ParserStats(_ForbidExtra):
+    parser: str
+    fingerprint: str
+    backend: str
+    current: bool
+    entries: int
+    size: int
+
+
+def stats() -> list[ParserStats]:
+    if not _CACHE_PATH.exists():
+        return []
+
+    rows = _connect().execute(
+        "SELECT parser, fingerprint, backend, COUNT(*), SUM(LENGTH(result)) "
+        "FROM parsed GROUP BY parser, fingerprint, backend "
+        "ORDER BY parser, fingerprint, backend"
+    )
+    return [
+        ParserStats(
+            parser=parser,
+            fingerprint=fingerprint,
+            backend=backend,
+            current=_STATE.fingerprints.get(parser) == fingerprint,
+            entries=entries,
+            size=size,
+        )
+        for parser, fingerprint, backend, entries, size in rows
+    ]
+
+
+def clear(*, stale_only: bool = False) -> int:
+    """Remove cached results and return how many were removed.
+
+    With `stale_only`, only results from parser code that is no longer
+    current (i.e. not registered via `cached()` in this process) are removed.
+    """
+    if not _CACHE_PATH.exists():
+        return 0
+
+    connection = _connect()
+    removed = 0
+    with connection:
+        if not stale_only:
+            removed = connection.execute("DELETE FROM parsed").rowcount
+        else:
+            rows = connection.execute(
+                "SELECT DISTINCT parser, fingerprint FROM parsed"
+            ).fetchall()
+            for parser, fingerprint in rows:
+                if _STATE.fingerprints.get(parser) == fingerprint:
+                    continue
+                removed += connection.execute(
+                    "DELETE FROM parsed WHERE parser = ? AND fingerprint = ?",
+                    (parser, fingerprint),
+                ).rowcount
+
+    connection.execute("VACUUM")
+    return removed
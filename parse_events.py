@@ -0,0 +1,118 @@
+import concurrent.futures
+import functools
+import pathlib
+from collections.abc import Callable, Mapping
+
+import bracket_util
+import parse_cache
+import raw_store
+import trackwrestling
+import usabracketing
+
+type _EventParser = Callable[[pathlib.Path, str, str], list[bracket_util.MatchV1]]
+type _Task = tuple[_EventParser, str, str]
+
+
+def _load_match_html(
+    raw_data_dir: pathlib.Path, date_str: str, name: str
+) -> Mapping[str, str]:
+    parent_dir = raw_data_dir / date_str
+    stem = bracket_util.to_kebab_case(name)
+    filename = f"{stem}.json"
+    path = parent_dir / filename
+
+    fetched_event = raw_store.load_event(path)
+    return fetched_event.match_html
+
+
+def _parse_trackwrestling(
+    raw_data_dir: pathlib.Path, date_str: str, name: str
+) -> list[bracket_util.MatchV1]:
+    all_matches: list[bracket_util.MatchV1] = []
+
+    rounds_raw = _load_match_html(raw_data_dir, date_str, name)
+    rounds = sorted(rounds_raw.keys())
+    for round_ in rounds:
+        html = rounds_raw[round_]
+        all_matches.extend(trackwrestling.parse_tournament_round(html, name, date_str))
+
+    return all_matches
+
+
+def _parse_trackwrestling_duals(
+    raw_data_dir: pathlib.Path, date_str: str, name: str
+) -> list[bracket_util.MatchV1]:
+    weights_raw = _load_match_html(raw_data_dir, date_str, name)
+    return trackwrestling.parse_dual_event(weights_raw, name, date_str)
+
+
+def _parse_usabracketing(
+    raw_data_dir: pathlib.Path, date_str: str, name: str
+) -> list[bracket_util.MatchV1]:
+    all_matches: list[bracket_util.MatchV1] = []
+
+    rounds_raw = _load_match_html(raw_data_dir, date_str, name)
+    rounds = sorted(rounds_raw.keys())
+    for round_ in rounds:
+        html = rounds_raw[round_]
+        all_matches.extend(usabracketing.parse_tournament_round(html, name, date_str))
+
+    return all_matches
+
+
+def _parse_usabracketing_duals(
+    raw_data_dir: pathlib.Path, date_str: str, name: str
+) -> list[bracket_util.MatchV1]:
+    weights_raw = _load_match_html(raw_data_dir, date_str, name)
+    return usabracketing.parse_dual_event(weights_raw, name, date_str)
+
+
+def _all_tasks() -> list[_Task]:
+    tasks: list[_Task] = []
+    for parse_func, events in (
+        (_parse_trackwrestling, trackwrestling.TOURNAMENT_EVENTS),
+        (_parse_trackwrestling_duals, trackwrestling.DUAL_EVENTS),
+        (_parse_usabracketing, usabracketing.TOURNAMENT_EVENTS),
+        (_parse_usabracketing_duals, usabracketing.DUAL_EVENTS),
+    ):
+        for date_str, name in events:
+            tasks.append((parse_func, date_str, name))
+
+    return tasks
+
+
+def _run_task(raw_data_dir: pathlib.Path, task: _Task) -> list[bracket_util.MatchV1]:
+    parse_func, date_str, name = task
+    return parse_func(raw_data_dir, date_str, name)
+
+
+def parse_all(
+    raw_data_dir: pathlib.Path, jobs: int, *, use_cache: bool = True
+) -> list[bracket_util.MatchV1]:
+    """Parse the matches from every fetched event, in a stable order.
+
+    With `jobs > 1` the events are parsed in a process pool. The functions sent
+    to the workers live in this module (rather than an entrypoint `__main__`)
+    so they can be imported by `spawn` / `forkserver` workers.
+    """
+    tasks = _all_tasks()
+    run_task = functools.partial(_run_task, raw_data_dir)
+
+    if jobs == 1:
+        parse_cache.set_enabled(use_cache)
+        results = [run_task(task) for task in tasks]
+    else:
+        # NOTE: `map()` yields results in the order of `tasks` (not completion
+        #       order), so the CSV is identical to a sequential parse.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=parse_cache.set_enabled,
+            initargs=(use_cache,),
+        ) as executor:
+            results = list(executor.map(run_task, tasks))
+
+    all_matches: list[bracket_util.MatchV1] = []
+    for matches in results:
+        all_matches.extend(matches)
+
+    return all_matches
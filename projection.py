@@ -1,13 +1,19 @@
 import csv
 import datetime
+import functools
 import pathlib
+from collections.abc import Iterable
 
 import pydantic
 
 import bracket_util
+import match_snapshot
+import match_store
 
 _HERE = pathlib.Path(__file__).resolve().parent
 _ROOT = _HERE
+_MATCHES_V4_CSV = _ROOT / "_parsed-data" / "all-matches-04.csv"
+_MATCHES_DB = _ROOT / "_parsed-data" / "matches.sqlite"
 _NULLABLE_KEYS = (
     "Division",
     "Winner (normalized)",
@@ -22,7 +28,11 @@ _NULLABLE_KEYS = (
 
 
 def load_matches_v4() -> list[bracket_util.MatchV4]:
-    input_file = _ROOT / "_parsed-data" / "all-matches-04.csv"
+    input_file = _MATCHES_V4_CSV
+    snapshot = match_snapshot.load_snapshot(input_file)
+    if snapshot is not None:
+        return snapshot
+
     with open(input_file) as file_obj:
         rows = list(csv.DictReader(file_obj))
 
@@ -35,6 +45,57 @@ def load_matches_v4() -> list[bracket_util.MatchV4]:
     return matches_root.root
 
 
+def build_match_store() -> None:
+    """Write `matches.sqlite` from `all-matches-04.csv`."""
+    match_store.write_store(_MATCHES_DB, _MATCHES_V4_CSV, load_matches_v4())
+
+
+@functools.cache
+def _all_matches_v4() -> tuple[bracket_util.MatchV4, ...]:
+    return tuple(load_matches_v4())
+
+
+def matches_for_usaw(usaw_numbers: Iterable[str]) -> list[bracket_util.MatchV4]:
+    """Matches where the winner or loser is one of `usaw_numbers`.
+
+    Uses the indexes in `matches.sqlite` when it is up to date with
+    `all-matches-04.csv`, and otherwise scans every match.
+    """
+    usaw_numbers = set(usaw_numbers)
+    matches = match_store.matches_for_usaw(_MATCHES_DB, _MATCHES_V4_CSV, usaw_numbers)
+    if matches is not None:
+        return matches
+
+    return [
+        match_
+        for match_ in _all_matches_v4()
+        if (
+            match_.winner_usaw_number in usaw_numbers
+            or match_.loser_usaw_number in usaw_numbers
+        )
+    ]
+
+
+def matches_for_teams(team_names: Iterable[str]) -> list[bracket_util.MatchV4]:
+    """Matches where the winner's or loser's normalized team is in `team_names`.
+
+    Like `matches_for_usaw()`, this falls back to scanning every match.
+    """
+    team_names = set(team_names)
+    matches = match_store.matches_for_teams(_MATCHES_DB, _MATCHES_V4_CSV, team_names)
+    if matches is not None:
+        return matches
+
+    return [
+        match_
+        for match_ in _all_matches_v4()
+        if (
+            match_.winner_team_normalized in team_names
+            or match_.loser_team_normalized in team_names
+        )
+    ]
+
+
 class _Regionals(pydantic.RootModel[dict[str, list[str]]]):
     pass
 
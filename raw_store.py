@@ -0,0 +1,265 @@
+import datetime
+import functools
+import hashlib
+import os
+import pathlib
+from collections.abc import Iterator, Mapping
+from compression import zstd
+
+import pydantic
+
+import bracket_util
+import lazy_json
+
+_BLOBS_DIRNAME = "_blobs"
+_BLOB_SUFFIX = ".html.zst"
+_MANIFEST_SUFFIX = ".manifest.json"
+_ZSTD_LEVEL = 10
+_HTML_SECTIONS = ("match_html", "weights_html")
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class _EventHeader(_ForbidExtra):
+    name: str
+    source: bracket_util.Source
+    start_date: datetime.date | None
+    end_date: datetime.date
+
+
+class _Manifest(_ForbidExtra):
+    """An event with each HTML value replaced by the SHA-256 of its blob."""
+
+    name: str
+    source: bracket_util.Source
+    start_date: datetime.date | None
+    end_date: datetime.date
+    match_html: dict[str, str]
+    weights_html: dict[str, str]
+
+
+def _manifest_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(f"{path.stem}{_MANIFEST_SUFFIX}")
+
+
+def _blobs_dir(path: pathlib.Path) -> pathlib.Path:
+    # NOTE: Events are stored as `_raw-data/{DATE}/{STEM}.json` and the blobs
+    #       are shared by all dates in `_raw-data/_blobs/`.
+    return path.parent.parent / _BLOBS_DIRNAME
+
+
+def _blob_path(blobs_dir: pathlib.Path, digest: str) -> pathlib.Path:
+    return blobs_dir / digest[:2] / f"{digest}{_BLOB_SUFFIX}"
+
+
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as file_obj:
+        file_obj.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_blob(blobs_dir: pathlib.Path, html: str) -> str:
+    """Store `html` (once) and return its content hash."""
+    as_bytes = html.encode("utf-8")
+    digest = hashlib.sha256(as_bytes).hexdigest()
+    blob_path = _blob_path(blobs_dir, digest)
+    if not blob_path.exists():
+        _write_atomic(blob_path, zstd.compress(as_bytes, level=_ZSTD_LEVEL))
+
+    return digest
+
+
+def read_blob(blobs_dir: pathlib.Path, digest: str) -> str:
+    with open(_blob_path(blobs_dir, digest), "rb") as file_obj:
+        compressed = file_obj.read()
+
+    return zstd.decompress(compressed).decode("utf-8")
+
+
+class _BlobMapping(Mapping[str, str]):
+    """A read-only `key -> HTML` mapping that decompresses blobs on access."""
+
+    def __init__(self, blobs_dir: pathlib.Path, digests: dict[str, str]) -> None:
+        self._blobs_dir = blobs_dir
+        self._digests = digests
+
+    def __getitem__(self, key: str) -> str:
+        return read_blob(self._blobs_dir, self._digests[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._digests)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class _JsonSection(Mapping[str, str]):
+    """A read-only `key -> HTML` view of one section of a legacy JSON event.
+
+    The section is only indexed on first use and each value is only decoded
+    when accessed.
+    """
+
+    def __init__(self, event_object: lazy_json.LazyObject, section: str) -> None:
+        self._event_object = event_object
+        self._section = section
+
+    @functools.cached_property
+    def _values(self) -> lazy_json.LazyObject:
+        return self._event_object.object(self._section)
+
+    def __getitem__(self, key: str) -> str:
+        html = self._values[key]
+        if not isinstance(html, str):
+            raise ValueError("Expected HTML string", self._section, key)
+
+        return html
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class RawEvent:
+    """A fetched event whose HTML is only read when a key is accessed."""
+
+    def __init__(
+        self,
+        name: str,
+        source: bracket_util.Source,
+        start_date: datetime.date | None,
+        end_date: datetime.date,
+        match_html: Mapping[str, str],
+        weights_html: Mapping[str, str],
+    ) -> None:
+        self.name = name
+        self.source = source
+        self.start_date = start_date
+        self.end_date = end_date
+        self.match_html = match_html
+        self.weights_html = weights_html
+
+    def to_fetched_event(self) -> bracket_util.FetchedEvent:
+        return bracket_util.FetchedEvent(
+            name=self.name,
+            source=self.source,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            match_html=dict(self.match_html),
+            weights_html=dict(self.weights_html),
+        )
+
+
+def exists(path: pathlib.Path) -> bool:
+    """Check if the event at `_raw-data/{DATE}/{STEM}.json` has been stored.
+
+    `path` is always the legacy JSON path, the event may be stored as either
+    the legacy JSON or as a manifest next to it.
+    """
+    return _manifest_path(path).exists() or path.exists()
+
+
+def _load_legacy_json(path: pathlib.Path) -> bracket_util.FetchedEvent:
+    with open(path, "rb") as file_obj:
+        as_json = file_obj.read()
+
+    return bracket_util.FetchedEvent.model_validate_json(as_json)
+
+
+def _load_legacy_json_lazy(path: pathlib.Path) -> RawEvent:
+    event_object = lazy_json.open_object(path)
+    missing = [section for section in _HTML_SECTIONS if section not in event_object]
+    if missing:
+        raise ValueError("Event is missing HTML sections", path, missing)
+
+    header = _EventHeader.model_validate(
+        {key: event_object[key] for key in event_object if key not in _HTML_SECTIONS}
+    )
+    return RawEvent(
+        name=header.name,
+        source=header.source,
+        start_date=header.start_date,
+        end_date=header.end_date,
+        match_html=_JsonSection(event_object, "match_html"),
+        weights_html=_JsonSection(event_object, "weights_html"),
+    )
+
+
+def load_event(path: pathlib.Path) -> RawEvent:
+    manifest_path = _manifest_path(path)
+    if not manifest_path.exists():
+        return _load_legacy_json_lazy(path)
+
+    with open(manifest_path, "rb") as file_obj:
+        as_json = file_obj.read()
+
+    manifest = _Manifest.model_validate_json(as_json)
+    blobs_dir = _blobs_dir(path)
+    return RawEvent(
+        name=manifest.name,
+        source=manifest.source,
+        start_date=manifest.start_date,
+        end_date=manifest.end_date,
+        match_html=_BlobMapping(blobs_dir, manifest.match_html),
+        weights_html=_BlobMapping(blobs_dir, manifest.weights_html),
+    )
+
+
+def load_fetched_event(path: pathlib.Path) -> bracket_util.FetchedEvent:
+    """Load an event with all of its HTML in memory (e.g. to add to it)."""
+    return load_event(path).to_fetched_event()
+
+
+def save_event(path: pathlib.Path, fetched_event: bracket_util.FetchedEvent) -> None:
+    """Store the HTML blobs and manifest for an event.
+
+    The manifest supersedes the legacy JSON at `path`, which is removed.
+    """
+    blobs_dir = _blobs_dir(path)
+    manifest = _Manifest(
+        name=fetched_event.name,
+        source=fetched_event.source,
+        start_date=fetched_event.start_date,
+        end_date=fetched_event.end_date,
+        match_html={
+            key: write_blob(blobs_dir, html)
+            for key, html in fetched_event.match_html.items()
+        },
+        weights_html={
+            key: write_blob(blobs_dir, html)
+            for key, html in fetched_event.weights_html.items()
+        },
+    )
+
+    as_json = manifest.model_dump_json(indent=2)
+    _write_atomic(_manifest_path(path), f"{as_json}\n".encode())
+    path.unlink(missing_ok=True)
+
+
+def migrate_event(path: pathlib.Path) -> bool:
+    """Convert a legacy JSON event into blobs + manifest.
+
+    Returns `False` if there is no legacy JSON to migrate.
+    """
+    if not path.exists():
+        return False
+
+    fetched_event = _load_legacy_json(path)
+    blobs_dir = _blobs_dir(path)
+    # NOTE: Write the blobs and verify them before the JSON is removed.
+    for html in [
+        *fetched_event.match_html.values(),
+        *fetched_event.weights_html.values(),
+    ]:
+        digest = write_blob(blobs_dir, html)
+        if read_blob(blobs_dir, digest) != html:
+            raise RuntimeError("Blob does not round trip", path, digest)
+
+    save_event(path, fetched_event)
+    return True
@@ -0,0 +1,363 @@
+import datetime
+import functools
+import html
+import http.server
+import pathlib
+import threading
+import urllib.parse
+
+import bracket_util
+import raw_store
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_RAW_DATA_DIR = _HERE / "_raw-data"
+_WEIGHTS_PAGE_SIZE = 30
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+{body}
+</body>
+</html>
+"""
+_HOME_BODY = """
+<span onclick="window.location.href = '/events';">
+  <span class="mobileHidden">Events</span>
+</span>
+"""
+_EVENTS_BODY = """
+<input type="button" id="eventSearchButton" value="Event Search"
+  onclick="document.getElementById('searchForm').style.display = 'block';">
+<div id="searchForm" style="display: none;">
+  <input type="text" id="nameBox">
+  <input type="text" id="startDateMonth">
+  <input type="text" id="startDateDay">
+  <input type="text" id="startDateYear">
+  <input type="text" id="endDateMonth">
+  <input type="text" id="endDateDay">
+  <input type="text" id="endDateYear">
+  <input type="button" value="Search" onclick="search();">
+</div>
+<script>
+function search() {
+  const params = new URLSearchParams();
+  for (const input of document.querySelectorAll("#searchForm input[type=text]")) {
+    params.set(input.id, input.value);
+  }
+  window.location.href = "/events/search?" + params.toString();
+}
+</script>
+"""
+_FRAME_HOME_BODY = """
+<input type="button" id="nav-results-button" value="Results"
+  onclick="document.getElementById('resultsMenu').style.display = 'block';">
+<div id="resultsMenu" style="display: none;">
+  <a href="{prefix}/frame/rounds">Round Results</a>
+  <a href="{prefix}/frame/weights">Weight Results</a>
+</div>
+"""
+_FRAME_ROUNDS_BODY = """
+<select id="roundIdBox">
+{options}
+</select>
+<div class="openExtraContent">
+  <a href="javascript:void(0);"
+    onclick="document.getElementById('extraContent').style.display = 'block';"
+    >Advanced</a>
+</div>
+<div id="extraContent" style="display: none;">
+  <input type="text" id="format" value="">
+</div>
+<input type="button" value="Go" onclick="go();">
+<script>
+function go() {{
+  const params = new URLSearchParams();
+  params.set("roundIdBox", document.getElementById("roundIdBox").value);
+  params.set("format", document.getElementById("format").value);
+  window.location.href = "{prefix}/frame/round?" + params.toString();
+}}
+</script>
+"""
+
+
+def _page(title: str, body: str) -> bytes:
+    return _PAGE_TEMPLATE.format(title=html.escape(title), body=body).encode("utf-8")
+
+
+@functools.cache
+def _load_event(date_str: str, stem: str) -> bracket_util.FetchedEvent | None:
+    path = _RAW_DATA_DIR / date_str / f"{stem}.json"
+    if not raw_store.exists(path):
+        return None
+
+    fetched_event = raw_store.load_fetched_event(path)
+    if fetched_event.source not in ("trackwrestling", "trackwrestling_dual"):
+        return None
+
+    return fetched_event
+
+
+def _options_html(labels: list[str], first_label: str) -> str:
+    options = [f'<option value="">{html.escape(first_label)}</option>']
+    for i, label in enumerate(labels, start=1):
+        options.append(f'<option value="{i}">{html.escape(label)}</option>')
+    return "\n".join(options)
+
+
+def _lookup_label(labels: list[str], value: str) -> str | None:
+    if not value.isdigit():
+        return None
+
+    index = int(value) - 1
+    if not 0 <= index < len(labels):
+        return None
+
+    return labels[index]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        # NOTE: Keep benchmark output readable.
+        pass
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self) -> None:
+        self._send(404, _page("Not Found", "<h1>Not Found</h1>"))
+
+    def do_GET(self) -> None:  # noqa: N802
+        parts = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+        segments = [segment for segment in parts.path.split("/") if segment]
+
+        if segments == []:
+            self._send(200, _page("TrackWrestling", _HOME_BODY))
+            return
+
+        if segments == ["events"]:
+            self._send(200, _page("Events", _EVENTS_BODY))
+            return
+
+        if segments == ["events", "search"]:
+            self._send_search_results(query)
+            return
+
+        if len(segments) < 3 or segments[0] != "event":
+            self._not_found()
+            return
+
+        date_str, stem, *rest = segments[1:]
+        fetched_event = _load_event(date_str, stem)
+        if fetched_event is None:
+            self._not_found()
+            return
+
+        prefix = f"/event/{date_str}/{stem}"
+        self._send_event_page(fetched_event, prefix, rest, query)
+
+    def _send_search_results(self, query: dict[str, str]) -> None:
+        name = query.get("nameBox", "")
+        try:
+            end_date = datetime.date(
+                int(query.get("endDateYear", "")),
+                int(query.get("endDateMonth", "")),
+                int(query.get("endDateDay", "")),
+            )
+        except ValueError:
+            end_date = None
+
+        items: list[str] = []
+        if end_date is not None:
+            date_str = end_date.isoformat()
+            stem = bracket_util.to_kebab_case(name)
+            fetched_event = _load_event(date_str, stem)
+            if fetched_event is not None and fetched_event.name == name:
+                items.append(
+                    "<li>"
+                    '<a class="segment-track" href="javascript:void(0);">'
+                    f"<span>{html.escape(fetched_event.name)}</span></a>"
+                    f'<a id="anchor_0" href="/event/{date_str}/{stem}">Enter</a>'
+                    "</li>"
+                )
+
+        body = '<ul class="tournament-ul">' + "".join(items) + "</ul>"
+        self._send(200, _page("Event Search", body))
+
+    def _send_event_page(
+        self,
+        fetched_event: bracket_util.FetchedEvent,
+        prefix: str,
+        rest: list[str],
+        query: dict[str, str],
+    ) -> None:
+        match_labels = list(fetched_event.match_html.keys())
+
+        if rest == []:
+            body = (
+                '<select id="userType">'
+                "<option>Participant</option>"
+                "<option>Viewer (classic)</option>"
+                "</select>"
+                '<input type="button" value="Enter Event" '
+                f"onclick=\"window.location.href = '{prefix}/main';\">"
+            )
+            self._send(200, _page(fetched_event.name, body))
+            return
+
+        if rest == ["main"]:
+            body = (
+                f'<a href="{prefix}/frame/wrestlers?page=0" target="PageFrame">'
+                "Wrestlers</a>"
+                f'<iframe id="PageFrame" name="PageFrame" src="{prefix}/frame/home" '
+                'width="100%" height="800"></iframe>'
+            )
+            self._send(200, _page(fetched_event.name, body))
+            return
+
+        if rest == ["frame", "home"]:
+            body = _FRAME_HOME_BODY.format(prefix=prefix)
+            self._send(200, _page("Event", body))
+            return
+
+        if rest == ["frame", "rounds"]:
+            options = _options_html(match_labels, "All Rounds")
+            body = _FRAME_ROUNDS_BODY.format(prefix=prefix, options=options)
+            self._send(200, _page("Round Results", body))
+            return
+
+        if rest == ["frame", "round"]:
+            self._send_round(fetched_event, prefix, match_labels, query)
+            return
+
+        if rest == ["frame", "weights"]:
+            self._send_weights(fetched_event, prefix, match_labels, query)
+            return
+
+        if rest == ["frame", "wrestlers"]:
+            self._send_wrestlers(fetched_event, prefix, query)
+            return
+
+        self._not_found()
+
+    def _send_round(
+        self,
+        fetched_event: bracket_util.FetchedEvent,
+        prefix: str,
+        match_labels: list[str],
+        query: dict[str, str],
+    ) -> None:
+        # NOTE: The stored HTML was captured with `_BOUT_FORMAT`, any other
+        #       format can't be replayed.
+        label = _lookup_label(match_labels, query.get("roundIdBox", ""))
+        format_ = query.get("format", "")
+        if label is None or format_.count("::") != 8:
+            self._send(400, _page("Bad Request", "<h1>Bad Request</h1>"))
+            return
+
+        body = (
+            f"{fetched_event.match_html[label]}"
+            '<input type="button" id="pageFunc_0" value="Filter" '
+            f"onclick=\"window.location.href = '{prefix}/frame/rounds';\">"
+        )
+        self._send(200, _page("Round Results", body))
+
+    def _send_weights(
+        self,
+        fetched_event: bracket_util.FetchedEvent,
+        prefix: str,
+        match_labels: list[str],
+        query: dict[str, str],
+    ) -> None:
+        options = _options_html(match_labels, "")
+        value = query.get("groupBox", "")
+        body = (
+            '<select id="groupBox" onchange="window.location.href = '
+            f"'{prefix}/frame/weights?groupBox=' + this.value;\">{options}</select>"
+        )
+        label = _lookup_label(match_labels, value)
+        if label is not None:
+            # NOTE: Mark the current weight as selected, like the real site.
+            body = body.replace(f'value="{value}"', f'value="{value}" selected', 1)
+            body += f"<h1>{html.escape(label)} Results</h1>"
+            body += fetched_event.match_html[label]
+
+        self._send(200, _page("Weight Results", body))
+
+    def _send_wrestlers(
+        self,
+        fetched_event: bracket_util.FetchedEvent,
+        prefix: str,
+        query: dict[str, str],
+    ) -> None:
+        page = query.get("page", "0")
+        key = f"page-{page}"
+        table_html = fetched_event.weights_html.get(key)
+        if table_html is None:
+            self._not_found()
+            return
+
+        page_number = int(page)
+        range_start = _WEIGHTS_PAGE_SIZE * page_number + 1
+        range_end = range_start + _WEIGHTS_PAGE_SIZE - 1
+
+        next_link = ""
+        if f"page-{page_number + 1}" in fetched_event.weights_html:
+            next_link = (
+                f'<a href="{prefix}/frame/wrestlers?page={page_number + 1}">'
+                '<i class="dgNext"></i></a>'
+            )
+
+        body = (
+            '<div class="dataGridNextPrev">'
+            f"<span>{range_start} - {range_end}</span>"
+            f'<span class="prevNextButton">{next_link}</span>'
+            "</div>"
+            f"{table_html}"
+        )
+        self._send(200, _page("Wrestlers", body))
+
+
+class ReplayServer:
+    """A local stand-in for TrackWrestling, built from HTML in `_raw-data`.
+
+    The pages only reproduce the parts of the TrackWrestling DOM that
+    `trackwrestling.py` navigates (element IDs, link text, the `PageFrame`
+    iframe, etc.) so the Selenium code can be exercised and timed offline. Pass
+    `base_url` to `trackwrestling.BrowserSession` to use it.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = http.server.ThreadingHTTPServer((host, port), _Handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+    def __enter__(self) -> ReplayServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
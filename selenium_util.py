@@ -0,0 +1,94 @@
+import os
+import time
+from collections.abc import Callable
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_TIMEOUT = 10.0
+_POLL_FREQUENCY = 0.05
+_VERBOSE = "VERBOSE" in os.environ
+# NOTE: A 32-bit string hash (Java's `String.hashCode()`) over the `outerHTML`
+#       of every element matching a CSS selector. Returns `null` when nothing
+#       matches so callers can tell "missing" apart from "unchanged".
+_CONTENT_HASH_SCRIPT = """
+const elements = document.querySelectorAll(arguments[0]);
+if (elements.length === 0) {
+  return null;
+}
+let hash = 0;
+let size = 0;
+for (const element of elements) {
+  const html = element.outerHTML;
+  size += html.length;
+  for (let i = 0; i < html.length; i++) {
+    hash = (Math.imul(31, hash) + html.charCodeAt(i)) | 0;
+  }
+}
+return `${elements.length}:${size}:${hash >>> 0}`;
+"""
+_IGNORED_EXCEPTIONS = (JavascriptException, StaleElementReferenceException)
+
+
+def _debug(message: str) -> None:
+    if not _VERBOSE:
+        return
+
+    print(message)
+
+
+def content_hash(driver: webdriver.Chrome, css_selector: str) -> str | None:
+    """Hash the current HTML of all elements matching `css_selector`.
+
+    This runs in whichever frame the driver is currently switched to.
+    """
+    return driver.execute_script(_CONTENT_HASH_SCRIPT, css_selector)
+
+
+def wait_until[T](
+    driver: webdriver.Chrome,
+    condition: Callable[[webdriver.Chrome], T],
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    label: str,
+) -> T:
+    """Poll `condition` until it is truthy, logging how long the wait took."""
+    start = time.monotonic()
+    waiter = WebDriverWait(
+        driver,
+        timeout,
+        poll_frequency=_POLL_FREQUENCY,
+        ignored_exceptions=_IGNORED_EXCEPTIONS,
+    )
+    result = waiter.until(condition, message=f"Timed out waiting for {label}")
+    duration = time.monotonic() - start
+    _debug(f":: Waited {duration:.3f}s for {label}")
+    return result
+
+
+def wait_until_changed(
+    driver: webdriver.Chrome,
+    css_selector: str,
+    previous_hash: str | None,
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    label: str,
+) -> str:
+    """Wait until the content matching `css_selector` differs from before.
+
+    The caller should capture `previous_hash` via `content_hash()` **before**
+    triggering the change (e.g. clicking a button). Returns the new hash.
+    """
+
+    def _changed(driver: webdriver.Chrome) -> str | None:
+        current_hash = content_hash(driver, css_selector)
+        if current_hash is None or current_hash == previous_hash:
+            return None
+
+        return current_hash
+
+    return wait_until(driver, _changed, timeout=timeout, label=label)
@@ -0,0 +1,389 @@
+import collections
+import hashlib
+import json
+import pathlib
+from typing import Literal
+
+import pydantic
+
+import bracket_util
+import club_util
+import name_normalization
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_RESOLUTIONS_FILE = _HERE / "_parsed-data" / "team-resolutions.json"
+# NOTE: A stored `team-resolutions.json` is only reused if none of these
+#       (which include the explicit / override mappings) changed.
+_RESOLUTION_SOURCES = (
+    pathlib.Path(__file__).resolve(),
+    pathlib.Path(name_normalization.__file__).resolve(),
+)
+_FALSE_DUPLICATE_CARDINAL = frozenset(
+    ["Cardinals Wrestling Club", "Arlington Cardinals Wrestling Club"]
+)
+# NOTE: The `custom-normalized-team-names.json` are wrong for some clubs that
+#       have very similar names.
+_EXPLICIT_MAPPING: dict[str, dict[str, str]] = {
+    "Litchfield `Rumble In the Jungle` 2026": {
+        "STCWC": "Out of State - Missouri",
+    },
+    "THE Midwest Classic 2026": {
+        "HoneyBadger WC": "Team HoneyBadger WC",
+    },
+    "Crushing Christmas Classic-Coal City": {
+        "Team Honey Badger WC": "Team HoneyBadger WC",
+    },
+    "2026 Girls Rule Rumble": {
+        "DC Wrestling ": "DC Wrestling Club",
+        "Team Honey Badger WC": "Team HoneyBadger WC",
+    },
+    "Tots Bash": {
+        "CWC": "Collinsville Wrestling Club",
+    },
+    "2025 Rocket Blast": {
+        "CWC": "Champaign Wrestling Club",
+    },
+    "Spartan Rumble": {
+        "CWC": "Champaign Wrestling Club",
+    },
+    "2026 O`Fallon Panther Pummel w/Girls": {
+        "Fox WC": "Out of State - Missouri",
+        "Camdenton WC": "Out of State - Missouri",
+        "St. Charles WC": "Out of State - Missouri",
+    },
+    "2026 BRONCO INVITE": {
+        "Spartans": "Spartan Wrestling Club",
+    },
+    "Cumberland Kids Heartbreak Havoc": {
+        "Vincennes Grapplers Wrestling": "Out of State - Indiana",
+    },
+    "Daisy Fresh Wrestling Open": {
+        "Evansville Reitz": "Out of State - Indiana",
+    },
+    "Olympia Spartan Showdown": {
+        "Backyard Brawlers": "Backyard Brawlers Midwest WC",
+    },
+    "CLIPPER CLASH 2026": {
+        "Battle Hens": "Out of State - Iowa",
+        "Tigers wrestling club": "Out of State - Iowa",
+        "Lewis County Youth Wrestling": "Out of State - Missouri",
+    },
+    "Heart of a Lion 2026": {
+        "Hawkeye WC": "Out of State - Iowa",
+    },
+    "Champaign Grappler III": {
+        "CWC": "Champaign Wrestling Club",
+        "Contenders": "Out of State - Indiana",
+    },
+}
+
+# NOTE: `_OVERRIDE_TEAM_MAPPING` provides tournament specific overrides for a
+#       given team name. For now this is just to support the fact that
+#       St. Charles, IL and St. Charles, MO have the same team name. But the
+#       one from Missouri only goes to tournaments near St. Louis.
+_OVERRIDE_TEAM_MAPPING: dict[str, dict[str, str]] = {
+    "Devils Gauntlet Battle for the Belts": {
+        "St. Charles WC": "Out of State - Missouri"
+    },
+    "42nd Annual Bulls Wrestling Tournament": {
+        "St. Charles Wrestling Club": "Out of State - Missouri"
+    },
+    "Granite City Kids Holiday Classic": {
+        "St. Charles Wrestling Club": "Out of State - Missouri"
+    },
+    "2025 O`Fallon Beginners/Girls Open": {"STCWC": "Out of State - Missouri"},
+    "Highland Howl Jarron Haberer memorial": {"STCWC": "Out of State - Missouri"},
+    "Roxana Rumble": {"STCWC": "Out of State - Missouri"},
+}
+
+
+def _prepare_club_lookup(rosters: list[club_util.ClubInfo]) -> dict[str, str]:
+    club_name_lookup = {
+        name_normalization.normalize_team_name(roster.club_name): roster.club_name
+        for roster in rosters
+    }
+    if len(club_name_lookup) != len(rosters):
+        raise RuntimeError("Non-unique club names")
+
+    # First pass: WC and "Wrestling Club" synonym
+    keys = sorted(club_name_lookup.keys())
+    for key in keys:
+        new_key = None
+        if "wrestling club" in key:
+            new_key = key.replace("wrestling club", "wc")
+        elif key.endswith(" wc"):
+            new_key = key[:-2] + "wrestling club"
+
+        if new_key is None:
+            continue
+
+        if new_key in club_name_lookup:
+            raise ValueError("Unexpected collision", key, new_key)
+        club_name_lookup[new_key] = club_name_lookup[key]
+
+    # Second pass: Jr. and "Junior" synonym
+    keys = sorted(club_name_lookup.keys())
+    for key in keys:
+        new_key = None
+        if " jr " in key:
+            new_key = key.replace(" jr ", " junior ")
+        elif key.startswith("jr "):
+            new_key = "junior" + key[2:]
+        elif " junior " in key:
+            new_key = key.replace(" junior ", " jr ")
+        elif key.startswith("junior "):
+            new_key = "jr" + key[6:]
+
+        if new_key is None:
+            continue
+
+        if new_key in club_name_lookup:
+            raise ValueError("Unexpected collision", key, new_key)
+        club_name_lookup[new_key] = club_name_lookup[key]
+
+    return club_name_lookup
+
+
+class _ClubMatcher:
+    """Aho-Corasick automaton over the keys of a club name lookup.
+
+    `find()` returns the club for every key that is a substring of the text,
+    in a single pass over the text (instead of testing each key in turn).
+    """
+
+    def __init__(self, club_name_lookup: dict[str, str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._clubs: list[frozenset[str]] = [frozenset()]
+
+        for key, club_name in club_name_lookup.items():
+            node = 0
+            for char in key:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._clubs.append(frozenset())
+                node = next_node
+            self._clubs[node] = self._clubs[node] | {club_name}
+
+        # NOTE: Breadth first, so the failure link of each node (the longest
+        #       proper suffix that is also a prefix of some key) is already
+        #       complete when its children are linked.
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._clubs[child] = self._clubs[child] | self._clubs[self._fail[child]]
+                queue.append(child)
+
+    def find(self, text: str) -> set[str]:
+        found = set(self._clubs[0])
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._clubs[node]:
+                found.update(self._clubs[node])
+        return found
+
+
+_Rule = Literal["empty", "explicit", "override", "exact", "partial", "custom"]
+
+
+class _ForbidExtra(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(extra="forbid")
+
+
+class _TeamResolution(_ForbidExtra):
+    event_name: str
+    team: str
+    team_normalized: str
+    rule: _Rule
+
+
+class _TeamResolutions(_ForbidExtra):
+    fingerprint: str
+    resolutions: list[_TeamResolution]
+
+
+def _lookup_team(
+    team: str,
+    event_name: str,
+    club_name_lookup: dict[str, str],
+    club_matcher: _ClubMatcher,
+    custom_team_name_map: dict[str, str],
+) -> tuple[str, _Rule]:
+    if team == "":
+        return "", "empty"
+
+    explicit_value = _EXPLICIT_MAPPING.get(event_name, {}).get(team)
+    if explicit_value is not None:
+        return explicit_value, "explicit"
+
+    event_override = _OVERRIDE_TEAM_MAPPING.get(event_name, {})
+    mapped_override = event_override.get(team)
+    if mapped_override is not None:
+        return mapped_override, "override"
+
+    team_normalized = name_normalization.normalize_team_name(team)
+    matched = club_name_lookup.get(team_normalized)
+    if matched is not None:
+        return matched, "exact"
+
+    partial_matches = club_matcher.find(team_normalized)
+    if len(partial_matches) == 1:
+        return list(partial_matches)[0], "partial"
+
+    if partial_matches == set(_FALSE_DUPLICATE_CARDINAL):
+        return "Arlington Cardinals Wrestling Club", "partial"
+
+    if len(partial_matches) > 1:
+        raise RuntimeError("Unexpected duplicates", team, partial_matches)
+
+    custom_match = custom_team_name_map.get(team_normalized)
+    if custom_match is not None:
+        return custom_match, "custom"
+
+    raise RuntimeError("Could not match team", team, team_normalized, event_name)
+
+
+def _resolutions_fingerprint(
+    club_name_lookup: dict[str, str], custom_team_name_map: dict[str, str]
+) -> str:
+    """Hash everything, code included, that `_lookup_team()` depends on."""
+    digest = hashlib.sha256()
+    for path in _RESOLUTION_SOURCES:
+        digest.update(path.read_bytes())
+
+    inputs = {
+        "club_name_lookup": club_name_lookup,
+        "custom_team_name_map": custom_team_name_map,
+    }
+    as_json = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    digest.update(as_json.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_resolutions(fingerprint: str) -> dict[tuple[str, str], _TeamResolution]:
+    if not _RESOLUTIONS_FILE.exists():
+        return {}
+
+    with open(_RESOLUTIONS_FILE, "rb") as file_obj:
+        stored = _TeamResolutions.model_validate_json(file_obj.read())
+
+    if stored.fingerprint != fingerprint:
+        return {}
+
+    return {
+        (resolution.event_name, resolution.team): resolution
+        for resolution in stored.resolutions
+    }
+
+
+def _save_resolutions(
+    fingerprint: str, resolutions: dict[tuple[str, str], _TeamResolution]
+) -> None:
+    stored = _TeamResolutions(
+        fingerprint=fingerprint,
+        resolutions=[resolutions[key] for key in sorted(resolutions)],
+    )
+    with open(_RESOLUTIONS_FILE, "w") as file_obj:
+        file_obj.write(stored.model_dump_json(indent=2))
+        file_obj.write("\n")
+
+
+class _TeamResolver:
+    """Resolve each distinct `(event_name, team)` pair only once.
+
+    Resolutions from a previous run (in `team-resolutions.json`) are reused
+    when none of the inputs to `_lookup_team()` changed.
+    """
+
+    def __init__(
+        self,
+        club_name_lookup: dict[str, str],
+        club_matcher: _ClubMatcher,
+        custom_team_name_map: dict[str, str],
+        stored: dict[tuple[str, str], _TeamResolution],
+    ) -> None:
+        self._club_name_lookup = club_name_lookup
+        self._club_matcher = club_matcher
+        self._custom_team_name_map = custom_team_name_map
+        self._stored = stored
+        self.resolutions: dict[tuple[str, str], _TeamResolution] = {}
+        self.hits = 0
+        self.reused = 0
+        self.misses = 0
+
+    def resolve(self, team: str, event_name: str) -> str:
+        key = event_name, team
+        resolution = self.resolutions.get(key)
+        if resolution is not None:
+            self.hits += 1
+            return resolution.team_normalized
+
+        resolution = self._stored.get(key)
+        if resolution is not None:
+            self.reused += 1
+        else:
+            self.misses += 1
+            team_normalized, rule = _lookup_team(
+                team,
+                event_name,
+                self._club_name_lookup,
+                self._club_matcher,
+                self._custom_team_name_map,
+            )
+            resolution = _TeamResolution(
+                event_name=event_name,
+                team=team,
+                team_normalized=team_normalized,
+                rule=rule,
+            )
+
+        self.resolutions[key] = resolution
+        return resolution.team_normalized
+
+
+def normalize_matches(
+    matches_v1: list[bracket_util.MatchV1], *, use_cache: bool = True
+) -> list[bracket_util.MatchV2]:
+    rosters = club_util.load_rosters()
+    club_name_lookup = _prepare_club_lookup(rosters)
+    club_matcher = _ClubMatcher(club_name_lookup)
+    custom_team_name_map = club_util.load_custom_team_name_map()
+
+    fingerprint = _resolutions_fingerprint(club_name_lookup, custom_team_name_map)
+    stored = _load_resolutions(fingerprint) if use_cache else {}
+    resolver = _TeamResolver(
+        club_name_lookup, club_matcher, custom_team_name_map, stored
+    )
+
+    matches_v2: list[bracket_util.MatchV2] = []
+    for match_ in matches_v1:
+        winner_team_normalized = resolver.resolve(match_.winner_team, match_.event_name)
+        loser_team_normalized = resolver.resolve(match_.loser_team, match_.event_name)
+        matches_v2.append(
+            bracket_util.MatchV2.from_v1(
+                match_, winner_team_normalized, loser_team_normalized
+            )
+        )
+
+    # NOTE: Only the pairs seen in this run are kept, so the stored table
+    #       always matches the current matches and can be reviewed directly.
+    _save_resolutions(fingerprint, resolver.resolutions)
+    print(
+        f"Team resolutions: {len(resolver.resolutions)} pairs, "
+        f"{resolver.reused} reused from {_RESOLUTIONS_FILE.name}, "
+        f"{resolver.misses} resolved, {resolver.hits} repeat lookups"
+    )
+
+    return matches_v2
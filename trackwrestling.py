@@ -1,24 +1,39 @@
+import concurrent.futures
+import contextlib
+import functools
 import os
-import time
-from collections.abc import Callable
+import urllib.parse
+from collections.abc import Callable, Iterator, Mapping
+from html.parser import HTMLParser
 from typing import Literal
 
 import bs4
 import pydantic
+import requests
+import requests.adapters
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC  # noqa: N812
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 import bracket_util
+import fetch_journal
+import html_util
+import parse_cache
+import selenium_util
 
+_BASE_URL = "https://www.trackwrestling.com"
 _WAIT_TIME = 10
+_HTTP_TIMEOUT = 30
+_HTTP_WORKERS = 8
 _BOUT_FORMAT = (
     "[boutType] :: [wFName] :: [wLName] :: [wTeam] :: [winType] :: "
     "[lFName] :: [lLName] :: [lTeam] :: [scoreSummary]"
 )
 _VERBOSE = "VERBOSE" in os.environ
+RoundEngine = Literal["soup", "stream"]
 _WIN_TYPE_MAP = {
     "won by decision over": "decision",
     "won by major decision over": "major",
@@ -56,6 +71,24 @@ _ERRONEOUS_DUAL_MATCHES = frozenset(
         ),
     ]
 )
+# NOTE: Elements that never have an end tag (so are never left open).
+_VOID_ELEMENTS = frozenset(
+    (
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    )
+)
 _TOURNAMENT_WEIGHTS_HEADERS = ("Name", "Group", "Weight Class", "Weight", "Team")
 _DUAL_WEIGHTS_HEADERS = ("Name", "Team", "Weight Class", "Grade", "Record", "Weight")
 TOURNAMENT_EVENTS: tuple[tuple[str, str], ...] = (
@@ -347,16 +380,23 @@ def _all_round_option_values(driver: webdriver.Chrome) -> list[_OptionInfo]:
     return options
 
 
-def _capture_round_html(
-    driver: webdriver.Chrome, option_info: _OptionInfo
-) -> str | None:
+def _format_input_filled(driver: webdriver.Chrome) -> bool:
+    format_input = driver.find_element(By.ID, "format")
+    return format_input.get_attribute("value") == _BOUT_FORMAT
+
+
+class _RoundCapture(_ForbidExtra):
+    html: str | None
+    url: str
+
+
+def _capture_round(driver: webdriver.Chrome, option_info: _OptionInfo) -> _RoundCapture:
     # Wait for the iframe to be available
     _debug(":: Switching to <iframe>")
     iframe = WebDriverWait(driver, _WAIT_TIME).until(
         EC.presence_of_element_located((By.ID, "PageFrame"))
     )
     driver.switch_to.frame(iframe)
-    time.sleep(0.05)
 
     # Update <select> for desired option
     _debug(f":: Changing <option>; {option_info.value!r}")
@@ -379,9 +419,13 @@ def _capture_round_html(
         EC.visibility_of_element_located((By.ID, "format"))
     )
     format_input.clear()
-    time.sleep(0.05)
     format_input.send_keys(_BOUT_FORMAT)
-    time.sleep(0.05)
+    selenium_util.wait_until(
+        driver,
+        _format_input_filled,
+        timeout=_WAIT_TIME,
+        label="format <input> to be filled",
+    )
 
     # Click "Go"
     _debug(':: Clicking "Go"')
@@ -390,8 +434,11 @@ def _capture_round_html(
             (By.XPATH, "//input[@type='button' and @value='Go']")
         )
     )
+    body_hash = selenium_util.content_hash(driver, "body")
     go_button.click()
-    time.sleep(0.05)
+    selenium_util.wait_until_changed(
+        driver, "body", body_hash, timeout=_WAIT_TIME, label="round to render"
+    )
 
     # Wait for the "Filter" button to finish loading
     _debug(":: Waiting for round to load")
@@ -401,6 +448,7 @@ def _capture_round_html(
 
     # Find the element we intend to capture `<section class="tw-list">`
     _debug(":: Capturing HTML")
+    round_url = driver.execute_script("return window.location.href;")
     tw_lists = driver.find_elements(By.CSS_SELECTOR, "section.tw-list")
     if len(tw_lists) == 0:
         tw_list_html = None
@@ -420,10 +468,157 @@ def _capture_round_html(
     # Switch back to the main page (if needed)
     driver.switch_to.default_content()
 
-    return tw_list_html
+    return _RoundCapture(html=tw_list_html, url=round_url)
+
+
+def _capture_round_html(
+    driver: webdriver.Chrome, option_info: _OptionInfo
+) -> str | None:
+    return _capture_round(driver, option_info).html
+
+
+def _make_round_url(
+    template_url: str, template_option: _OptionInfo, option: _OptionInfo
+) -> str:
+    """Swap the round ID in a captured round results URL.
+
+    The URL the "Go" button loads in the `<iframe>` is a plain `GET` that
+    includes both the round ID and the bout format, so the URL for any other
+    round only differs by the round ID query parameter.
+    """
+    parts = urllib.parse.urlsplit(template_url)
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+
+    if not any(value == _BOUT_FORMAT for _, value in query):
+        raise RuntimeError("Round results URL is missing bout format", template_url)
+
+    round_indices = [
+        i for i, (_, value) in enumerate(query) if value == template_option.value
+    ]
+    if len(round_indices) != 1:
+        raise RuntimeError(
+            "Could not identify round ID in URL", template_url, template_option
+        )
+
+    (round_index,) = round_indices
+    round_key, _ = query[round_index]
+    query[round_index] = round_key, option.value
+
+    new_query = urllib.parse.urlencode(query)
+    return urllib.parse.urlunsplit(parts._replace(query=new_query))
+
+
+def _http_session(driver: webdriver.Chrome, pool_size: int) -> requests.Session:
+    """Create a `requests` session that shares cookies with the browser."""
+    session = requests.Session()
+    user_agent = driver.execute_script("return navigator.userAgent;")
+    session.headers["User-Agent"] = user_agent
+
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _TwListSpanParser(HTMLParser):
+    """Find the offsets of each `<section class="tw-list">` in the HTML.
+
+    This slices the original text rather than re-serializing a `bs4` tag, so
+    rounds fetched over HTTP are stored as served (like the `outerHTML` from
+    clicking through) and not in a form that depends on the HTML backend.
+    """
+
+    def __init__(self, html: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.spans: list[tuple[int, int]] = []
+        self._html = html
+        # NOTE: `getpos()` counts lines by `\n` only (unlike `splitlines()`).
+        self._line_offsets = [0]
+        for line in html.split("\n"):
+            self._line_offsets.append(self._line_offsets[-1] + len(line) + 1)
+        self._start: int | None = None
+        self._depth = 0
+
+    @property
+    def unclosed(self) -> bool:
+        return self._start is not None
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag != "section":
+            return
+
+        if self._start is not None:
+            self._depth += 1
+            return
+
+        classes = (dict(attrs).get("class") or "").split()
+        if "tw-list" in classes:
+            self._start = self._offset()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "section" or self._start is None:
+            return
+
+        if self._depth > 0:
+            self._depth -= 1
+            return
+
+        end = self._html.index(">", self._offset()) + 1
+        self.spans.append((self._start, end))
+        self._start = None
+
+
+def _extract_tw_list(html: str, option_info: _OptionInfo) -> str | None:
+    parser = _TwListSpanParser(html)
+    parser.feed(html)
+    parser.close()
+    if parser.unclosed:
+        raise RuntimeError("Unclosed round results", option_info)
+
+    if len(parser.spans) == 0:
+        return None
+
+    if len(parser.spans) != 1:
+        raise RuntimeError("Unexpected number of round results", option_info)
+
+    start, end = parser.spans[0]
+    return html[start:end]
+
+
+def _fetch_round_http(
+    session: requests.Session, url: str, option_info: _OptionInfo
+) -> str | None:
+    _debug(f":: Fetching round over HTTP; {option_info.value!r}")
+    response = session.get(url, timeout=_HTTP_TIMEOUT)
+    response.raise_for_status()
+    return _extract_tw_list(response.text, option_info)
+
+
+def _new_driver(headless: bool) -> webdriver.Chrome:
+    if not headless:
+        return webdriver.Chrome()
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(options=options)
 
 
-def _open_event(event: bracket_util.Event) -> webdriver.Chrome:
+def _open_event(
+    driver: webdriver.Chrome, event: bracket_util.Event, base_url: str
+) -> None:
     end_date = event.end_date
     start_date = event.start_date or end_date
     search_inputs = {
@@ -436,8 +631,9 @@ def _open_event(event: bracket_util.Event) -> webdriver.Chrome:
         "endDateYear": str(end_date.year),
     }
 
-    driver = webdriver.Chrome()
-    driver.get("https://www.trackwrestling.com/")
+    # NOTE: Always start from the home page so a long-lived driver can move
+    #       from one event to the next.
+    driver.get(f"{base_url}/")
 
     _main_page_click_events_classic(driver)
     _events_page_search_events(driver)
@@ -454,11 +650,10 @@ def _open_event(event: bracket_util.Event) -> webdriver.Chrome:
     _event_box_change_user_type(driver)
     _event_box_click_enter_event(driver)
 
-    return driver
-
 
-def fetch_tournament_rounds(event: bracket_util.Event) -> dict[str, str]:
-    driver = _open_event(event)
+def _capture_tournament_rounds(
+    driver: webdriver.Chrome, checkpoint: fetch_journal.Checkpoint | None
+) -> dict[str, str]:
     _click_results_sidebar_option(driver)
     _click_round_results_option(driver)
     all_rounds = _all_round_option_values(driver)
@@ -472,11 +667,75 @@ def fetch_tournament_rounds(event: bracket_util.Event) -> dict[str, str]:
         if key in captured_html:
             raise KeyError("Duplicate key", key)
 
-        html = _capture_round_html(driver, option)
+        html = fetch_journal.capture(
+            checkpoint, key, functools.partial(_capture_round_html, driver, option)
+        )
         if html is not None:
             captured_html[key] = html
 
-    driver.quit()
+    return captured_html
+
+
+def _capture_tournament_rounds_http(
+    driver: webdriver.Chrome,
+    max_workers: int,
+    checkpoint: fetch_journal.Checkpoint | None,
+) -> dict[str, str]:
+    """Capture the first round in the browser and the rest over plain HTTP.
+
+    The browser is only needed to establish a valid session (cookies) and to
+    discover the round results URL; every other round is fetched concurrently
+    over a single pooled `requests` session.
+    """
+    _click_results_sidebar_option(driver)
+    _click_round_results_option(driver)
+    all_rounds = [
+        option
+        for option in _all_round_option_values(driver)
+        if not (option.value == "" and option.label == "All Rounds")
+    ]
+
+    keys = [option.label for option in all_rounds]
+    if len(set(keys)) != len(keys):
+        raise KeyError("Duplicate key", keys)
+
+    all_html: dict[str, str | None] = {}
+    pending: list[_OptionInfo] = []
+    for option in all_rounds:
+        if checkpoint is not None and option.label in checkpoint:
+            all_html[option.label] = checkpoint.get(option.label)
+        else:
+            pending.append(option)
+
+    if pending:
+        first_option, *other_options = pending
+        first_capture = _capture_round(driver, first_option)
+        all_html[first_option.label] = first_capture.html
+        if checkpoint is not None:
+            checkpoint.record(first_option.label, first_capture.html)
+
+        urls = [
+            _make_round_url(first_capture.url, first_option, option)
+            for option in other_options
+        ]
+
+        with (
+            _http_session(driver, max_workers) as session,
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            other_html = executor.map(
+                functools.partial(_fetch_round_http, session), urls, other_options
+            )
+            for option, html in zip(other_options, other_html, strict=True):
+                all_html[option.label] = html
+                if checkpoint is not None:
+                    checkpoint.record(option.label, html)
+
+    captured_html: dict[str, str] = {}
+    for key in keys:
+        html = all_html[key]
+        if html is not None:
+            captured_html[key] = html
 
     return captured_html
 
@@ -564,11 +823,22 @@ def _weights_click_next_page(driver: webdriver.Chrome, page_number: int) -> bool
     next_page_exists = len(next_links) == 1
     if next_page_exists:
         next_link = next_links[0]
+        table_hash = selenium_util.content_hash(driver, "table.tw-table")
         next_link.click()
-        time.sleep(0.5)
         predicate = _make_weights_next_page_ready(range_start)
-        WebDriverWait(driver, _WAIT_TIME).until(predicate)
-        time.sleep(0.1)
+        selenium_util.wait_until(
+            driver,
+            predicate,
+            timeout=_WAIT_TIME,
+            label=f"weights page starting at {range_start}",
+        )
+        selenium_util.wait_until_changed(
+            driver,
+            "table.tw-table",
+            table_hash,
+            timeout=_WAIT_TIME,
+            label=f"weights table starting at {range_start}",
+        )
 
     # Switch back to the main page
     driver.switch_to.default_content()
@@ -576,8 +846,9 @@ def _weights_click_next_page(driver: webdriver.Chrome, page_number: int) -> bool
     return next_page_exists
 
 
-def fetch_athlete_weights(event: bracket_util.Event) -> dict[str, str]:
-    driver = _open_event(event)
+def _capture_athlete_weights(
+    driver: webdriver.Chrome, checkpoint: fetch_journal.Checkpoint | None
+) -> dict[str, str]:
     _click_wrestlers_menu_option(driver)
 
     captured_html: dict[str, str] = {}
@@ -588,8 +859,12 @@ def fetch_athlete_weights(event: bracket_util.Event) -> dict[str, str]:
         if not next_page_exists:
             break
 
-        html = _get_weights_table(driver)
         key = f"page-{i}"
+        html = fetch_journal.capture(
+            checkpoint, key, functools.partial(_get_weights_table, driver)
+        )
+        if html is None:
+            raise RuntimeError("Unexpected missing weights page", key)
         captured_html[key] = html
 
         next_page_exists = _weights_click_next_page(driver, i)
@@ -597,8 +872,6 @@ def fetch_athlete_weights(event: bracket_util.Event) -> dict[str, str]:
     if next_page_exists:
         raise RuntimeError("Exited loop without terminating")
 
-    driver.quit()
-
     return captured_html
 
 
@@ -658,7 +931,6 @@ def _capture_weight_html(
         EC.presence_of_element_located((By.ID, "PageFrame"))
     )
     driver.switch_to.frame(iframe)
-    time.sleep(0.05)
 
     # Update <select> for desired option
     _debug(f":: Changing <option>; {option_info.value!r}")
@@ -692,8 +964,9 @@ def _capture_weight_html(
     return tw_list_html
 
 
-def fetch_dual_weights(event: bracket_util.Event) -> dict[str, str]:
-    driver = _open_event(event)
+def _capture_dual_weights(
+    driver: webdriver.Chrome, checkpoint: fetch_journal.Checkpoint | None
+) -> dict[str, str]:
     _click_results_sidebar_option(driver)
     _click_weight_results_option(driver)
     all_weights = _all_weight_option_values(driver)
@@ -707,34 +980,216 @@ def fetch_dual_weights(event: bracket_util.Event) -> dict[str, str]:
         if key in captured_html:
             raise KeyError("Duplicate key", key)
 
-        html = _capture_weight_html(driver, option)
+        html = fetch_journal.capture(
+            checkpoint, key, functools.partial(_capture_weight_html, driver, option)
+        )
         if html is not None:
             captured_html[key] = html
 
-    driver.quit()
-
     return captured_html
 
 
-def parse_tournament_round(
-    html: str, event_name: str, event_date: str
-) -> list[bracket_util.MatchV1]:
-    """Parse a round from a tournament on TrackWrestling.
-
-    These will be of the form:
+class BrowserSession:
+    """A single long-lived browser that visits many events in a row.
 
-        <section class="tw-list">
-          <h1>...</h1>
-          <h2>{BRACKET NAME}</h2>
-          <ul>
-            <li>{MATCH 1 ...}</li>
-            <li>{MATCH 2 ...}</li>
-          </ul>
-          ...
-        </section>
+    Starting Chrome and clicking through to an event is the slowest part of a
+    fetch, so one session should be reused for an entire run. Fetching rounds
+    (or dual weights) and then athlete weights for the same event only enters
+    the event once.
     """
+
+    def __init__(self, *, headless: bool = False, base_url: str = _BASE_URL) -> None:
+        self._headless = headless
+        self._base_url = base_url
+        self._driver: webdriver.Chrome | None = None
+        self._current_event: bracket_util.Event | None = None
+
+    def __enter__(self) -> BrowserSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        driver = self._driver
+        self._driver = None
+        self._current_event = None
+        if driver is not None:
+            driver.quit()
+
+    def _enter_event(self, event: bracket_util.Event) -> webdriver.Chrome:
+        if self._driver is None:
+            self._driver = _new_driver(self._headless)
+
+        self._current_event = None
+        _open_event(self._driver, event, self._base_url)
+        self._current_event = event
+        return self._driver
+
+    @contextlib.contextmanager
+    def _visit(
+        self, event: bracket_util.Event, *, reuse: bool
+    ) -> Iterator[webdriver.Chrome]:
+        try:
+            if reuse and self._driver is not None and self._current_event == event:
+                driver = self._driver
+            else:
+                driver = self._enter_event(event)
+
+            yield driver
+        except WebDriverException:
+            # NOTE: Chrome may have crashed or disconnected, so the next visit
+            #       starts a new driver (quitting this one may fail too).
+            with contextlib.suppress(WebDriverException):
+                self.close()
+            raise
+        except BaseException:
+            # NOTE: The page is in an unknown state, so make sure the next
+            #       fetch starts over from the home page.
+            self._current_event = None
+            raise
+
+    def fetch_tournament_rounds(
+        self,
+        event: bracket_util.Event,
+        *,
+        http: bool = False,
+        checkpoint: fetch_journal.Checkpoint | None = None,
+    ) -> dict[str, str]:
+        with self._visit(event, reuse=False) as driver:
+            if http:
+                return _capture_tournament_rounds_http(
+                    driver, _HTTP_WORKERS, checkpoint
+                )
+
+            return _capture_tournament_rounds(driver, checkpoint)
+
+    def fetch_dual_weights(
+        self,
+        event: bracket_util.Event,
+        *,
+        checkpoint: fetch_journal.Checkpoint | None = None,
+    ) -> dict[str, str]:
+        with self._visit(event, reuse=False) as driver:
+            return _capture_dual_weights(driver, checkpoint)
+
+    def fetch_athlete_weights(
+        self,
+        event: bracket_util.Event,
+        *,
+        checkpoint: fetch_journal.Checkpoint | None = None,
+    ) -> dict[str, str]:
+        with self._visit(event, reuse=True) as driver:
+            captured_html = _capture_athlete_weights(driver, checkpoint)
+
+        # NOTE: Paging through the "Wrestlers" table leaves the event on its
+        #       last page, so this visit can't be reused.
+        self._current_event = None
+        return captured_html
+
+    def fetch_tournament(
+        self, event: bracket_util.Event, *, http: bool = False
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Fetch both rounds and athlete weights in a single visit."""
+        rounds_html = self.fetch_tournament_rounds(event, http=http)
+        weights_html = self.fetch_athlete_weights(event)
+        return rounds_html, weights_html
+
+
+def fetch_tournament_rounds(
+    event: bracket_util.Event,
+    *,
+    headless: bool = False,
+    http: bool = False,
+    checkpoint: fetch_journal.Checkpoint | None = None,
+) -> dict[str, str]:
+    with BrowserSession(headless=headless) as session:
+        return session.fetch_tournament_rounds(event, http=http, checkpoint=checkpoint)
+
+
+def fetch_athlete_weights(
+    event: bracket_util.Event,
+    *,
+    headless: bool = False,
+    checkpoint: fetch_journal.Checkpoint | None = None,
+) -> dict[str, str]:
+    with BrowserSession(headless=headless) as session:
+        return session.fetch_athlete_weights(event, checkpoint=checkpoint)
+
+
+def fetch_dual_weights(
+    event: bracket_util.Event,
+    *,
+    headless: bool = False,
+    checkpoint: fetch_journal.Checkpoint | None = None,
+) -> dict[str, str]:
+    with BrowserSession(headless=headless) as session:
+        return session.fetch_dual_weights(event, checkpoint=checkpoint)
+
+
+def _parse_round_match(
+    match_text: str, bracket: str, event_name: str, event_date: str
+) -> bracket_util.MatchV1 | None:
+    parts = match_text.split(" :: ")
+    if len(parts) != 9:
+        raise RuntimeError("Unexpected match text", match_text, event_name)
+
+    (
+        bout_type,
+        winner_first_name,
+        winner_last_name,
+        winner_team,
+        win_type,
+        loser_first_name,
+        loser_last_name,
+        loser_team,
+        score_summary,
+    ) = parts
+
+    if win_type == "won over":
+        if score_summary != "OTHR1":
+            raise NotImplementedError(match_text)
+        return None
+
+    if win_type == "and":
+        if score_summary != "DFF":  # Double Forfeit
+            raise NotImplementedError(match_text)
+        return None
+
+    if win_type not in _WIN_TYPE_MAP:
+        raise NotImplementedError(match_text, win_type)
+
+    result_type = _WIN_TYPE_MAP[win_type]
+    if result_type is None:
+        return None
+
+    winner = f"{winner_first_name} {winner_last_name}"
+    winner = winner.strip()
+
+    loser = f"{loser_first_name} {loser_last_name}"
+    loser = loser.strip()
+
+    return bracket_util.MatchV1(
+        event_name=event_name,
+        event_date=event_date,
+        bracket=bracket,
+        round_=bout_type,
+        division=bracket_util.classify_bracket(bracket, event_name),
+        winner=winner,
+        winner_team=winner_team,
+        loser=loser,
+        loser_team=loser_team,
+        result=score_summary,
+        result_type=result_type,
+        source="trackwrestling",
+    )
+
+
+def _parse_tournament_round_soup(
+    html: str, event_name: str, event_date: str
+) -> list[bracket_util.MatchV1]:
     round_matches: list[bracket_util.MatchV1] = []
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
 
     all_h2 = soup.find_all("h2")
     all_ul = soup.find_all("ul")
@@ -762,60 +1217,9 @@ def parse_tournament_round(
         all_li = sibling.find_all("li")
         for match_li in all_li:
             match_text = match_li.text.strip()
-            parts = match_text.split(" :: ")
-            if len(parts) != 9:
-                raise RuntimeError("Unexpected match text", match_text, event_name)
-
-            (
-                bout_type,
-                winner_first_name,
-                winner_last_name,
-                winner_team,
-                win_type,
-                loser_first_name,
-                loser_last_name,
-                loser_team,
-                score_summary,
-            ) = parts
-
-            if win_type == "won over":
-                if score_summary != "OTHR1":
-                    raise NotImplementedError(match_text)
-                continue
-
-            if win_type == "and":
-                if score_summary != "DFF":  # Double Forfeit
-                    raise NotImplementedError(match_text)
-                continue
-
-            if win_type not in _WIN_TYPE_MAP:
-                raise NotImplementedError(match_text, win_type)
-
-            result_type = _WIN_TYPE_MAP[win_type]
-            if result_type is None:
-                continue
-
-            winner = f"{winner_first_name} {winner_last_name}"
-            winner = winner.strip()
-
-            loser = f"{loser_first_name} {loser_last_name}"
-            loser = loser.strip()
-
-            match_ = bracket_util.MatchV1(
-                event_name=event_name,
-                event_date=event_date,
-                bracket=bracket,
-                round_=bout_type,
-                division=bracket_util.classify_bracket(bracket, event_name),
-                winner=winner,
-                winner_team=winner_team,
-                loser=loser,
-                loser_team=loser_team,
-                result=score_summary,
-                result_type=result_type,
-                source="trackwrestling",
-            )
-            round_matches.append(match_)
+            match_ = _parse_round_match(match_text, bracket, event_name, event_date)
+            if match_ is not None:
+                round_matches.append(match_)
 
         ul_count += 1
 
@@ -825,6 +1229,145 @@ def parse_tournament_round(
     return round_matches
 
 
+class _RoundListParser(HTMLParser):
+    """Pair each `<h2>` with the `<li>` text in the `<ul>` that follows it.
+
+    This makes a single pass over the HTML and keeps only a stack of open tag
+    names, rather than building the full tree that `bs4` would. The pairing
+    matches `_parse_tournament_round_soup()`: the `<ul>` must be the next
+    sibling element of the `<h2>`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.brackets: list[tuple[str, list[str]]] = []
+        self.h2_count = 0
+        self.ul_count = 0
+        self._open_tags: list[str] = []
+        # NOTE: The text buffers of the elements being captured, i.e. an open
+        #       `<h2>` or the open `<li>` elements in a captured `<ul>`.
+        self._h2_text: list[str] | None = None
+        self._li_texts: list[tuple[int, list[str]]] = []
+        # NOTE: A closed `<h2>` (bracket and depth) waiting for its sibling.
+        self._pending_h2: tuple[str, int] | None = None
+        self._ul_depth: int | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        depth = len(self._open_tags)
+        if self._pending_h2 is not None and self._pending_h2[1] == depth:
+            bracket, _ = self._pending_h2
+            self._pending_h2 = None
+            if tag == "ul":
+                self.brackets.append((bracket, []))
+                self._ul_depth = depth
+            elif tag != "h2":
+                raise RuntimeError("Unexpected sibling of <h2>", tag)
+
+        if tag == "h2":
+            self.h2_count += 1
+            self._h2_text = []
+        elif tag == "ul":
+            self.ul_count += 1
+        elif tag == "li" and self._ul_depth is not None:
+            li_texts = self.brackets[-1][1]
+            li_texts.append("")
+            self._li_texts.append((len(li_texts) - 1, []))
+
+        if tag not in _VOID_ELEMENTS:
+            self._open_tags.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag not in self._open_tags:
+            return
+
+        while self._open_tags:
+            open_tag = self._open_tags.pop()
+            self._close(open_tag)
+            if open_tag == tag:
+                break
+
+        if self._pending_h2 is not None and len(self._open_tags) < self._pending_h2[1]:
+            # NOTE: The parent of the `<h2>` closed, so it has no sibling.
+            self._pending_h2 = None
+
+    def _close(self, tag: str) -> None:
+        depth = len(self._open_tags)
+        if tag == "h2" and self._h2_text is not None:
+            self._pending_h2 = ("".join(self._h2_text).strip(), depth)
+            self._h2_text = None
+        elif tag == "li" and self._li_texts:
+            index, text = self._li_texts.pop()
+            self.brackets[-1][1][index] = "".join(text).strip()
+        elif tag == "ul" and self._ul_depth == depth:
+            self._ul_depth = None
+
+    def handle_data(self, data: str) -> None:
+        if self._h2_text is not None:
+            self._h2_text.append(data)
+        for _, text in self._li_texts:
+            text.append(data)
+
+
+def _parse_tournament_round_stream(
+    html: str, event_name: str, event_date: str
+) -> list[bracket_util.MatchV1]:
+    parser = _RoundListParser()
+    parser.feed(html)
+    parser.close()
+
+    if parser.h2_count < parser.ul_count:
+        raise RuntimeError(
+            "Unexpected HTML structure",
+            event_name,
+            parser.h2_count,
+            parser.ul_count,
+        )
+
+    if len(parser.brackets) != parser.ul_count:
+        raise RuntimeError("Did not discover all <ul>", event_name)
+
+    round_matches: list[bracket_util.MatchV1] = []
+    for bracket, li_texts in parser.brackets:
+        for match_text in li_texts:
+            match_ = _parse_round_match(match_text, bracket, event_name, event_date)
+            if match_ is not None:
+                round_matches.append(match_)
+
+    return round_matches
+
+
+@parse_cache.cached("trackwrestling.parse_tournament_round", parse_cache.MATCHES_CODEC)
+def parse_tournament_round(
+    html: str, event_name: str, event_date: str, *, engine: RoundEngine = "stream"
+) -> list[bracket_util.MatchV1]:
+    """Parse a round from a tournament on TrackWrestling.
+
+    These will be of the form:
+
+        <section class="tw-list">
+          <h1>...</h1>
+          <h2>{BRACKET NAME}</h2>
+          <ul>
+            <li>{MATCH 1 ...}</li>
+            <li>{MATCH 2 ...}</li>
+          </ul>
+          ...
+        </section>
+
+    The `"soup"` engine builds a `bs4` tree and is kept as the reference for
+    the (faster) `"stream"` engine; see `entrypoints.parser_conformance`.
+    """
+    if engine == "soup":
+        return _parse_tournament_round_soup(html, event_name, event_date)
+
+    return _parse_tournament_round_stream(html, event_name, event_date)
+
+
 _DualMatchTuple = tuple[int, str, str, str]
 
 
@@ -882,7 +1425,7 @@ def _extract_dual_weight(
     matches: list[_DualMatchExtracted] = []
     athletes: list[_DualAthlete] = []
 
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
 
     all_li = soup.find_all("li")
     for match_li in all_li:
@@ -909,7 +1452,7 @@ def _extract_dual_weight(
 
 
 def _extract_duals(
-    weights_raw: dict[str, str],
+    weights_raw: Mapping[str, str],
 ) -> tuple[list[_DualMatchExtracted], list[_DualAthlete]]:
     known_matches: set[_DualMatchTuple] = set()
     all_extracted_matches: list[_DualMatchExtracted] = []
@@ -970,8 +1513,9 @@ def _ignore_result(result: str) -> bool:
     return False
 
 
+@parse_cache.cached("trackwrestling.parse_dual_event", parse_cache.MATCHES_CODEC)
 def parse_dual_event(
-    weights_raw: dict[str, str], event_name: str, event_date: str
+    weights_raw: Mapping[str, str], event_name: str, event_date: str
 ) -> list[bracket_util.MatchV1]:
     extracted_matches, extracted_athletes = _extract_duals(weights_raw)
     by_text = {athlete.as_text(): athlete for athlete in extracted_athletes}
@@ -1045,6 +1589,7 @@ def _extract_duals_wrestlers_columns(
     return name_reversed, weight_class, weight_str, team
 
 
+@parse_cache.cached("trackwrestling.parse_athlete_weights", parse_cache.WEIGHTS_CODEC)
 def parse_athlete_weights(
     html: str,
     event_type: Literal["trackwrestling", "trackwrestling_dual"],
@@ -1065,7 +1610,7 @@ def parse_athlete_weights(
         ignored_weigh_ins = []
 
     all_weights: dict[bracket_util.AthleteWeightKey, bracket_util.AthleteWeight] = {}
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
 
     (table,) = soup.find_all("table")
     rows = table.find_all("tr")
@@ -1,19 +1,33 @@
+import contextlib
+import functools
 import os
+import pathlib
 import time
-from collections.abc import Callable
-from typing import Literal
+from collections.abc import Callable, Mapping
+from typing import Any, Literal
 
 import bs4
 import pydantic
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC  # noqa: N812
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 import bracket_util
+import fetch_journal
+import html_util
+import parse_cache
+import selenium_util
 
+_HERE = pathlib.Path(__file__).resolve().parent
 _WAIT_TIME = 3
 _LONG_CONTENT_WAIT_TIME = 15
+_VERBOSE = "VERBOSE" in os.environ
+_COOKIE_JAR_PATH = _HERE / ".usabracketing-cookies.json"
+_HOME_URL = "https://www.usabracketing.com/"
+_LOGIN_URL = "https://www.usabracketing.com/login"
+_EVENTS_URL = "https://www.usabracketing.com/events"
 _ENV_USERNAME = "USA_BRACKETING_USERNAME"
 _ENV_PASSWORD = "USA_BRACKETING_PASSWORD"
 _OPTION_ILLINOIS_VALUE = "14"
@@ -165,6 +179,13 @@ class _ForbidExtra(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(extra="forbid", populate_by_name=True)
 
 
+def _debug(message: str) -> None:
+    if not _VERBOSE:
+        return
+
+    print(message)
+
+
 def _require_env(name: str) -> str:
     value = os.environ.get(name)
     if value is None:
@@ -221,7 +242,86 @@ def _go_to_events(driver: webdriver.Chrome) -> None:
     WebDriverWait(driver, _WAIT_TIME).until(EC.url_contains("usabracketing.com"))
 
     # Now go where you want
-    driver.get("https://www.usabracketing.com/events")
+    driver.get(_EVENTS_URL)
+
+
+class _CookieJar(_ForbidExtra):
+    username: str
+    cookies: list[dict[str, Any]]
+
+
+def _load_cookies(login_info: LoginInfo) -> list[dict[str, Any]] | None:
+    if not _COOKIE_JAR_PATH.exists():
+        return None
+
+    with open(_COOKIE_JAR_PATH, "rb") as file_obj:
+        as_json = file_obj.read()
+
+    cookie_jar = _CookieJar.model_validate_json(as_json)
+    if cookie_jar.username != login_info.username:
+        return None
+
+    now = time.time()
+    cookies = [
+        cookie
+        for cookie in cookie_jar.cookies
+        if cookie.get("expiry") is None or cookie["expiry"] > now
+    ]
+    if not cookies:
+        return None
+
+    return cookies
+
+
+def _save_cookies(driver: webdriver.Chrome, login_info: LoginInfo) -> None:
+    cookie_jar = _CookieJar(username=login_info.username, cookies=driver.get_cookies())
+    as_json = cookie_jar.model_dump_json(indent=2)
+
+    # NOTE: The session cookie is as good as a password, so keep it private.
+    fd = os.open(_COOKIE_JAR_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as file_obj:
+        file_obj.write(as_json)
+        file_obj.write("\n")
+
+
+def _on_login_page(driver: webdriver.Chrome) -> bool:
+    return "/login" in driver.current_url
+
+
+def _restore_login(driver: webdriver.Chrome, login_info: LoginInfo) -> bool:
+    cookies = _load_cookies(login_info)
+    if cookies is None:
+        return False
+
+    # NOTE: Cookies can only be added for the domain currently loaded.
+    driver.get(_HOME_URL)
+    for cookie in cookies:
+        driver.add_cookie(cookie)
+
+    # NOTE: An expired (or revoked) session redirects to the login page. This
+    #       is the only signal available since Selenium can't see a 401.
+    driver.get(_EVENTS_URL)
+    if _on_login_page(driver):
+        _debug(":: Saved USA Bracketing login is no longer valid")
+        driver.delete_all_cookies()
+        return False
+
+    _debug(":: Reusing saved USA Bracketing login")
+    return True
+
+
+def _ensure_logged_in(driver: webdriver.Chrome, login_info: LoginInfo) -> None:
+    """Log in (or reuse a saved login) and land on the events page."""
+    if _restore_login(driver, login_info):
+        return
+
+    driver.get(_LOGIN_URL)
+    _login_website(driver, login_info)
+    WebDriverWait(driver, _LONG_CONTENT_WAIT_TIME).until(
+        lambda driver: not _on_login_page(driver)
+    )
+    _save_cookies(driver, login_info)
+    _go_to_events(driver)
 
 
 def _click_search_events(driver: webdriver.Chrome) -> None:
@@ -335,10 +435,7 @@ def _search_results_click_first(driver: webdriver.Chrome, name: str) -> str:
 
 def open_event(event: bracket_util.Event, login_info: LoginInfo) -> webdriver.Chrome:
     driver = webdriver.Chrome()
-    driver.get("https://www.usabracketing.com/login")
-
-    _login_website(driver, login_info)
-    _go_to_events(driver)
+    _ensure_logged_in(driver, login_info)
     _click_search_events(driver)
     _fill_out_event_search(driver, event)
     _click_search_events_in_form(driver)
@@ -486,7 +583,10 @@ def _capture_round_html(
 
 
 def fetch_tournament_rounds(
-    event: bracket_util.Event, login_info: LoginInfo
+    event: bracket_util.Event,
+    login_info: LoginInfo,
+    *,
+    checkpoint: fetch_journal.Checkpoint | None = None,
 ) -> dict[str, str]:
     driver = open_event(event, login_info)
     _click_results(driver)
@@ -501,7 +601,11 @@ def fetch_tournament_rounds(
         if key in captured_html:
             raise KeyError("Duplicate key", key)
 
-        html = _capture_round_html(driver, option, original_window)
+        html = fetch_journal.capture(
+            checkpoint,
+            key,
+            functools.partial(_capture_round_html, driver, option, original_window),
+        )
         if html is not None:
             captured_html[key] = html
 
@@ -523,8 +627,14 @@ def _show_100_per_page(driver: webdriver.Chrome) -> None:
         )
     )
     select = Select(select_elem)
+    table_hash = selenium_util.content_hash(driver, "table")
     select.select_by_value("100")
-    time.sleep(2.0)
+    # NOTE: Events with fewer wrestlers than the default page size render the
+    #       exact same table after switching to 100 per page.
+    with contextlib.suppress(TimeoutException):
+        selenium_util.wait_until_changed(
+            driver, "table", table_hash, timeout=_WAIT_TIME, label="100 per page"
+        )
 
 
 def _capture_wrestlers_table(driver: webdriver.Chrome) -> str:
@@ -534,7 +644,6 @@ def _capture_wrestlers_table(driver: webdriver.Chrome) -> str:
 
     table = tables[0]
     html = table.get_attribute("outerHTML")
-    time.sleep(2.0)
     return html
 
 
@@ -575,16 +684,31 @@ def _weights_click_next_page(driver: webdriver.Chrome, page_number: int) -> bool
     next_page_exists = len(buttons) == 2
     if next_page_exists:
         button = buttons[0]
+        table_hash = selenium_util.content_hash(driver, "table")
         button.click()
         predicate = _make_weights_next_page_ready(range_start)
-        WebDriverWait(driver, _WAIT_TIME).until(predicate)
-        time.sleep(0.5)
+        selenium_util.wait_until(
+            driver,
+            predicate,
+            timeout=_LONG_CONTENT_WAIT_TIME,
+            label=f"wrestlers page starting at {range_start}",
+        )
+        selenium_util.wait_until_changed(
+            driver,
+            "table",
+            table_hash,
+            timeout=_LONG_CONTENT_WAIT_TIME,
+            label=f"wrestlers table starting at {range_start}",
+        )
 
     return next_page_exists
 
 
 def fetch_athlete_weights(
-    event: bracket_util.Event, login_info: LoginInfo
+    event: bracket_util.Event,
+    login_info: LoginInfo,
+    *,
+    checkpoint: fetch_journal.Checkpoint | None = None,
 ) -> dict[str, str]:
     driver = open_event(event, login_info)
     _navigate_to_wrestlers(driver)
@@ -599,20 +723,15 @@ def fetch_athlete_weights(
         if not next_page_exists:
             break
 
-        time.sleep(5.0)
-        html = _capture_wrestlers_table(driver)
-        loop_count = 4
-        for _ in range(loop_count):
-            if html != previous_html:
-                break
-
-            time.sleep(5.0)
-            html = _capture_wrestlers_table(driver)
-
+        key = f"page-{i}"
+        html = fetch_journal.capture(
+            checkpoint, key, functools.partial(_capture_wrestlers_table, driver)
+        )
+        if html is None:
+            raise RuntimeError("Unexpected missing wrestlers page", key)
         if html == previous_html:
-            raise ValueError("HTML did not change after sleeping", loop_count)
+            raise ValueError("HTML did not change after paging", i)
 
-        key = f"page-{i}"
         captured_html[key] = html
 
         # Prepare for next iteration of loop
@@ -659,14 +778,21 @@ def _all_weight_option_values(driver: webdriver.Chrome) -> list[_OptionInfo]:
 def _capture_weight_html(
     driver: webdriver.Chrome, option_info: _OptionInfo, original_window: str
 ) -> str | None:
-    # Clear old weights and pick round ID
+    return _capture_weights_printout(driver, [option_info], original_window)
+
+
+def _capture_weights_printout(
+    driver: webdriver.Chrome, options: list[_OptionInfo], original_window: str
+) -> str:
+    # Clear old weights and pick weight IDs
     weight_select_outer = WebDriverWait(driver, _WAIT_TIME).until(
         EC.presence_of_element_located((By.ID, "weight_ids"))
     )
     weight_select = Select(weight_select_outer)
     weight_select.deselect_all()
     time.sleep(0.05)
-    weight_select.select_by_value(option_info.value)
+    for option_info in options:
+        weight_select.select_by_value(option_info.value)
     time.sleep(0.05)
 
     # Click "Submit"
@@ -708,15 +834,129 @@ def _capture_weight_html(
     return weight_html
 
 
+def _split_weights_printout(html: str, labels: list[str]) -> dict[str, str]:
+    """Split a printout of several weights into one printout per weight.
+
+    Each weight starts with a title `<div>` (e.g. `Dual Divisional - 103`) and
+    each split printout is wrapped in the same `<div style="font-size:12pt;">`
+    as a printout of that weight on its own.
+    """
+    soup = html_util.make_soup(html)
+    (parent_div,) = soup.find_all("div", style="font-size:12pt;")
+    direct_divs = parent_div.find_all("div", recursive=False)
+
+    grouped_divs: dict[str, list[bs4.Tag]] = {}
+    current_divs: list[bs4.Tag] | None = None
+    for i, div in enumerate(direct_divs):
+        if _get_margin_left_style(div) == _TITLE_MARGIN_LEFT:
+            title = div.text.strip()
+            if title not in labels:
+                raise RuntimeError("Unexpected title", title, labels)
+            if title in grouped_divs:
+                raise RuntimeError("Duplicate title", title)
+
+            current_divs = grouped_divs.setdefault(title, [])
+
+        if current_divs is None:
+            raise RuntimeError("Printout does not start with a title", div, i)
+
+        current_divs.append(div)
+
+    split_html: dict[str, str] = {}
+    for title, divs in grouped_divs.items():
+        inner_html = "".join(str(div) for div in divs)
+        split_html[title] = f'<div style="font-size:12pt;">{inner_html}</div>'
+
+    return split_html
+
+
+def _capture_weights_chunk(
+    driver: webdriver.Chrome,
+    options: list[_OptionInfo],
+    original_window: str,
+    checkpoint: fetch_journal.Checkpoint | None,
+) -> dict[str, str | None]:
+    labels = [option.label for option in options]
+    html = _capture_weights_printout(driver, options, original_window)
+    split_html = _split_weights_printout(html, labels)
+
+    chunk_html: dict[str, str | None] = {}
+    for label in labels:
+        # NOTE: A weight with no bouts may not appear in the printout at all.
+        chunk_html[label] = split_html.get(label)
+        if checkpoint is not None:
+            checkpoint.record(label, chunk_html[label])
+
+    return chunk_html
+
+
+def _capture_dual_weights_batched(
+    driver: webdriver.Chrome,
+    all_weights: list[_OptionInfo],
+    chunk_size: int | None,
+    checkpoint: fetch_journal.Checkpoint | None,
+) -> dict[str, str]:
+    keys = [option.label for option in all_weights]
+    if len(set(keys)) != len(keys):
+        raise KeyError("Duplicate key", keys)
+
+    all_html: dict[str, str | None] = {}
+    pending: list[_OptionInfo] = []
+    for option in all_weights:
+        if checkpoint is not None and option.label in checkpoint:
+            all_html[option.label] = checkpoint.get(option.label)
+        else:
+            pending.append(option)
+
+    if chunk_size is None:
+        chunk_size = max(len(pending), 1)
+
+    original_window = driver.current_window_handle
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start : start + chunk_size]
+        all_html.update(
+            _capture_weights_chunk(driver, chunk, original_window, checkpoint)
+        )
+
+    captured_html: dict[str, str] = {}
+    for key in keys:
+        html = all_html[key]
+        if html is not None:
+            captured_html[key] = html
+
+    return captured_html
+
+
 def fetch_dual_weights(
-    event: bracket_util.Event, login_info: LoginInfo
+    event: bracket_util.Event,
+    login_info: LoginInfo,
+    *,
+    checkpoint: fetch_journal.Checkpoint | None = None,
+    chunk_size: int | None = 1,
 ) -> dict[str, str]:
+    """Fetch the printout for each weight in a dual event.
+
+    With a `chunk_size` other than 1, several weights are selected in the
+    `weight_ids` multi-select and submitted together (all of them at once for
+    `None`). The combined printout is then split back into one printout per
+    weight.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("Invalid chunk size", chunk_size)
+
     driver = open_event(event, login_info)
     _click_results(driver)
     _choose_weight_result_bouts(driver)
     _allow_all(driver)
     all_weights = _all_weight_option_values(driver)
 
+    if chunk_size != 1:
+        captured_html = _capture_dual_weights_batched(
+            driver, all_weights, chunk_size, checkpoint
+        )
+        driver.quit()
+        return captured_html
+
     original_window = driver.current_window_handle
     captured_html: dict[str, str] = {}
     for option in all_weights:
@@ -724,7 +964,11 @@ def fetch_dual_weights(
         if key in captured_html:
             raise KeyError("Duplicate key", key)
 
-        html = _capture_weight_html(driver, option, original_window)
+        html = fetch_journal.capture(
+            checkpoint,
+            key,
+            functools.partial(_capture_weight_html, driver, option, original_window),
+        )
         if html is not None:
             captured_html[key] = html
 
@@ -966,6 +1210,7 @@ def _parse_match_line(
     )
 
 
+@parse_cache.cached("usabracketing.parse_tournament_round", parse_cache.MATCHES_CODEC)
 def parse_tournament_round(
     html: str, event_name: str, event_date: str
 ) -> list[bracket_util.MatchV1]:
@@ -990,7 +1235,7 @@ def parse_tournament_round(
     """
     round_matches: list[bracket_util.MatchV1] = []
 
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
     all_p = soup.find_all("p")
 
     division: str | None = None
@@ -1154,7 +1399,7 @@ def _parse_dual_match_line(
 
 
 def _extract_weight(key: str, html: str) -> list[_ParsedDualMatch]:
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
     (parent_div,) = soup.find_all("div", style="font-size:12pt;")
     direct_divs = parent_div.find_all("div", recursive=False)
 
@@ -1226,8 +1471,9 @@ def _division_for_event(event_name: str) -> bracket_util.Division:
     raise NotImplementedError(event_name)
 
 
+@parse_cache.cached("usabracketing.parse_dual_event", parse_cache.MATCHES_CODEC)
 def parse_dual_event(
-    weights_raw: dict[str, str], event_name: str, event_date: str
+    weights_raw: Mapping[str, str], event_name: str, event_date: str
 ) -> list[bracket_util.MatchV1]:
     unresolved_team_matches: list[_ParsedDualMatch] = []
     for key, html in weights_raw.items():
@@ -1341,12 +1587,13 @@ def _parse_team_full(team_full: str) -> str:
     return team.strip()
 
 
+@parse_cache.cached("usabracketing.parse_athlete_weights", parse_cache.WEIGHTS_CODEC)
 def parse_athlete_weights(
     html: str,
 ) -> dict[bracket_util.AthleteWeightKey, bracket_util.AthleteWeight]:
     """Parse weights from "Wrestlers" page from an event on USA Bracketing."""
     all_weights: dict[bracket_util.AthleteWeightKey, bracket_util.AthleteWeight] = {}
-    soup = bs4.BeautifulSoup(html, features="html.parser")
+    soup = html_util.make_soup(html)
 
     (table,) = soup.find_all("table")
     rows = table.find_all("tr")
@@ -0,0 +1,292 @@
+import pathlib
+
+import bracket_util
+import name_normalization
+import raw_store
+import trackwrestling
+import usabracketing
+
+_HERE = pathlib.Path(__file__).resolve().parent
+_IGNORED_KEYS: tuple[tuple[str, str, str, str], ...] = (
+    # NOTE: `Harrison Thaler` also showed up in `BAN - 71-78` with a
+    #       different weight `78.0`
+    (
+        "Wilbur Borrero Classic",
+        "Harrison Thaler",
+        "BAN - 69-77",
+        "Barrington Broncos WC",
+    ),
+    # NOTE: `Greyson Miller` also showed up in `BAN - 71-78` with a
+    #       different weight `78.0`
+    (
+        "Wilbur Borrero Classic",
+        "Greyson Miller",
+        "BAN - 71-78",
+        "McHenry Wrestling Club",
+    ),
+    # NOTE: `Gavin Allen` also showed up in `INT - 55.7-62` with a
+    #       different weight `56.0`
+    ("Wilbur Borrero Classic", "Gavin Allen", "TOT - 51-56", "Woodstock Cyclones"),
+    # NOTE: `Gunnersyn Schulz` also showed up in `B - INT - 80-86` with a
+    #       different higher weight `80.0`
+    (
+        "Champaign Grappler III",
+        "Gunnersyn Schulz",
+        "B - INT - 74-81.9",
+        "El Paso Gridley Youth Wrestling Club",
+    ),
+    # NOTE: `Monteen Gray` also showed up in `B - INT - 80-86` with a
+    #       different higher weight `80.0`
+    ("Champaign Grappler III", "Monteen Gray", "B - INT - 77.9-82.5", "CWC"),
+)
+# NOTE: Some athletes are double bracketed or have a weigh in that does not
+#       make sense, so we ignore some on a per-tournament basis.
+_IGNORED_WEIGH_INS: dict[str, list[bracket_util.AthleteWeight]] = {
+    "Yorkville Fighting Foxes Invitational": [
+        bracket_util.AthleteWeight(
+            name="Parker Paul", group="8U", team="Yorkville Wrestling Club", weight=55.5
+        )
+    ],
+}
+
+
+_MappedAthletes = dict[bracket_util.AthleteWeightKey, bracket_util.AthleteWeight]
+
+
+def _merge_into_results(
+    page: _MappedAthletes, results: _MappedAthletes
+) -> _MappedAthletes:
+    for key, value in page.items():
+        if key in results:
+            if results[key] != value:
+                raise ValueError(
+                    "Unexpected non-matching rows", key, value, results[key]
+                )
+        else:
+            results[key] = value
+
+    return results
+
+
+def _parse_trackwrestling(
+    raw_data_dir: pathlib.Path,
+) -> dict[str, _MappedAthletes]:
+    by_event: dict[str, _MappedAthletes] = {}
+
+    for date_str, name in trackwrestling.TOURNAMENT_EVENTS:
+        parent_dir = raw_data_dir / date_str
+        stem = bracket_util.to_kebab_case(name)
+        filename = f"{stem}.json"
+        path = parent_dir / filename
+
+        fetched_event = raw_store.load_event(path)
+        athlete_weights_raw = fetched_event.weights_html
+
+        event_weights: _MappedAthletes = {}
+
+        keys = sorted(athlete_weights_raw.keys())
+        ignored_weigh_ins = _IGNORED_WEIGH_INS.get(name)
+        for key in keys:
+            html = athlete_weights_raw[key]
+            page_weights = trackwrestling.parse_athlete_weights(
+                html, "trackwrestling", ignored_weigh_ins=ignored_weigh_ins
+            )
+            event_weights = _merge_into_results(page_weights, event_weights)
+
+        by_event[fetched_event.name] = event_weights
+
+    return by_event
+
+
+def _parse_trackwrestling_duals(
+    raw_data_dir: pathlib.Path,
+) -> dict[str, _MappedAthletes]:
+    by_event: dict[str, _MappedAthletes] = {}
+
+    for date_str, name in trackwrestling.DUAL_EVENTS:
+        parent_dir = raw_data_dir / date_str
+        stem = bracket_util.to_kebab_case(name)
+        filename = f"{stem}.json"
+        path = parent_dir / filename
+
+        fetched_event = raw_store.load_event(path)
+        athlete_weights_raw = fetched_event.weights_html
+
+        event_weights: _MappedAthletes = {}
+
+        keys = sorted(athlete_weights_raw.keys())
+        for key in keys:
+            html = athlete_weights_raw[key]
+            page_weights = trackwrestling.parse_athlete_weights(
+                html, "trackwrestling_dual"
+            )
+            event_weights = _merge_into_results(page_weights, event_weights)
+
+        by_event[fetched_event.name] = event_weights
+
+    return by_event
+
+
+def _parse_usabracketing(
+    raw_data_dir: pathlib.Path,
+) -> dict[str, _MappedAthletes]:
+    by_event: dict[str, _MappedAthletes] = {}
+
+    for date_str, name in usabracketing.TOURNAMENT_EVENTS:
+        parent_dir = raw_data_dir / date_str
+        stem = bracket_util.to_kebab_case(name)
+        filename = f"{stem}.json"
+        path = parent_dir / filename
+
+        fetched_event = raw_store.load_event(path)
+        athlete_weights_raw = fetched_event.weights_html
+
+        event_weights: _MappedAthletes = {}
+
+        keys = sorted(athlete_weights_raw.keys())
+        for key in keys:
+            html = athlete_weights_raw[key]
+            page_weights = usabracketing.parse_athlete_weights(html)
+            event_weights = _merge_into_results(page_weights, event_weights)
+
+        by_event[fetched_event.name] = event_weights
+
+    return by_event
+
+
+def _parse_usabracketing_duals(
+    raw_data_dir: pathlib.Path,
+) -> dict[str, _MappedAthletes]:
+    by_event: dict[str, _MappedAthletes] = {}
+
+    for date_str, name in usabracketing.DUAL_EVENTS:
+        parent_dir = raw_data_dir / date_str
+        stem = bracket_util.to_kebab_case(name)
+        filename = f"{stem}.json"
+        path = parent_dir / filename
+
+        fetched_event = raw_store.load_event(path)
+        athlete_weights_raw = fetched_event.weights_html
+
+        event_weights: _MappedAthletes = {}
+
+        keys = sorted(athlete_weights_raw.keys())
+        for key in keys:
+            html = athlete_weights_raw[key]
+            page_weights = usabracketing.parse_athlete_weights(html)
+            event_weights = _merge_into_results(page_weights, event_weights)
+
+        by_event[fetched_event.name] = event_weights
+
+    return by_event
+
+
+def parse_all_weights() -> dict[str, _MappedAthletes]:
+    raw_data_dir = _HERE / "_raw-data"
+    by_event = _parse_trackwrestling(raw_data_dir)
+    by_event.update(_parse_trackwrestling_duals(raw_data_dir))
+    by_event.update(_parse_usabracketing(raw_data_dir))
+    by_event.update(_parse_usabracketing_duals(raw_data_dir))
+    return by_event
+
+
+class _AthleteIndex:
+    """The weights for one event, keyed by normalized athlete name.
+
+    Keys in `_IGNORED_KEYS` are dropped once, when the index is built.
+    """
+
+    def __init__(self, event_name: str, mapped_athletes: _MappedAthletes) -> None:
+        self.mapped_athletes = mapped_athletes
+        self._by_name: dict[str, list[bracket_util.AthleteWeightKey]] = {}
+        for key in mapped_athletes:
+            ignore_check = (event_name,) + key
+            if ignore_check in _IGNORED_KEYS:
+                continue
+
+            key_name, _, _ = key
+            normalized_name = name_normalization.normalize_athlete_name(key_name)
+            self._by_name.setdefault(normalized_name, []).append(key)
+
+    def candidates(self, normalized_name: str) -> list[bracket_util.AthleteWeightKey]:
+        """Keys for `normalized_name`, in the order of `mapped_athletes`."""
+        return self._by_name.get(normalized_name, [])
+
+
+def _lookup_athlete(
+    name: str,
+    bracket: str,
+    team: str,
+    athlete_index: _AthleteIndex,
+) -> float | None:
+    if name == "" and team == "":
+        return None
+
+    team = team.strip()  # Normalize
+    normalized_name = name_normalization.normalize_athlete_name(name)
+    mapped_athletes = athlete_index.mapped_athletes
+
+    matches: list[bracket_util.AthleteWeightKey] = []
+    for key in athlete_index.candidates(normalized_name):
+        _, _, key_team = key
+        if not ((team == "Unattached" and key_team == "") or (key_team == team)):
+            continue
+        matches.append(key)
+
+    if len(matches) > 1:
+        # NOTE: Some kids are cross-bracketed but have the same weight in all
+        #       brackets
+        all_weights = set(mapped_athletes[key].weight for key in matches)
+        if len(all_weights) == 1:
+            return list(all_weights)[0]
+
+    if len(matches) > 1:
+        matches = [
+            (key_name, key_group, key_team)
+            for key_name, key_group, key_team in matches
+            if bracket.startswith(key_group)
+        ]
+
+    if len(matches) > 1:
+        raise RuntimeError(
+            "Unexpected number of matching athletes", name, bracket, team, matches
+        )
+
+    if len(matches) == 0:
+        raise RuntimeError("Could not match athlete", name, bracket, team)
+
+    key = matches[0]
+    athlete_weight = mapped_athletes[key]
+    return athlete_weight.weight
+
+
+def normalize_matches(
+    matches_v3: list[bracket_util.MatchV3],
+) -> list[bracket_util.MatchV4]:
+    by_event = parse_all_weights()
+
+    # NOTE: Each event is indexed the first time one of its matches is seen.
+    indexes: dict[str, _AthleteIndex] = {}
+    matches_v4: list[bracket_util.MatchV4] = []
+    for match_ in matches_v3:
+        athlete_index = indexes.get(match_.event_name)
+        if athlete_index is None:
+            mapped_athletes = by_event.get(match_.event_name)
+            if mapped_athletes is None:
+                raise RuntimeError("Event not found", match_.event_name)
+
+            athlete_index = _AthleteIndex(match_.event_name, mapped_athletes)
+            indexes[match_.event_name] = athlete_index
+
+        winner_weight = _lookup_athlete(
+            match_.winner, match_.bracket, match_.winner_team, athlete_index
+        )
+        loser_weight = _lookup_athlete(
+            match_.loser, match_.bracket, match_.loser_team, athlete_index
+        )
+
+        matches_v4.append(
+            bracket_util.MatchV4.from_v3(match_, winner_weight, loser_weight)
+        )
+
+    return matches_v4